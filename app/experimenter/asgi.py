@@ -0,0 +1,10 @@
+import os
+
+import django
+from channels.routing import get_default_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "experimenter.settings")
+
+django.setup()
+
+application = get_default_application()
@@ -2,13 +2,62 @@ from django.conf.urls import url
 
 from experimenter.experiments.api_views import (
     ExperimentAcceptView,
+    ExperimentBatchView,
+    ExperimentBulkAcceptView,
+    ExperimentBulkRejectView,
+    ExperimentChangesView,
     ExperimentDetailView,
+    ExperimentEventsView,
+    ExperimentExportView,
+    ExperimentImportView,
     ExperimentListView,
+    ExperimentRecipeView,
     ExperimentRejectView,
+    ExperimentStatsView,
 )
 
 
 urlpatterns = [
+    url(
+        r"^accept/$",
+        ExperimentBulkAcceptView.as_view(),
+        name="experiments-api-bulk-accept",
+    ),
+    url(
+        r"^reject/$",
+        ExperimentBulkRejectView.as_view(),
+        name="experiments-api-bulk-reject",
+    ),
+    url(
+        r"^batch/$",
+        ExperimentBatchView.as_view(),
+        name="experiments-api-batch",
+    ),
+    url(
+        r"^changes/$",
+        ExperimentChangesView.as_view(),
+        name="experiments-api-changes",
+    ),
+    url(
+        r"^events/$",
+        ExperimentEventsView.as_view(),
+        name="experiments-api-events",
+    ),
+    url(
+        r"^export/$",
+        ExperimentExportView.as_view(),
+        name="experiments-api-export",
+    ),
+    url(
+        r"^import/$",
+        ExperimentImportView.as_view(),
+        name="experiments-api-import",
+    ),
+    url(
+        r"^stats/$",
+        ExperimentStatsView.as_view(),
+        name="experiments-api-stats",
+    ),
     url(
         r"^(?P<slug>[\w-]+)/accept/$",
         ExperimentAcceptView.as_view(),
@@ -19,6 +68,11 @@ urlpatterns = [
         ExperimentRejectView.as_view(),
         name="experiments-api-reject",
     ),
+    url(
+        r"^(?P<slug>[\w-]+)/recipe/$",
+        ExperimentRecipeView.as_view(),
+        name="experiments-api-recipe",
+    ),
     url(
         r"^(?P<slug>[\w-]+)/$",
         ExperimentDetailView.as_view(),
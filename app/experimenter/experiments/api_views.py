@@ -1,62 +1,847 @@
-from rest_framework.generics import ListAPIView, UpdateAPIView, RetrieveAPIView
+import datetime
+import hashlib
+import json
+from calendar import timegm
+from collections import OrderedDict
+
+from django.db import transaction
+from django.db.models import Count, Max, Q
+from django.http import Http404, HttpResponse, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+)
+from django.utils.http import http_date, quote_etag
+from django_filters import rest_framework as filters
+from rest_framework import serializers
+from rest_framework.exceptions import APIException, ValidationError
+from rest_framework.generics import (
+    GenericAPIView,
+    ListAPIView,
+    RetrieveAPIView,
+    UpdateAPIView,
+)
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
-from experimenter.experiments.models import Experiment, ExperimentChangeLog
-from experimenter.experiments.serializers import ExperimentSerializer
+from experimenter.experiments.cache import get_serialized_experiments
+from experimenter.experiments.events import (
+    get_change_events,
+    publish_experiment_changes,
+)
+from experimenter.experiments.imports import ExperimentImporter
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentChangeLog,
+    ExperimentRecipe,
+)
+from experimenter.experiments.pagination import ExperimentCursorPagination
+from experimenter.experiments.recipes import (
+    NO_RECIPE_STATUSES,
+    RECIPE_STATUSES,
+    delete_recipes,
+    generate_recipes,
+)
+from experimenter.experiments.renderers import EventStreamRenderer
+from experimenter.experiments.serializers import (
+    ExperimentSerializer,
+    ExperimentSlugsSerializer,
+    ExperimentStatusChangeSerializer,
+    ExperimentValuesSerializer,
+)
+from experimenter.experiments.stats import (
+    get_experiment_stats,
+    invalidate_experiment_stats,
+)
+
+
+class ExperimentAPIFilterset(filters.FilterSet):
+    """
+    Filters of the experiments API.
+
+    owner is the email address of the owner.  The date ranges are given as
+    ISO dates in ?<name>_after= and/or ?<name>_before=, both inclusive.
+    start_date is the day the experiments launched or else their proposed
+    start date, end_date and enrollment_end_date follow from it.  The
+    completion flags of the sections and is_ready_to_launch take true or
+    false.  search matches the words of the experiments' text fields and
+    comments, best matches first.  slug__in is a comma separated list of
+    slugs, returned in the same order.
+    """
+
+    slug__in = filters.BaseInFilter(
+        field_name="slug", method="filter_slug__in"
+    )
+    search = filters.CharFilter(method="filter_search")
+    owner = filters.CharFilter(field_name="owner__email")
+    proposed_start_date = filters.DateFromToRangeFilter()
+    start_date = filters.DateFromToRangeFilter(method="filter_start_date")
+    end_date = filters.DateFromToRangeFilter()
+    enrollment_end_date = filters.DateFromToRangeFilter()
+
+    class Meta:
+        model = Experiment
+        fields = (
+            "project__slug",
+            "status",
+            "type",
+            "firefox_channel",
+            "firefox_version",
+            "archived",
+            "owner",
+            "proposed_start_date",
+            "start_date",
+            "end_date",
+            "enrollment_end_date",
+            "completed_population",
+            "completed_objectives",
+            "completed_risks",
+            "completed_required_reviews",
+            "is_ready_to_launch",
+            "search",
+            "slug__in",
+        )
+
+    def filter_slug__in(self, queryset, name, value):
+        return queryset.in_slug_order(value)
+
+    def filter_search(self, queryset, name, value):
+        return queryset.search(value)
+
+    def filter_start_date(self, queryset, name, value):
+        lookups = {}
+
+        if value.start:
+            lookups["gte"] = value.start
+
+        if value.stop:
+            lookups["lte"] = value.stop
+
+        def get_range(field_name):
+            return Q(
+                **{
+                    "{field}__{lookup}".format(
+                        field=field_name, lookup=lookup
+                    ): date
+                    for lookup, date in lookups.items()
+                }
+            )
+
+        return queryset.filter(
+            Q(actual_start_date__isnull=False) & get_range("actual_start_date")
+            | Q(actual_start_date__isnull=True)
+            & get_range("proposed_start_date")
+        )
+
+
+class ConditionalGetMixin(object):
+    """
+    Answer If-None-Match/If-Modified-Since with a 304 before anything is
+    serialized.
+
+    The validators are derived from the row count, the highest id and the
+    latest change time of the requested experiments, which a single
+    aggregate query can produce without loading any of the experiments, and
+    from the negotiated media type so each format has its own ETag.
+
+    Last-Modified is only sent when send_last_modified is set.  The latest
+    change of a filtered list doesn't move forward when an experiment
+    leaves the list, so lists can only be validated by their ETag.
+    """
+
+    send_last_modified = True
+
+    def get_conditional_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    def get_validators(self):
+        summary = self.get_conditional_queryset().aggregate(
+            count=Count("id"),
+            max_id=Max("id"),
+            last_change=Max("last_changed_on"),
+        )
+
+        if not summary["count"]:
+            return None, None
+
+        etag = quote_etag(
+            hashlib.md5(
+                "{count}-{max_id}-{last_change}-{media_type}".format(
+                    media_type=self.request.accepted_media_type, **summary
+                ).encode()
+            ).hexdigest()
+        )
+
+        last_modified = None
+        if self.send_last_modified and summary["last_change"]:
+            last_modified = timegm(summary["last_change"].utctimetuple())
+
+        return etag, last_modified
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators()
+
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        if etag:
+            response["ETag"] = etag
+
+        if last_modified:
+            response["Last-Modified"] = http_date(last_modified)
+
+        patch_vary_headers(response, ("Accept",))
+
+        return response
+
+
+class SparseFieldsMixin(object):
+    """
+    Let clients select the serialized fields with ?fields= and/or ?omit=
+    as comma separated lists of field names.
+
+    The selected fields are pushed down into the queryset so only the
+    columns and relations they need are loaded.
+    """
+
+    fields_query_param = "fields"
+    omit_query_param = "omit"
+
+    def _get_query_param_field_names(self, query_param):
+        value = self.request.query_params.get(query_param, "")
+        field_names = [name.strip() for name in value.split(",")]
+        field_names = [name for name in field_names if name]
+
+        unknown_field_names = set(field_names) - set(
+            self.serializer_class.Meta.fields
+        )
+
+        if unknown_field_names:
+            raise ValidationError(
+                {
+                    query_param: [
+                        "Unknown fields: {fields}".format(
+                            fields=", ".join(sorted(unknown_field_names))
+                        )
+                    ]
+                }
+            )
+
+        return field_names
+
+    def get_serialized_field_names(self):
+        fields = self._get_query_param_field_names(self.fields_query_param)
+        omit = self._get_query_param_field_names(self.omit_query_param)
+
+        return [
+            field_name
+            for field_name in self.serializer_class.Meta.fields
+            if (not fields or field_name in fields) and field_name not in omit
+        ]
+
+    def get_queryset(self):
+        return self.serializer_class.setup_eager_loading(
+            super().get_queryset(), self.get_serialized_field_names()
+        )
+
+    def get_serializer(self, *args, **kwargs):
+        kwargs["field_names"] = self.get_serialized_field_names()
+        return super().get_serializer(*args, **kwargs)
 
 
-class ExperimentListView(ListAPIView):
-    filter_fields = ("project__slug", "status")
+class CachedSerializationMixin(object):
+    """
+    Assemble JSON responses containing every field from the cached
+    serialized JSON of each experiment instead of serializing them on every
+    request.
+
+    Only the ids and latest changes of the requested experiments are
+    queried up front, the experiments themselves are only loaded when their
+    serialization is missing from the cache.
+    """
+
+    def is_json_response(self):
+        return self.request.accepted_renderer.format == "json"
+
+    def is_cached_serialization(self):
+        return self.is_json_response() and (
+            self.get_serialized_field_names()
+            == list(self.serializer_class.Meta.fields)
+        )
+
+    def get_cached_queryset(self, queryset):
+        return queryset.prefetch_related(None).only("id", "last_changed_on")
+
+    def get_json_response(self, content):
+        return HttpResponse(content, content_type="application/json")
+
+
+class ExperimentListView(
+    ConditionalGetMixin,
+    CachedSerializationMixin,
+    SparseFieldsMixin,
+    ListAPIView,
+):
+    filterset_class = ExperimentAPIFilterset
+    pagination_class = ExperimentCursorPagination
+    queryset = Experiment.objects.order_by("id")
+    serializer_class = ExperimentSerializer
+    send_last_modified = False
+
+    def get_uncached_data(self, page, queryset):
+        """
+        Serialize the requested fields of the experiments on page, or of the
+        whole queryset when the list isn't paginated, without the cache.
+        """
+        if page is not None:
+            queryset = queryset.filter(
+                id__in=[experiment.id for experiment in page]
+            )
+
+        data = OrderedDict(
+            ExperimentValuesSerializer(
+                queryset, self.get_serialized_field_names()
+            ).iter_representations()
+        )
+
+        if page is None:
+            return list(data.values())
+
+        return [data[experiment.id] for experiment in page]
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        experiments = self.get_cached_queryset(queryset)
+        page = self.paginate_queryset(experiments)
+        if page is not None:
+            experiments = page
+
+        if not self.is_cached_serialization():
+            data = self.get_uncached_data(page, queryset)
+
+            if page is not None:
+                return self.get_paginated_response(data)
+
+            return Response(data)
+
+        content = (
+            b"["
+            + b",".join(get_serialized_experiments(experiments, queryset))
+            + b"]"
+        )
+
+        if page is None:
+            return self.get_json_response(content)
+
+        content = (
+            b'{"next":'
+            + json.dumps(self.paginator.get_next_link()).encode()
+            + b',"results":'
+            + content
+            + b"}"
+        )
+
+        return self.paginator.add_link_header(self.get_json_response(content))
+
+
+class ExperimentBatchView(ExperimentListView):
+    """
+    Return the experiments with the slugs in the posted {"slugs": [...]}
+    in the same order, for lists of slugs too long for ?slug__in=.
+    """
+
+    http_method_names = ["post", "options"]
+
+    def post(self, request, *args, **kwargs):
+        serializer = ExperimentSlugsSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        self.slugs = serializer.validated_data["slugs"]
+
+        return self.list(request, *args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        return super().filter_queryset(queryset).in_slug_order(self.slugs)
+
+
+class ExperimentExportView(SparseFieldsMixin, GenericAPIView):
+    """
+    Stream all experiments as newline delimited JSON, one experiment per
+    line.
+
+    Experiments are read in chunks ordered by id with the variants of each
+    chunk loaded separately, so memory use does not grow with the total
+    number of experiments.
+    """
+
+    chunk_size = 500
+    filterset_class = ExperimentAPIFilterset
     queryset = Experiment.objects.all()
     serializer_class = ExperimentSerializer
 
+    def get_chunks(self, queryset):
+        field_names = self.get_serialized_field_names()
+        last_id = 0
 
-class ExperimentDetailView(RetrieveAPIView):
-    lookup_field = "slug"
+        while True:
+            chunk = list(
+                ExperimentValuesSerializer(
+                    queryset.filter(id__gt=last_id).order_by("id")[
+                        : self.chunk_size
+                    ],
+                    field_names,
+                ).iter_representations()
+            )
+
+            if not chunk:
+                return
+
+            yield chunk
+
+            last_id, data = chunk[-1]
+
+    def get_lines(self, queryset):
+        renderer = JSONRenderer()
+
+        for chunk in self.get_chunks(queryset):
+            for experiment_id, data in chunk:
+                yield renderer.render(data) + b"\n"
+
+    def get(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+
+        return StreamingHttpResponse(
+            self.get_lines(queryset), content_type="application/x-ndjson"
+        )
+
+
+class ExperimentChangesView(CachedSerializationMixin, GenericAPIView):
+    """
+    Return the experiments which changed after the ISO 8601 timestamp in
+    ?since= so clients can sync incrementally instead of downloading the
+    whole list.
+
+    Experiments which were archived or rejected are returned as tombstones
+    in deleted.  The watermark is the latest change included in the
+    response and should be passed as since on the next call.
+
+    Change times are stamped before their transaction commits, so a change
+    may become visible after a later one was returned.  The watermark is
+    held back by commit_window so those changes are returned by the next
+    call, and the changes within the window are returned again.
+    """
+
+    commit_window = datetime.timedelta(minutes=5)
+    since_query_param = "since"
     queryset = Experiment.objects.all()
     serializer_class = ExperimentSerializer
 
+    def get_since(self):
+        value = self.request.query_params.get(self.since_query_param)
 
-class ExperimentAcceptView(UpdateAPIView):
+        if not value:
+            return None
+
+        try:
+            since = parse_datetime(value)
+        except ValueError:
+            since = None
+
+        if since is None:
+            raise ValidationError(
+                {self.since_query_param: ["Invalid ISO 8601 timestamp"]}
+            )
+
+        if timezone.is_naive(since):
+            since = timezone.make_aware(since, timezone.utc)
+
+        return since
+
+    def get(self, request, *args, **kwargs):
+        since = self.get_since()
+
+        queryset = self.serializer_class.setup_eager_loading(
+            self.get_queryset(), self.serializer_class.Meta.fields
+        )
+
+        changed = self.get_cached_queryset(queryset).only(
+            "id", "slug", "status", "archived", "last_changed_on"
+        )
+        if since is not None:
+            changed = changed.filter(last_changed_on__gt=since)
+
+        experiments = []
+        deleted = []
+        watermark = since
+
+        for experiment in changed.order_by("last_changed_on", "id"):
+            is_deleted = experiment.archived or (
+                experiment.status == experiment.STATUS_REJECTED
+            )
+
+            if is_deleted:
+                deleted.append(experiment.slug)
+            else:
+                experiments.append(experiment)
+
+            if experiment.last_changed_on:
+                watermark = experiment.last_changed_on
+
+        if watermark is not None:
+            watermark = min(watermark, timezone.now() - self.commit_window)
+
+            if since is not None:
+                watermark = max(watermark, since)
+
+        watermark = watermark.isoformat() if watermark else None
+        serialized = get_serialized_experiments(experiments, queryset)
+
+        if not self.is_json_response():
+            return Response(
+                OrderedDict(
+                    [
+                        ("watermark", watermark),
+                        ("deleted", deleted),
+                        (
+                            "experiments",
+                            [json.loads(content) for content in serialized],
+                        ),
+                    ]
+                )
+            )
+
+        content = (
+            b'{"watermark":'
+            + json.dumps(watermark).encode()
+            + b',"deleted":'
+            + json.dumps(deleted).encode()
+            + b',"experiments":['
+            + b",".join(serialized)
+            + b"]}"
+        )
+
+        return self.get_json_response(content)
+
+
+class EventStreamNotServed(APIException):
+    status_code = 501
+    default_detail = "The event stream is only served under ASGI."
+    default_code = "not_implemented"
+
+
+class ExperimentEventsView(GenericAPIView):
+    """
+    Stream experiment status changes as Server-Sent Events as they are
+    created, optionally restricted to the comma separated statuses in
+    ?status= which the experiments moved into.
+
+    The id of each event is the id of its change log entry.  Clients which
+    reconnect with a Last-Event-ID header or ?last_event_id= first receive
+    the changes they missed from the database, then live changes which are
+    fanned out to every stream through Redis pub/sub.  Streams end after
+    max_duration seconds, clients then reconnect.
+
+    The stream itself is served by ExperimentEventsConsumer under ASGI,
+    which uses this view to validate the request and format the events.
+    Under WSGI the view responds with 501 Not Implemented.
+    """
+
+    last_event_id_query_param = "last_event_id"
+    status_query_param = "status"
+    renderer_classes = (EventStreamRenderer, JSONRenderer)
+    keepalive_interval = 15
+    max_duration = 5 * 60
+    replay_limit = 1000
+    retry_interval = 5000
+
+    def get_last_event_id(self):
+        value = self.request.META.get(
+            "HTTP_LAST_EVENT_ID",
+            self.request.query_params.get(self.last_event_id_query_param),
+        )
+
+        if not value:
+            return None
+
+        try:
+            return int(value)
+        except ValueError:
+            raise ValidationError(
+                {self.last_event_id_query_param: ["Invalid event id"]}
+            )
+
+    def get_statuses(self):
+        value = self.request.query_params.get(self.status_query_param, "")
+        statuses = set(status.strip() for status in value.split(","))
+        statuses.discard("")
+
+        unknown_statuses = statuses - set(
+            status for status, label in Experiment.STATUS_CHOICES
+        )
+
+        if unknown_statuses:
+            raise ValidationError(
+                {
+                    self.status_query_param: [
+                        "Unknown statuses: {statuses}".format(
+                            statuses=", ".join(sorted(unknown_statuses))
+                        )
+                    ]
+                }
+            )
+
+        return statuses
+
+    def format_retry(self):
+        return "retry: {retry}\n\n".format(retry=self.retry_interval).encode()
+
+    def format_event(self, event):
+        return "id: {id}\nevent: change\ndata: {data}\n\n".format(
+            id=event["id"], data=json.dumps(event)
+        ).encode()
+
+    def get_missed_events(self, last_event_id, statuses):
+        changes = ExperimentChangeLog.objects.filter(id__gt=last_event_id)
+
+        if statuses:
+            changes = changes.filter(new_status__in=statuses)
+
+        change_ids = changes.order_by("id").values_list("id", flat=True)
+
+        return get_change_events(change_ids[: self.replay_limit])
+
+    def get(self, request, *args, **kwargs):
+        # An open stream would hold a WSGI worker for up to max_duration
+        raise EventStreamNotServed()
+
+
+class ExperimentStatsView(GenericAPIView):
+    """
+    Return the experiment counts by status, type, channel, version, project
+    and owner, and the experiments launched and completed per week.
+    """
+
+    def get(self, request, *args, **kwargs):
+        return Response(get_experiment_stats())
+
+
+class ExperimentDetailView(
+    ConditionalGetMixin,
+    CachedSerializationMixin,
+    SparseFieldsMixin,
+    RetrieveAPIView,
+):
     lookup_field = "slug"
-    queryset = Experiment.objects.filter(status=Experiment.STATUS_REVIEW)
+    queryset = Experiment.objects.all()
+    serializer_class = ExperimentSerializer
 
-    def update(self, request, *args, **kwargs):
-        experiment = self.get_object()
+    def retrieve(self, request, *args, **kwargs):
+        if not self.is_cached_serialization():
+            return super().retrieve(request, *args, **kwargs)
 
-        old_status = experiment.status
+        queryset = self.filter_queryset(self.get_queryset())
+
+        experiment = get_object_or_404(
+            self.get_cached_queryset(queryset),
+            **{self.lookup_field: self.kwargs[self.lookup_field]}
+        )
+        self.check_object_permissions(request, experiment)
 
-        experiment.status = experiment.STATUS_ACCEPTED
-        experiment.save()
+        content, = get_serialized_experiments([experiment], queryset)
 
-        ExperimentChangeLog.objects.create(
-            experiment=experiment,
-            old_status=old_status,
-            new_status=experiment.status,
-            changed_by=self.request.user,
+        return self.get_json_response(content)
+
+    def get_conditional_queryset(self):
+        return (
+            super()
+            .get_conditional_queryset()
+            .filter(**{self.lookup_field: self.kwargs[self.lookup_field]})
         )
 
-        return Response()
 
+class ExperimentRecipeView(GenericAPIView):
+    """
+    Serve the Normandy recipe which was generated when the experiment was
+    shipped or accepted.
+
+    The stored recipe is returned as is with a strong ETag, so clients can
+    cache it and revalidate it with a conditional request.
+    """
+
+    cache_max_age = 5 * 60
+    queryset = ExperimentRecipe.objects.all()
+
+    def get(self, request, *args, **kwargs):
+        recipe = get_object_or_404(
+            self.get_queryset().only("content", "etag", "generated_on"),
+            experiment__slug=self.kwargs["slug"],
+        )
+
+        last_modified = timegm(recipe.generated_on.utctimetuple())
+
+        response = get_conditional_response(
+            request, etag=recipe.etag, last_modified=last_modified
+        )
+
+        if response is None:
+            response = HttpResponse(
+                recipe.content, content_type="application/json"
+            )
+
+        response["ETag"] = recipe.etag
+        response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, public=True, max_age=self.cache_max_age)
+
+        return response
+
+
+class ExperimentStatusUpdateView(UpdateAPIView):
+    """
+    Move one experiment from Review to new_status.
+
+    The transition is a single compare-and-set UPDATE of the status column,
+    so of two concurrent requests for the same experiment only one can
+    succeed, and the other receives a 404 as the experiment is no longer
+    in Review.
+    """
 
-class ExperimentRejectView(UpdateAPIView):
     lookup_field = "slug"
-    queryset = Experiment.objects.filter(status=Experiment.STATUS_REVIEW)
+    old_status = Experiment.STATUS_REVIEW
+    new_status = None
+
+    def get_message(self):
+        return None
 
     def update(self, request, *args, **kwargs):
-        experiment = self.get_object()
+        with transaction.atomic():
+            transitioned = Experiment.objects.transition_status(
+                [self.kwargs[self.lookup_field]],
+                self.old_status,
+                self.new_status,
+            )
 
-        old_status = experiment.status
+            if not transitioned:
+                raise Http404
 
-        experiment.status = experiment.STATUS_REJECTED
-        experiment.save()
+            [(experiment_id, slug)] = transitioned
 
-        ExperimentChangeLog.objects.create(
-            experiment=experiment,
-            old_status=old_status,
-            new_status=experiment.status,
-            changed_by=self.request.user,
-            message=self.request.data.get("message", ""),
-        )
+            ExperimentChangeLog.objects.create(
+                experiment_id=experiment_id,
+                old_status=self.old_status,
+                new_status=self.new_status,
+                changed_by=self.request.user,
+                message=self.get_message(),
+            )
 
         return Response()
+
+
+class ExperimentAcceptView(ExperimentStatusUpdateView):
+    new_status = Experiment.STATUS_ACCEPTED
+
+
+class ExperimentRejectView(ExperimentStatusUpdateView):
+    new_status = Experiment.STATUS_REJECTED
+
+    def get_message(self):
+        return self.request.data.get("message", "")
+
+
+class ExperimentBulkStatusUpdateView(GenericAPIView):
+    """
+    Move many experiments from Review to new_status at once.
+
+    The body is a list of {"slug": ..., "message": ...} objects.  All of the
+    experiments are transitioned with one UPDATE and their change logs are
+    written with one INSERT inside a single transaction.  The response
+    reports for each slug whether its experiment was transitioned.
+    """
+
+    old_status = Experiment.STATUS_REVIEW
+    new_status = None
+    serializer_class = ExperimentStatusChangeSerializer
+
+    def patch(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        messages = OrderedDict(
+            (change["slug"], change.get("message", ""))
+            for change in serializer.validated_data
+        )
+
+        with transaction.atomic():
+            transitioned = Experiment.objects.transition_status(
+                messages.keys(), self.old_status, self.new_status
+            )
+
+            changes = ExperimentChangeLog.objects.bulk_create(
+                [
+                    ExperimentChangeLog(
+                        experiment_id=experiment_id,
+                        old_status=self.old_status,
+                        new_status=self.new_status,
+                        changed_by=request.user,
+                        message=messages[slug],
+                    )
+                    for experiment_id, slug in transitioned
+                ]
+            )
+
+            # bulk_create doesn't send post_save, so update the change times,
+            # publish the changes, generate or delete the recipes and
+            # invalidate the stats here
+            experiment_ids = [
+                experiment_id for experiment_id, slug in transitioned
+            ]
+            Experiment.objects.filter(id__in=experiment_ids).update_dates()
+            publish_experiment_changes(change.id for change in changes)
+            invalidate_experiment_stats()
+
+            if self.new_status in RECIPE_STATUSES:
+                generate_recipes(experiment_ids)
+            elif self.new_status in NO_RECIPE_STATUSES:
+                delete_recipes(experiment_ids)
+
+        transitioned_slugs = set(slug for experiment_id, slug in transitioned)
+
+        return Response(
+            [
+                {"slug": slug, "success": slug in transitioned_slugs}
+                for slug in messages
+            ]
+        )
+
+
+class ExperimentBulkAcceptView(ExperimentBulkStatusUpdateView):
+    new_status = Experiment.STATUS_ACCEPTED
+
+
+class ExperimentBulkRejectView(ExperimentBulkStatusUpdateView):
+    new_status = Experiment.STATUS_REJECTED
+
+
+class ExperimentImportView(GenericAPIView):
+    """
+    Create experiments from a list of rows of form data, see
+    ExperimentImporter.
+
+    The response reports for each row whether it was imported, with the
+    slug of the experiment or the validation errors of the row.
+    """
+
+    rows_field = serializers.ListField(
+        child=serializers.DictField(), min_length=1, max_length=1000
+    )
+
+    def post(self, request, *args, **kwargs):
+        rows = self.rows_field.run_validation(request.data)
+        return Response(ExperimentImporter(request.user).run(rows))
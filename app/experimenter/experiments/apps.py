@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class ExperimentsConfig(AppConfig):
+    name = "experimenter.experiments"
+
+    def ready(self):
+        import experimenter.experiments.signals  # noqa
@@ -0,0 +1,77 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Max
+from rest_framework.renderers import JSONRenderer
+
+from experimenter.experiments.models import ExperimentChangeLog
+from experimenter.experiments.serializers import ExperimentValuesSerializer
+
+
+SERIALIZED_EXPERIMENT_KEY = "experiments:serialized:{id}:{version}"
+SERIALIZED_EXPERIMENT_TIMEOUT = 60 * 60 * 24
+
+
+def get_serialized_experiment_key(experiment_id, last_changed_on):
+    version = last_changed_on.isoformat() if last_changed_on else "none"
+    return SERIALIZED_EXPERIMENT_KEY.format(id=experiment_id, version=version)
+
+
+def get_serialized_experiments(experiments, queryset):
+    """
+    Return the serialized JSON bytes of each experiment in experiments.
+
+    The experiments only need their id and last_changed_on loaded.  Any
+    experiment missing from the cache is loaded from queryset, serialized
+    and stored for the next request.
+    """
+    keys = [
+        get_serialized_experiment_key(
+            experiment.id, experiment.last_changed_on
+        )
+        for experiment in experiments
+    ]
+
+    serialized = cache.get_many(keys)
+
+    missing = {
+        experiment.id: key
+        for experiment, key in zip(experiments, keys)
+        if key not in serialized
+    }
+
+    if missing:
+        renderer = JSONRenderer()
+        serializer = ExperimentValuesSerializer(
+            queryset.filter(id__in=missing.keys())
+        )
+
+        for experiment_id, data in serializer.iter_representations():
+            serialized[missing[experiment_id]] = renderer.render(data)
+
+        cache.set_many(
+            {
+                key: serialized[key]
+                for key in missing.values()
+                if key in serialized
+            },
+            SERIALIZED_EXPERIMENT_TIMEOUT,
+        )
+
+    return [serialized[key] for key in keys if key in serialized]
+
+
+def delete_serialized_experiment(experiment_id):
+    last_changed_on = ExperimentChangeLog.objects.filter(
+        experiment_id=experiment_id
+    ).aggregate(last_changed_on=Max("changed_on"))["last_changed_on"]
+
+    cache.delete(get_serialized_experiment_key(experiment_id, last_changed_on))
+
+
+def invalidate_serialized_experiment(experiment_id):
+    """
+    Delete the cached serialization of the experiment once the current
+    transaction commits, so a concurrent request can't cache the
+    experiment as it was before the commit under the same key.
+    """
+    transaction.on_commit(lambda: delete_serialized_experiment(experiment_id))
@@ -6,6 +6,20 @@ class ExperimentConstants(object):
     # Model Constants
     MAX_DURATION = 1000
 
+    # Slugs of the experiment collection URLs, which would shadow the URLs
+    # of an experiment with the same slug
+    RESERVED_SLUGS = (
+        "accept",
+        "batch",
+        "changes",
+        "events",
+        "export",
+        "import",
+        "new",
+        "reject",
+        "stats",
+    )
+
     # Type stuff
     TYPE_PREF = "pref"
     TYPE_ADDON = "addon"
@@ -52,6 +66,9 @@ class ExperimentConstants(object):
         STATUS_REJECTED: [],
     }
 
+    # The change log transition which launches an experiment
+    LAUNCH_CHANGE = {"old_status": STATUS_ACCEPTED, "new_status": STATUS_LIVE}
+
     # Version stuff
     VERSION_CHOICES = (
         (None, "Firefox Version"),
@@ -0,0 +1,205 @@
+import asyncio
+import json
+import logging
+import time
+
+import aioredis
+from channels.db import database_sync_to_async
+from channels.http import AsgiHandler, AsgiRequest
+from corsheaders.middleware import CorsMiddleware
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.urls import resolve
+
+from experimenter.experiments.api_views import ExperimentEventsView
+from experimenter.experiments.events import EXPERIMENT_CHANGES_CHANNEL
+
+
+class ChangeEventHub(object):
+    """
+    Fan out the experiment change events published to Redis to every event
+    stream served by this process from a single subscription.
+
+    The subscription is opened when the first stream subscribes and is
+    reopened by the next stream to subscribe if the connection is lost.
+    """
+
+    def __init__(self):
+        self.queues = set()
+        self.listener = None
+
+    async def listen(self):
+        try:
+            connection = await aioredis.create_redis(
+                (settings.REDIS_HOST, settings.REDIS_PORT),
+                db=settings.REDIS_DB,
+            )
+
+            try:
+                channel, = await connection.subscribe(
+                    EXPERIMENT_CHANGES_CHANNEL
+                )
+
+                while await channel.wait_message():
+                    event = json.loads((await channel.get()).decode())
+
+                    for queue in self.queues:
+                        queue.put_nowait(event)
+            finally:
+                connection.close()
+        except (OSError, aioredis.RedisError):
+            logging.exception("Error receiving experiment change events")
+        finally:
+            self.listener = None
+
+    def subscribe(self):
+        queue = asyncio.Queue()
+        self.queues.add(queue)
+
+        if self.listener is None:
+            self.listener = asyncio.ensure_future(self.listen())
+
+        return queue
+
+    def unsubscribe(self, queue):
+        self.queues.discard(queue)
+
+
+change_event_hub = ChangeEventHub()
+
+
+class ExperimentEventsConsumer(object):
+    """
+    ASGI application serving the Server-Sent Events stream of
+    ExperimentEventsView without holding a worker thread for the lifetime
+    of each connection.
+
+    The request is authenticated, throttled and validated by
+    ExperimentEventsView and the missed events are replayed from the
+    database in worker threads, while live events are received from the
+    process wide ChangeEventHub, so an open stream only costs a coroutine.
+    The stream stops as soon as the client disconnects.
+
+    Django's middleware doesn't run for this consumer, so its responses are
+    passed through CorsMiddleware to send the same CORS headers as every
+    other API response.
+    """
+
+    hub = change_event_hub
+    view_class = ExperimentEventsView
+    cors_middleware = CorsMiddleware()
+
+    def __init__(self, scope):
+        self.scope = scope
+
+    async def __call__(self, receive, send):
+        tasks = [
+            asyncio.ensure_future(self.wait_for_disconnect(receive)),
+            asyncio.ensure_future(self.stream(send)),
+        ]
+
+        done, pending = await asyncio.wait(
+            tasks, return_when=asyncio.FIRST_COMPLETED
+        )
+
+        for task in pending:
+            task.cancel()
+
+        for task in done:
+            task.result()
+
+    async def wait_for_disconnect(self, receive):
+        while (await receive())["type"] != "http.disconnect":
+            pass
+
+    def initialize_view(self):
+        """
+        Run the view's authentication, throttling and parameter checks,
+        returning the error response if any of them fail.
+        """
+        self.request = request = AsgiRequest(self.scope, b"")
+        request.resolver_match = resolve(request.path_info)
+        # The events stream is exempt from OpenIDC authentication
+        request.user = AnonymousUser()
+
+        self.view = view = self.view_class()
+        view.args = ()
+        view.kwargs = {}
+        view.request = view.initialize_request(request)
+        view.headers = view.default_response_headers
+
+        try:
+            view.initial(view.request)
+            self.last_event_id = view.get_last_event_id()
+            self.statuses = view.get_statuses()
+        except Exception as exc:
+            response = view.finalize_response(
+                view.request, view.handle_exception(exc)
+            )
+            return response.render()
+
+    def encode_response(self, response):
+        response = self.cors_middleware.process_response(
+            self.request, response
+        )
+        return AsgiHandler.encode_response(response)
+
+    async def send_body(self, send, body):
+        await send(
+            {"type": "http.response.body", "body": body, "more_body": True}
+        )
+
+    async def stream(self, send):
+        response = await database_sync_to_async(self.initialize_view)()
+
+        if response is not None:
+            for message in self.encode_response(response):
+                await send(message)
+            return
+
+        view = self.view
+        queue = self.hub.subscribe()
+
+        try:
+            response = HttpResponse(content_type="text/event-stream")
+            response["Cache-Control"] = "no-cache"
+            response["X-Accel-Buffering"] = "no"
+            # Only the start of the response, the body is sent as a stream
+            await send(next(self.encode_response(response)))
+            await self.send_body(send, view.format_retry())
+
+            # Live events are already being queued while the missed events
+            # are replayed, so skip any which were replayed
+            replayed_ids = set()
+            if self.last_event_id is not None:
+                events = await database_sync_to_async(view.get_missed_events)(
+                    self.last_event_id, self.statuses
+                )
+
+                for event in events:
+                    replayed_ids.add(event["id"])
+                    await self.send_body(send, view.format_event(event))
+
+            deadline = time.monotonic() + view.max_duration
+
+            while time.monotonic() < deadline:
+                try:
+                    event = await asyncio.wait_for(
+                        queue.get(), view.keepalive_interval
+                    )
+                except asyncio.TimeoutError:
+                    await self.send_body(send, b": keepalive\n\n")
+                    continue
+
+                if event["id"] in replayed_ids:
+                    continue
+
+                if self.statuses and event["new_status"] not in self.statuses:
+                    continue
+
+                await self.send_body(send, view.format_event(event))
+
+            await send({"type": "http.response.body", "body": b""})
+        finally:
+            self.hub.unsubscribe(queue)
@@ -0,0 +1,62 @@
+import json
+import logging
+from functools import lru_cache
+
+import redis
+from django.conf import settings
+from django.db import transaction
+
+from experimenter.experiments.models import ExperimentChangeLog
+
+
+EXPERIMENT_CHANGES_CHANNEL = "experiments:changes"
+
+
+@lru_cache(maxsize=None)
+def get_redis():
+    return redis.StrictRedis(
+        host=settings.REDIS_HOST,
+        port=settings.REDIS_PORT,
+        db=settings.REDIS_DB,
+    )
+
+
+def get_change_event(change):
+    return {
+        "id": change.id,
+        "slug": change.experiment.slug,
+        "old_status": change.old_status,
+        "new_status": change.new_status,
+        "changed_on": change.changed_on.isoformat(),
+    }
+
+
+def get_change_events(change_ids):
+    changes = (
+        ExperimentChangeLog.objects.filter(id__in=change_ids)
+        .select_related("experiment")
+        .order_by("id")
+    )
+    return [get_change_event(change) for change in changes]
+
+
+def publish_change_events(change_ids):
+    try:
+        pipeline = get_redis().pipeline(transaction=False)
+
+        for event in get_change_events(change_ids):
+            pipeline.publish(EXPERIMENT_CHANGES_CHANNEL, json.dumps(event))
+
+        pipeline.execute()
+    except redis.RedisError:
+        logging.exception("Error publishing experiment change events")
+
+
+def publish_experiment_changes(change_ids):
+    """
+    Publish the change log entries with the given ids to Redis once the
+    current transaction commits, so subscribers never see changes which
+    were rolled back.
+    """
+    change_ids = list(change_ids)
+    transaction.on_commit(lambda: publish_change_events(change_ids))
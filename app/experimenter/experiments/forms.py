@@ -5,6 +5,7 @@ from django import forms
 from django.contrib.auth import get_user_model
 from django.forms import BaseInlineFormSet
 from django.forms import inlineformset_factory
+from django.utils.text import slugify
 
 from experimenter.experiments.constants import ExperimentConstants
 from experimenter.experiments import tasks
@@ -153,6 +154,16 @@ class ExperimentOverviewForm(
             "proposed_enrollment",
         ]
 
+    def clean_name(self):
+        name = super().clean_name()
+
+        if slugify(name) in Experiment.RESERVED_SLUGS:
+            raise forms.ValidationError(
+                "This name is reserved, please choose another."
+            )
+
+        return name
+
     def clean_proposed_start_date(self):
         start_date = self.cleaned_data["proposed_start_date"]
 
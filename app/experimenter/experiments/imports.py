@@ -0,0 +1,251 @@
+import json
+import logging
+from collections import OrderedDict
+
+from django.contrib.auth import get_user_model
+from django.db import DatabaseError, transaction
+from django.utils import timezone
+
+from experimenter.experiments.events import publish_experiment_changes
+from experimenter.experiments.forms import (
+    ExperimentOverviewForm,
+    ExperimentVariantsAddonForm,
+    ExperimentVariantsPrefForm,
+)
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentChangeLog,
+    ExperimentVariant,
+)
+from experimenter.experiments.stats import invalidate_experiment_stats
+
+
+IMPORT_BATCH_SIZE = 500
+IMPORT_CHANGELOG_MESSAGE = "Imported"
+
+
+class ExperimentImporter(object):
+    """
+    Create experiments from rows of form data.
+
+    Each row holds the fields of ExperimentOverviewForm and of the variants
+    form for its type, with the owner given by email and the branches as a
+    list of {"name", "description", "ratio", "is_control", "value"} in
+    variants.  Every row is validated with those forms, and the valid rows
+    are inserted with their variants and an initial change log entry using
+    bulk_create in batches of batch_size, one transaction per batch.
+
+    run() returns the outcome of each row in order, with the errors of the
+    rows which were not imported.  A row is only reported as imported once
+    its batch committed, the rows of a batch which failed to insert, e.g.
+    because an experiment with the same name was created concurrently, are
+    reported as failed.
+    """
+
+    VARIANT_FIELDS = ("name", "description", "ratio", "is_control", "value")
+    DUPLICATE_NAME_ERROR = "This name is already in use."
+    MISSING_VARIANTS_ERROR = "At least one branch is required."
+    BATCH_ERROR = "This row's batch could not be saved, please retry."
+
+    def __init__(self, user, batch_size=IMPORT_BATCH_SIZE):
+        self.user = user
+        self.batch_size = batch_size
+
+    def get_owner_ids(self, rows):
+        emails = set(row.get("owner") for row in rows if row.get("owner"))
+
+        return dict(
+            get_user_model()
+            .objects.filter(email__in=emails)
+            .values_list("email", "id")
+        )
+
+    def get_variants_form_class(self, row):
+        if row.get("type") == Experiment.TYPE_ADDON:
+            return ExperimentVariantsAddonForm
+
+        return ExperimentVariantsPrefForm
+
+    def get_variants_data(self, row):
+        variants = row.get("variants") or []
+        prefix = "variants"
+
+        data = dict(row)
+        data.update(
+            {
+                "{prefix}-TOTAL_FORMS".format(prefix=prefix): len(variants),
+                "{prefix}-INITIAL_FORMS".format(prefix=prefix): 0,
+            }
+        )
+
+        for i, variant in enumerate(variants):
+            for field in self.VARIANT_FIELDS:
+                value = variant.get(field)
+
+                if field == "value" and not isinstance(
+                    value, (str, type(None))
+                ):
+                    value = json.dumps(value)
+
+                data[
+                    "{prefix}-{i}-{field}".format(
+                        prefix=prefix, i=i, field=field
+                    )
+                ] = value
+
+        return data
+
+    def get_errors(self, overview_form, variants_form):
+        errors = OrderedDict()
+        errors.update(overview_form.errors)
+        errors.update(variants_form.errors)
+
+        formset = variants_form.variants_formset
+        formset.is_valid()
+
+        if any(formset.errors):
+            errors["variants"] = formset.errors
+
+        return errors
+
+    def validate(self, row):
+        """
+        Return the unsaved experiment and variants of row, and the errors
+        which prevent it from being imported.
+        """
+        experiment = Experiment()
+
+        overview_form = ExperimentOverviewForm(
+            request=None, data=row, instance=experiment
+        )
+        variants_form = self.get_variants_form_class(row)(
+            request=None, data=self.get_variants_data(row), instance=experiment
+        )
+
+        variants = [form.instance for form in variants_form.variants_formset]
+        is_valid = overview_form.is_valid() and variants_form.is_valid()
+
+        if is_valid and variants:
+            return experiment, variants, {}
+
+        errors = self.get_errors(overview_form, variants_form)
+
+        if not variants:
+            errors["variants"] = [self.MISSING_VARIANTS_ERROR]
+
+        return None, [], errors
+
+    def create(self, experiments):
+        """
+        Insert the (experiment, variants) pairs with their change logs.
+        """
+        # bulk_create doesn't send pre_save either, so set the dates and
+        # change times here
+        changed_on = timezone.now()
+
+        for experiment, variants in experiments:
+            experiment.set_dates()
+            experiment.last_changed_on = changed_on
+
+        with transaction.atomic():
+            Experiment.objects.bulk_create(
+                [experiment for experiment, variants in experiments]
+            )
+
+            for experiment, variants in experiments:
+                for variant in variants:
+                    variant.experiment = experiment
+
+            ExperimentVariant.objects.bulk_create(
+                [
+                    variant
+                    for experiment, variants in experiments
+                    for variant in variants
+                ]
+            )
+
+            changes = ExperimentChangeLog.objects.bulk_create(
+                [
+                    ExperimentChangeLog(
+                        experiment=experiment,
+                        changed_by=self.user,
+                        old_status=None,
+                        new_status=experiment.status,
+                        message=IMPORT_CHANGELOG_MESSAGE,
+                        changed_on=changed_on,
+                    )
+                    for experiment, variants in experiments
+                ]
+            )
+
+            # bulk_create doesn't send post_save, so maintain the search
+            # vectors, completion flags and stats and publish the changes
+            # here
+            created = Experiment.objects.filter(
+                id__in=[experiment.id for experiment, variants in experiments]
+            )
+            created.update_search_vectors()
+            created.update_completion()
+            invalidate_experiment_stats()
+            publish_experiment_changes(change.id for change in changes)
+
+    def get_result(self, i, errors=None, slug=None):
+        if errors:
+            return OrderedDict(
+                [("row", i), ("success", False), ("errors", errors)]
+            )
+
+        return OrderedDict([("row", i), ("success", True), ("slug", slug)])
+
+    def create_batch(self, batch, results):
+        """
+        Insert the batch of (row, experiment, variants) and record the
+        outcome of its rows in results.
+        """
+        try:
+            self.create(
+                [(experiment, variants) for i, experiment, variants in batch]
+            )
+        except DatabaseError:
+            logging.exception("Error importing experiments")
+
+            for i, experiment, variants in batch:
+                results[i] = self.get_result(
+                    i, errors={"__all__": [self.BATCH_ERROR]}
+                )
+            return
+
+        for i, experiment, variants in batch:
+            results[i] = self.get_result(i, slug=experiment.slug)
+
+    def run(self, rows):
+        owner_ids = self.get_owner_ids(rows)
+        slugs = set()
+        results = [None] * len(rows)
+        batch = []
+
+        for i, row in enumerate(rows):
+            row = dict(row)
+            row["owner"] = owner_ids.get(row.get("owner"), row.get("owner"))
+
+            experiment, variants, errors = self.validate(row)
+
+            if experiment is not None and experiment.slug in slugs:
+                experiment = None
+                errors = {"name": [self.DUPLICATE_NAME_ERROR]}
+
+            if experiment is None:
+                results[i] = self.get_result(i, errors=errors)
+                continue
+
+            slugs.add(experiment.slug)
+            batch.append((i, experiment, variants))
+
+            if len(batch) == self.batch_size:
+                self.create_batch(batch, results)
+                batch = []
+
+        if batch:
+            self.create_batch(batch, results)
+
+        return results
@@ -0,0 +1,166 @@
+import datetime
+import decimal
+import json
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentChangeLog,
+    ExperimentVariant,
+)
+from experimenter.experiments.serializers import (
+    ExperimentSerializer,
+    ExperimentValuesSerializer,
+)
+from experimenter.projects.models import Project
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare the output and speed of ExperimentSerializer and "
+        "ExperimentValuesSerializer.  The experiments are created inside a "
+        "transaction which is rolled back afterwards."
+    )
+
+    SLUG_PREFIX = "serializer-benchmark-"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "sizes", nargs="*", type=int, default=[1000, 10000, 50000]
+        )
+        parser.add_argument("--repeat", type=int, default=3)
+
+    def build_experiment(self, owner, project, i):
+        return Experiment(
+            type=Experiment.TYPE_PREF,
+            owner=owner,
+            project=project,
+            name="Serializer Benchmark {}".format(i),
+            slug="{}{}".format(self.SLUG_PREFIX, i),
+            short_description="Serializer benchmark experiment {}".format(i),
+            client_matching="Locales: en-US, en-CA, en-GB\nGeos: US, CA, GB",
+            proposed_start_date=datetime.date(2019, 1, 1)
+            + datetime.timedelta(days=i % 365),
+            proposed_duration=30 + i % 30,
+            proposed_enrollment=i % 10 or None,
+            pref_key="browser.benchmark.{}.enabled".format(i),
+            pref_type=Experiment.PREF_TYPE_INT,
+            pref_branch=Experiment.PREF_BRANCH_DEFAULT,
+            firefox_version="57.0",
+            firefox_channel=Experiment.CHANNEL_RELEASE,
+            population_percent=decimal.Decimal(i % 10 * 10 + 10),
+            objectives="Objectives of experiment {}".format(i),
+            analysis_owner="Analysis Owner",
+            analysis="Analysis of experiment {}".format(i),
+        )
+
+    def build_variant(self, experiment, slug, is_control, value):
+        return ExperimentVariant(
+            experiment=experiment,
+            name=slug.capitalize(),
+            slug=slug,
+            is_control=is_control,
+            description="The {} branch".format(slug),
+            ratio=50,
+            value=json.dumps(value),
+        )
+
+    def create_experiments(self, size):
+        owner = get_user_model().objects.create(
+            username="serializer-benchmark@example.com",
+            email="serializer-benchmark@example.com",
+        )
+        project = Project.objects.create(
+            name="Serializer Benchmark", slug="serializer-benchmark"
+        )
+
+        experiments = Experiment.objects.bulk_create(
+            [self.build_experiment(owner, project, i) for i in range(size)],
+            batch_size=1000,
+        )
+
+        ExperimentVariant.objects.bulk_create(
+            [
+                variant
+                for i, experiment in enumerate(experiments)
+                for variant in (
+                    self.build_variant(experiment, "control", True, 0),
+                    self.build_variant(experiment, "treatment", False, i),
+                )
+            ],
+            batch_size=1000,
+        )
+
+        ExperimentChangeLog.objects.bulk_create(
+            [
+                ExperimentChangeLog(
+                    experiment=experiment,
+                    changed_by=owner,
+                    old_status=Experiment.STATUS_ACCEPTED,
+                    new_status=Experiment.STATUS_LIVE,
+                )
+                for experiment in experiments[::2]
+            ],
+            batch_size=1000,
+        )
+
+        # bulk_create doesn't send post_save, so store the dates and
+        # completion flags which the serializers read here
+        created = Experiment.objects.filter(
+            id__in=[experiment.id for experiment in experiments]
+        )
+        created.update_dates()
+        created.update_completion()
+
+    def time_render(self, serialize, repeat):
+        renderer = JSONRenderer()
+        timings = []
+
+        for i in range(repeat):
+            started = time.perf_counter()
+            content = renderer.render(serialize())
+            timings.append(time.perf_counter() - started)
+
+        return content, min(timings)
+
+    def benchmark(self, size, repeat):
+        queryset = Experiment.objects.filter(
+            slug__startswith=self.SLUG_PREFIX
+        ).order_by("id")
+
+        serializer_content, serializer_time = self.time_render(
+            lambda: ExperimentSerializer(queryset, many=True).data, repeat
+        )
+        values_content, values_time = self.time_render(
+            lambda: ExperimentValuesSerializer(queryset).data, repeat
+        )
+
+        if serializer_content != values_content:
+            raise CommandError(
+                "ExperimentValuesSerializer output differs from "
+                "ExperimentSerializer for {} experiments".format(size)
+            )
+
+        self.stdout.write(
+            "{size:>6} experiments: ExperimentSerializer {serializer:.3f}s, "
+            "ExperimentValuesSerializer {values:.3f}s, {speedup:.1f}x faster, "
+            "{length} identical bytes".format(
+                size=size,
+                serializer=serializer_time,
+                values=values_time,
+                speedup=serializer_time / values_time,
+                length=len(values_content),
+            )
+        )
+
+    def handle(self, *args, **options):
+        for size in options["sizes"]:
+            with transaction.atomic():
+                self.create_experiments(size)
+                self.benchmark(size, options["repeat"])
+                transaction.set_rollback(True)
@@ -0,0 +1,86 @@
+import json
+import sys
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from experimenter.experiments.imports import (
+    IMPORT_BATCH_SIZE,
+    ExperimentImporter,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Import experiments from a JSON file containing a list of rows of "
+        "form data, see ExperimentImporter.  Rows which fail validation are "
+        "reported and skipped, the others are imported."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="JSON file to import, - for stdin")
+        parser.add_argument(
+            "--email",
+            required=True,
+            help="Email of the user recorded as making the changes",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=IMPORT_BATCH_SIZE
+        )
+
+    def read_rows(self, path):
+        try:
+            if path == "-":
+                rows = json.load(sys.stdin)
+            else:
+                with open(path) as import_file:
+                    rows = json.load(import_file)
+        except (OSError, ValueError) as e:
+            raise CommandError(
+                "Unable to read {path}: {e}".format(path=path, e=e)
+            )
+
+        if not isinstance(rows, list) or not all(
+            isinstance(row, dict) for row in rows
+        ):
+            raise CommandError(
+                "{path} must contain a list of objects".format(path=path)
+            )
+
+        return rows
+
+    def handle(self, *args, **options):
+        try:
+            user = get_user_model().objects.get(email=options["email"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(
+                "Unknown user {email}".format(email=options["email"])
+            )
+
+        rows = self.read_rows(options["path"])
+
+        results = ExperimentImporter(
+            user, batch_size=options["batch_size"]
+        ).run(rows)
+
+        failed = [result for result in results if not result["success"]]
+
+        for result in failed:
+            self.stderr.write(
+                "Row {row}: {errors}".format(
+                    row=result["row"], errors=json.dumps(result["errors"])
+                )
+            )
+
+        self.stdout.write(
+            "Imported {imported} of {total} experiments".format(
+                imported=len(results) - len(failed), total=len(results)
+            )
+        )
+
+        if failed:
+            raise CommandError(
+                "{failed} experiments failed to import".format(
+                    failed=len(failed)
+                )
+            )
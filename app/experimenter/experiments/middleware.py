@@ -0,0 +1,237 @@
+import re
+import time
+from contextlib import ExitStack
+
+import brotli
+from django.conf import settings
+from django.db import connections
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence, compress_string
+from dockerflow.django.middleware import DockerflowMiddleware
+
+
+ACCEPT_ENCODING_RE = re.compile(
+    r"^\s*(?P<coding>[\w*-]+)\s*(?:;\s*q\s*=\s*(?P<quality>[\d.]+))?\s*$"
+)
+
+
+class APICompressionMiddleware(object):
+    """
+    Compress API responses with brotli or gzip, whichever the client
+    prefers, when it sends a matching Accept-Encoding header.
+
+    Only responses under settings.API_COMPRESSION_PATH are compressed.
+    Regular responses are only compressed when they are at least
+    settings.API_COMPRESSION_MIN_SIZE bytes long, while streaming responses
+    are always compressed as their size isn't known up front.  Event
+    streams are never compressed, gzip would buffer their events until the
+    stream ends.
+    """
+
+    # Supported encodings in order of preference
+    encodings = ("br", "gzip")
+
+    uncompressed_content_types = ("text/event-stream",)
+
+    # Brotli's default quality of 11 is too slow to compress on the fly
+    brotli_quality = 5
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def get_accepted_encodings(self, request):
+        accepted = set()
+
+        for value in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+            match = ACCEPT_ENCODING_RE.match(value)
+
+            if not match:
+                continue
+
+            try:
+                quality = float(match.group("quality") or 1)
+            except ValueError:
+                continue
+
+            if quality > 0:
+                accepted.add(match.group("coding").lower())
+
+        return accepted
+
+    def get_encoding(self, request):
+        accepted = self.get_accepted_encodings(request)
+
+        for encoding in self.encodings:
+            if encoding in accepted or "*" in accepted:
+                return encoding
+
+    def compress_brotli_sequence(self, sequence):
+        compressor = brotli.Compressor(quality=self.brotli_quality)
+
+        for item in sequence:
+            yield compressor.process(item)
+            yield compressor.flush()
+
+        yield compressor.finish()
+
+    def compress_streaming(self, response, encoding):
+        if encoding == "br":
+            return self.compress_brotli_sequence(response.streaming_content)
+
+        return compress_sequence(response.streaming_content)
+
+    def compress(self, response, encoding):
+        if encoding == "br":
+            return brotli.compress(
+                response.content, quality=self.brotli_quality
+            )
+
+        return compress_string(response.content)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if not request.path.startswith(settings.API_COMPRESSION_PATH):
+            return response
+
+        if response.has_header("Content-Encoding"):
+            return response
+
+        content_type = response.get("Content-Type", "").partition(";")[0]
+        if content_type.strip() in self.uncompressed_content_types:
+            return response
+
+        if (
+            not response.streaming
+            and len(response.content) < settings.API_COMPRESSION_MIN_SIZE
+        ):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+
+        encoding = self.get_encoding(request)
+
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            response.streaming_content = self.compress_streaming(
+                response, encoding
+            )
+            del response["Content-Length"]
+        else:
+            compressed = self.compress(response, encoding)
+
+            if len(compressed) >= len(response.content):
+                return response
+
+            response.content = compressed
+            response["Content-Length"] = str(len(response.content))
+
+        # The compressed body is no longer byte for byte identical to the
+        # representation the strong ETag was generated for
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response["ETag"] = "W/" + etag
+
+        response["Content-Encoding"] = encoding
+
+        return response
+
+
+class RequestTimings(object):
+    """
+    The number and total duration of the SQL queries of a request and the
+    time spent rendering its response, in seconds.
+
+    Instances are installed as database execute wrappers to count the
+    queries.
+    """
+
+    def __init__(self):
+        self.db_queries = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.monotonic()
+
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_queries += 1
+            self.db_time += time.monotonic() - start
+
+    def get_server_timing(self):
+        return (
+            'db;dur={db_time:.1f};desc="{db_queries} queries", '
+            "render;dur={render_time:.1f}"
+        ).format(
+            db_queries=self.db_queries,
+            db_time=self.db_time * 1000,
+            render_time=self.render_time * 1000,
+        )
+
+    def get_log_fields(self):
+        return {
+            "db_queries": self.db_queries,
+            "db_time": int(self.db_time * 1000),
+            "render_time": int(self.render_time * 1000),
+        }
+
+
+class RequestTimingMiddleware(object):
+    """
+    Measure the SQL queries of each request and the time spent rendering
+    template and API responses, and report them in the Server-Timing and
+    X-DB-Queries headers.
+
+    The timings are available to inner middleware as request.timings.
+    Queries made while a streaming response is consumed happen after the
+    headers are sent, so they aren't included.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.timings = timings = RequestTimings()
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timings))
+
+            response = self.get_response(request)
+
+        response["Server-Timing"] = timings.get_server_timing()
+        response["X-DB-Queries"] = str(timings.db_queries)
+
+        return response
+
+    def process_template_response(self, request, response):
+        # As the outermost middleware this is the last hook to run before
+        # the response is rendered
+        start = time.monotonic()
+
+        def record_render_time(response):
+            request.timings.render_time += time.monotonic() - start
+
+        response.add_post_render_callback(record_render_time)
+
+        return response
+
+
+class RequestSummaryMiddleware(DockerflowMiddleware):
+    """
+    Add the timings of RequestTimingMiddleware to the request.summary log
+    entries, in milliseconds.
+    """
+
+    def _build_extra_meta(self, request):
+        extra = super()._build_extra_meta(request)
+
+        timings = getattr(request, "timings", None)
+        if timings is not None:
+            extra.update(timings.get_log_fields())
+
+        return extra
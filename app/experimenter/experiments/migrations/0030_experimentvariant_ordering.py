@@ -0,0 +1,19 @@
+# Generated by Django 2.1.5 on 2026-10-18 04:52
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0029_auto_20190206_2028")]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="experimentvariant",
+            options={
+                "ordering": ("id",),
+                "verbose_name": "Experiment Variant",
+                "verbose_name_plural": "Experiment Variants",
+            },
+        )
+    ]
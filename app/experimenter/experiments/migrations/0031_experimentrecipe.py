@@ -0,0 +1,41 @@
+# Generated by Django 2.1.5 on 2026-10-18 05:18
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0030_experimentvariant_ordering")]
+
+    operations = [
+        migrations.CreateModel(
+            name="ExperimentRecipe",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("content", models.TextField()),
+                ("etag", models.CharField(max_length=255)),
+                ("generated_on", models.DateTimeField()),
+                (
+                    "experiment",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="recipe",
+                        to="experiments.Experiment",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Experiment Recipe",
+                "verbose_name_plural": "Experiment Recipes",
+            },
+        )
+    ]
@@ -0,0 +1,55 @@
+# Generated by Django 2.1.5 on 2026-10-18 05:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0031_experimentrecipe")]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["status", "type"], name="experiment_status_type_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["firefox_channel", "firefox_version"],
+                name="experiment_channel_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["archived", "status"], name="experiment_archived_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["owner", "status"], name="experiment_owner_status_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["proposed_start_date", "proposed_duration"],
+                name="experiment_start_date_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experimentchangelog",
+            index=models.Index(
+                fields=[
+                    "experiment",
+                    "old_status",
+                    "new_status",
+                    "changed_on",
+                ],
+                name="changelog_transition_idx",
+            ),
+        ),
+    ]
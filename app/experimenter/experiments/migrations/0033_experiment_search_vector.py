@@ -0,0 +1,58 @@
+# Generated by Django 2.1.5 on 2026-10-18 05:25
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.aggregates import StringAgg
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+
+
+def update_search_vectors(apps, schema_editor):  # pragma: no cover
+    Experiment = apps.get_model("experiments", "Experiment")
+    ExperimentComment = apps.get_model("experiments", "ExperimentComment")
+
+    comments = (
+        ExperimentComment.objects.filter(experiment=models.OuterRef("pk"))
+        .order_by()
+        .values("experiment")
+        .annotate(text=StringAgg("text", delimiter=" "))
+        .values("text")
+    )
+
+    Experiment.objects.update(
+        search_vector=(
+            SearchVector("name", weight="A", config="english")
+            + SearchVector("short_description", weight="B", config="english")
+            + SearchVector(
+                "objectives", "analysis", weight="C", config="english"
+            )
+            + SearchVector(
+                "related_work",
+                models.Subquery(comments, output_field=models.TextField()),
+                weight="D",
+                config="english",
+            )
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [("experiments", "0032_experiment_filter_indexes")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                blank=True, editable=False, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="experiment_search_idx"
+            ),
+        ),
+        migrations.RunPython(update_search_vectors, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 2.1.5 on 2026-10-18 06:01
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce, TruncDate
+
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def get_end_date(start_date, duration):  # pragma: no cover
+    return models.Case(
+        models.When(
+            **{
+                "{duration}__gt".format(duration=duration): 0,
+                "{duration}__lte".format(duration=duration): 1000,
+                "then": models.ExpressionWrapper(
+                    start_date + models.F(duration),
+                    output_field=models.DateField(),
+                ),
+            }
+        ),
+        default=None,
+        output_field=models.DateField(),
+    )
+
+
+def update_dates(apps, schema_editor):  # pragma: no cover
+    Experiment = apps.get_model("experiments", "Experiment")
+    ExperimentChangeLog = apps.get_model("experiments", "ExperimentChangeLog")
+
+    launch_dates = (
+        ExperimentChangeLog.objects.filter(
+            experiment=models.OuterRef("pk"),
+            old_status="Accepted",
+            new_status="Live",
+        )
+        .order_by("changed_on")
+        .annotate(launch_date=TruncDate("changed_on"))
+        .values("launch_date")[:1]
+    )
+    actual_start_date = models.Subquery(
+        launch_dates, output_field=models.DateField()
+    )
+    start_date = Coalesce(actual_start_date, "proposed_start_date")
+
+    experiment_ids = list(
+        Experiment.objects.order_by("id").values_list("id", flat=True)
+    )
+
+    # Each batch is its own short transaction so the backfill never holds
+    # locks on the whole table
+    for i in range(0, len(experiment_ids), BACKFILL_BATCH_SIZE):
+        Experiment.objects.filter(
+            id__in=experiment_ids[i : i + BACKFILL_BATCH_SIZE]
+        ).update(
+            actual_start_date=actual_start_date,
+            end_date=get_end_date(start_date, "proposed_duration"),
+            enrollment_end_date=get_end_date(
+                start_date, "proposed_enrollment"
+            ),
+        )
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [("experiments", "0033_experiment_search_vector")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="actual_start_date",
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="end_date",
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="enrollment_end_date",
+            field=models.DateField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(update_dates, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["actual_start_date"],
+                name="experiment_actual_start_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["end_date"], name="experiment_end_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["enrollment_end_date"],
+                name="experiment_enrollment_end_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 2.1.5 on 2026-10-18 06:11
+
+from django.db import migrations, models
+
+
+BACKFILL_BATCH_SIZE = 500
+
+
+def update_last_changed_on(apps, schema_editor):  # pragma: no cover
+    Experiment = apps.get_model("experiments", "Experiment")
+    ExperimentChangeLog = apps.get_model("experiments", "ExperimentChangeLog")
+
+    last_changed_on = models.Subquery(
+        ExperimentChangeLog.objects.filter(experiment=models.OuterRef("pk"))
+        .order_by("-changed_on")
+        .values("changed_on")[:1]
+    )
+
+    experiment_ids = list(
+        Experiment.objects.order_by("id").values_list("id", flat=True)
+    )
+
+    # Each batch is its own short transaction so the backfill never holds
+    # locks on the whole table
+    for i in range(0, len(experiment_ids), BACKFILL_BATCH_SIZE):
+        Experiment.objects.filter(
+            id__in=experiment_ids[i : i + BACKFILL_BATCH_SIZE]
+        ).update(last_changed_on=last_changed_on)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [("experiments", "0034_experiment_dates")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="last_changed_on",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(
+            update_last_changed_on, migrations.RunPython.noop
+        ),
+        migrations.AddIndex(
+            model_name="experiment",
+            index=models.Index(
+                fields=["last_changed_on", "id"],
+                name="experiment_last_changed_idx",
+            ),
+        ),
+    ]
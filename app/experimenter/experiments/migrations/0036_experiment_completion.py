@@ -0,0 +1,142 @@
+# Generated by Django 2.1.5 on 2026-10-18 06:40
+
+from django.db import migrations, models
+
+
+BACKFILL_BATCH_SIZE = 500
+
+# Frozen copies of the ExperimentConstants defaults when this migration was
+# written, so replaying it always backfills the same values
+OBJECTIVES_DEFAULT = "What is the objective of this study?  Explain in detail."
+
+ANALYSIS_DEFAULT = """What is the main effect you are looking for and what data will
+you use to make these decisions? What metrics are you using to measure success
+
+Do you plan on surveying users at the end of the study? Yes/No.
+Strategy and Insights can help create surveys if needed
+    """
+
+RISK_FIELDS = (
+    "risk_partner_related",
+    "risk_brand",
+    "risk_fast_shipped",
+    "risk_confidential",
+    "risk_release_population",
+    "risk_technical",
+)
+
+REQUIRED_REVIEW_FIELDS = (
+    "review_science",
+    "review_engineering",
+    "review_qa_requested",
+    "review_intent_to_ship",
+    "review_bugzilla",
+    "review_qa",
+    "review_relman",
+)
+
+# Most experiments end up complete, so only the incomplete ones and the
+# ones ready to launch are indexed, by status
+PARTIAL_INDEXES = (
+    ("experiment_population_todo_idx", "NOT completed_population"),
+    ("experiment_objectives_todo_idx", "NOT completed_objectives"),
+    ("experiment_risks_todo_idx", "NOT completed_risks"),
+    ("experiment_reviews_todo_idx", "NOT completed_required_reviews"),
+    ("experiment_ready_idx", "is_ready_to_launch"),
+)
+
+
+def update_completion(apps, schema_editor):  # pragma: no cover
+    Experiment = apps.get_model("experiments", "Experiment")
+    ExperimentVariant = apps.get_model("experiments", "ExperimentVariant")
+
+    conditions = {
+        "completed_population": (
+            models.Q(population_percent__gt=0)
+            & ~models.Q(firefox_version="")
+            & ~models.Q(firefox_channel="")
+        ),
+        "completed_objectives": (
+            ~models.Q(objectives=OBJECTIVES_DEFAULT)
+            & ~models.Q(analysis=ANALYSIS_DEFAULT)
+        ),
+        "completed_risks": models.Q(
+            **{
+                "{field}__isnull".format(field=field): False
+                for field in RISK_FIELDS
+            }
+        ),
+        "completed_required_reviews": models.Q(
+            **{field: True for field in REQUIRED_REVIEW_FIELDS}
+        ),
+    }
+    conditions["is_ready_to_launch"] = models.Q(
+        conditions["completed_population"],
+        conditions["completed_objectives"],
+        conditions["completed_risks"],
+        conditions["completed_required_reviews"],
+        id__in=ExperimentVariant.objects.values("experiment"),
+    )
+
+    completion = {
+        field: models.Case(
+            models.When(condition, then=models.Value(True)),
+            default=models.Value(False),
+            output_field=models.BooleanField(),
+        )
+        for field, condition in conditions.items()
+    }
+
+    experiment_ids = list(
+        Experiment.objects.order_by("id").values_list("id", flat=True)
+    )
+
+    # Each batch is its own short transaction so the backfill never holds
+    # locks on the whole table
+    for i in range(0, len(experiment_ids), BACKFILL_BATCH_SIZE):
+        Experiment.objects.filter(
+            id__in=experiment_ids[i : i + BACKFILL_BATCH_SIZE]
+        ).update(**completion)
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [("experiments", "0035_experiment_last_changed_on")]
+
+    operations = [
+        migrations.AddField(
+            model_name="experiment",
+            name="completed_population",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="completed_objectives",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="completed_risks",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="completed_required_reviews",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="experiment",
+            name="is_ready_to_launch",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.RunPython(update_completion, migrations.RunPython.noop),
+    ] + [
+        migrations.RunSQL(
+            "CREATE INDEX {name} ON experiments_experiment (status) "
+            "WHERE {condition}".format(name=name, condition=condition),
+            "DROP INDEX {name}".format(name=name),
+        )
+        for name, condition in PARTIAL_INDEXES
+    ]
@@ -4,10 +4,35 @@ from urllib.parse import urljoin
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.contrib.postgres.aggregates import StringAgg
 from django.contrib.postgres.fields import JSONField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    SearchVectorField,
+)
 from django.core.validators import MaxValueValidator
-from django.db import models
-from django.db.models import Max
+from django.db import connections, models
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    DateField,
+    ExpressionWrapper,
+    F,
+    IntegerField,
+    Max,
+    Min,
+    OuterRef,
+    Prefetch,
+    Q,
+    Subquery,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, TruncDate
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.functional import cached_property
@@ -15,22 +40,257 @@ from django.utils.functional import cached_property
 from experimenter.experiments.constants import ExperimentConstants
 
 
-class ExperimentManager(models.Manager):
+class ExperimentQuerySet(models.QuerySet):
+    """
+    Experiment.objects loads the experiment columns only, the named
+    querysets below add the relations and annotations each kind of page
+    renders so every call site only pays for what it uses.
+    """
+
+    SEARCH_CONFIG = "english"
+
+    def with_variants_summary(self):
+        """
+        Annotate the number of variants, which completed_variants uses
+        instead of querying the variants of each experiment.
+        """
+        variants = ExperimentVariant.objects.filter(
+            experiment=OuterRef("pk")
+        ).order_by()
+
+        return self.annotate(
+            variants_count=Coalesce(
+                Subquery(
+                    variants.values("experiment")
+                    .annotate(count=Count("id"))
+                    .values("count"),
+                    output_field=IntegerField(),
+                ),
+                0,
+            )
+        )
 
-    def get_queryset(self):
-        return (
-            super()
-            .get_queryset()
-            .prefetch_related(
-                "changes",
-                "changes__changed_by",
-                "owner",
-                "comments",
-                "comments__created_by",
+    def with_controls(self):
+        """
+        Load the control variants of all the experiments in one query,
+        which control uses instead of querying the variants of each
+        experiment.
+        """
+        return self.prefetch_related(
+            Prefetch(
+                "variants",
+                queryset=ExperimentVariant.objects.filter(is_control=True),
+                to_attr="prefetched_controls",
             )
-            .annotate(latest_change=Max("changes__changed_on"))
         )
 
+    def for_list(self):
+        """
+        Load the owners which the experiment list renders along with the
+        experiments.
+        """
+        return self.select_related("owner")
+
+    def most_recently_changed(self):
+        """
+        Order the experiments by their latest change, along with the
+        control variants which the project page renders.
+        """
+        return self.with_controls().order_by(
+            F("last_changed_on").desc(nulls_last=True), "-id"
+        )
+
+    def for_detail(self):
+        """
+        Load what the experiment detail page renders: the owner, project,
+        branches, change history and comments with their authors.
+        """
+        return self.select_related("owner", "project").prefetch_related(
+            "variants",
+            "changes",
+            "changes__changed_by",
+            "comments",
+            "comments__created_by",
+        )
+
+    def _get_end_date(self, start_date, duration):
+        return Case(
+            When(
+                **{
+                    "{duration}__gt".format(duration=duration): 0,
+                    "{duration}__lte".format(
+                        duration=duration
+                    ): Experiment.MAX_DURATION,
+                    "then": ExpressionWrapper(
+                        start_date + F(duration), output_field=DateField()
+                    ),
+                }
+            ),
+            default=None,
+            output_field=DateField(),
+        )
+
+    def update_dates(self):
+        """
+        Recompute the stored actual start, end and enrollment end dates of
+        each experiment from its launch in the change log and its proposed
+        dates, and the time of its latest change, in a single UPDATE
+        statement.
+        """
+        launch_dates = (
+            ExperimentChangeLog.objects.filter(
+                experiment=OuterRef("pk"), **Experiment.LAUNCH_CHANGE
+            )
+            .order_by("changed_on")
+            .annotate(launch_date=TruncDate("changed_on"))
+            .values("launch_date")[:1]
+        )
+        actual_start_date = Subquery(launch_dates, output_field=DateField())
+        start_date = Coalesce(actual_start_date, "proposed_start_date")
+
+        return self.update(
+            last_changed_on=Subquery(
+                ExperimentChangeLog.objects.filter(experiment=OuterRef("pk"))
+                .order_by("-changed_on")
+                .values("changed_on")[:1]
+            ),
+            actual_start_date=actual_start_date,
+            end_date=self._get_end_date(start_date, "proposed_duration"),
+            enrollment_end_date=self._get_end_date(
+                start_date, "proposed_enrollment"
+            ),
+        )
+
+    def update_completion(self):
+        """
+        Recompute the stored completion flags of each experiment's sections
+        and its readiness to launch in a single UPDATE statement.
+        """
+        conditions = {
+            "completed_population": (
+                Q(population_percent__gt=0)
+                & ~Q(firefox_version="")
+                & ~Q(firefox_channel="")
+            ),
+            "completed_objectives": (
+                ~Q(objectives=Experiment.OBJECTIVES_DEFAULT)
+                & ~Q(analysis=Experiment.ANALYSIS_DEFAULT)
+            ),
+            "completed_risks": Q(
+                **{
+                    "{field}__isnull".format(field=field): False
+                    for field in Experiment.RISK_FIELDS
+                }
+            ),
+            "completed_required_reviews": Q(
+                **{field: True for field in Experiment.REQUIRED_REVIEW_FIELDS}
+            ),
+        }
+        conditions["is_ready_to_launch"] = Q(
+            conditions["completed_population"],
+            conditions["completed_objectives"],
+            conditions["completed_risks"],
+            conditions["completed_required_reviews"],
+            id__in=ExperimentVariant.objects.values("experiment"),
+        )
+
+        return self.update(
+            **{
+                field: Case(
+                    When(condition, then=Value(True)),
+                    default=Value(False),
+                    output_field=BooleanField(),
+                )
+                for field, condition in conditions.items()
+            }
+        )
+
+    def update_search_vectors(self):
+        """
+        Recompute the stored search vector of each experiment from its
+        text fields and comments in a single UPDATE statement.
+        """
+        comments = (
+            ExperimentComment.objects.filter(experiment=OuterRef("pk"))
+            .order_by()
+            .values("experiment")
+            .annotate(text=StringAgg("text", delimiter=" "))
+            .values("text")
+        )
+
+        return self.update(
+            search_vector=(
+                SearchVector("name", weight="A", config=self.SEARCH_CONFIG)
+                + SearchVector(
+                    "short_description", weight="B", config=self.SEARCH_CONFIG
+                )
+                + SearchVector(
+                    "objectives",
+                    "analysis",
+                    weight="C",
+                    config=self.SEARCH_CONFIG,
+                )
+                + SearchVector(
+                    "related_work",
+                    Subquery(comments, output_field=models.TextField()),
+                    weight="D",
+                    config=self.SEARCH_CONFIG,
+                )
+            )
+        )
+
+    def in_slug_order(self, slugs):
+        """
+        Filter the experiments with the given slugs, ordered as the slugs.
+        """
+        slugs = list(slugs)
+
+        return self.filter(slug__in=slugs).order_by(
+            Case(
+                *[
+                    When(slug=slug, then=Value(position))
+                    for position, slug in enumerate(slugs)
+                ],
+                output_field=models.IntegerField(),
+            )
+        )
+
+    def search(self, text):
+        """
+        Filter the experiments matching the words of text, ordered by how
+        well they match and then by the existing ordering.
+        """
+        query = SearchQuery(text, config=self.SEARCH_CONFIG)
+
+        return (
+            self.filter(search_vector=query)
+            .annotate(search_rank=SearchRank(F("search_vector"), query))
+            .order_by("-search_rank", *self.query.order_by)
+        )
+
+
+class ExperimentManager(models.Manager.from_queryset(ExperimentQuerySet)):
+
+    def transition_status(self, slugs, old_status, new_status):
+        """
+        Move the experiments with the given slugs from old_status to
+        new_status in a single UPDATE statement and return the (id, slug)
+        of each experiment that was moved.
+
+        Experiments which are no longer in old_status are left untouched,
+        so concurrent transitions of the same experiment can't both succeed.
+        """
+        with connections[self.db].cursor() as cursor:
+            cursor.execute(
+                (
+                    "UPDATE {table} SET status = %s "
+                    "WHERE slug = ANY(%s) AND status = %s "
+                    "RETURNING id, slug"
+                ).format(table=self.model._meta.db_table),
+                [new_status, list(slugs), old_status],
+            )
+            return cursor.fetchall()
+
 
 class Experiment(ExperimentConstants, models.Model):
     type = models.CharField(
@@ -74,6 +334,14 @@ class Experiment(ExperimentConstants, models.Model):
         null=True,
         validators=[MaxValueValidator(ExperimentConstants.MAX_DURATION)],
     )
+    actual_start_date = models.DateField(blank=True, null=True, editable=False)
+    end_date = models.DateField(blank=True, null=True, editable=False)
+    enrollment_end_date = models.DateField(
+        blank=True, null=True, editable=False
+    )
+    last_changed_on = models.DateTimeField(
+        blank=True, null=True, editable=False
+    )
 
     pref_key = models.CharField(max_length=255, blank=True, null=True)
     pref_type = models.CharField(
@@ -184,11 +452,91 @@ class Experiment(ExperimentConstants, models.Model):
         default=None, blank=True, null=True
     )
 
+    # Completion flags maintained from the fields above and the variants
+    completed_population = models.BooleanField(default=False, editable=False)
+    completed_objectives = models.BooleanField(default=False, editable=False)
+    completed_risks = models.BooleanField(default=False, editable=False)
+    completed_required_reviews = models.BooleanField(
+        default=False, editable=False
+    )
+    is_ready_to_launch = models.BooleanField(default=False, editable=False)
+
+    search_vector = SearchVectorField(blank=True, null=True, editable=False)
+
     objects = ExperimentManager()
 
+    # The dates stored from the change log and the proposed dates
+    DATE_FIELDS = (
+        "last_changed_on",
+        "actual_start_date",
+        "end_date",
+        "enrollment_end_date",
+    )
+
+    # The flags stored from the sections' fields and the variants
+    COMPLETION_FIELDS = (
+        "completed_population",
+        "completed_objectives",
+        "completed_risks",
+        "completed_required_reviews",
+        "is_ready_to_launch",
+    )
+
+    RISK_FIELDS = (
+        "risk_partner_related",
+        "risk_brand",
+        "risk_fast_shipped",
+        "risk_confidential",
+        "risk_release_population",
+        "risk_technical",
+    )
+
+    REQUIRED_REVIEW_FIELDS = (
+        "review_science",
+        "review_engineering",
+        "review_qa_requested",
+        "review_intent_to_ship",
+        "review_bugzilla",
+        "review_qa",
+        "review_relman",
+    )
+
     class Meta:
         verbose_name = "Experiment"
         verbose_name_plural = "Experiments"
+        indexes = [
+            models.Index(
+                fields=["status", "type"], name="experiment_status_type_idx"
+            ),
+            models.Index(
+                fields=["firefox_channel", "firefox_version"],
+                name="experiment_channel_idx",
+            ),
+            models.Index(
+                fields=["archived", "status"], name="experiment_archived_idx"
+            ),
+            models.Index(
+                fields=["owner", "status"], name="experiment_owner_status_idx"
+            ),
+            models.Index(
+                fields=["proposed_start_date", "proposed_duration"],
+                name="experiment_start_date_idx",
+            ),
+            models.Index(
+                fields=["actual_start_date"],
+                name="experiment_actual_start_idx",
+            ),
+            models.Index(fields=["end_date"], name="experiment_end_date_idx"),
+            models.Index(
+                fields=["enrollment_end_date"],
+                name="experiment_enrollment_end_idx",
+            ),
+            models.Index(
+                fields=["last_changed_on", "id"],
+                name="experiment_last_changed_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="experiment_search_idx"),
+        ]
 
     def get_absolute_url(self):
         return reverse("experiments-detail", kwargs={"slug": self.slug})
@@ -244,32 +592,34 @@ class Experiment(ExperimentConstants, models.Model):
             or self.feature_bugzilla_url
         )
 
-    def _transition_date(self, old_status, new_status):
-        for change in self.changes.all():
-            if (
-                change.old_status == old_status
-                and change.new_status == new_status
-            ):
-                return change.changed_on.date()
-
     @property
     def start_date(self):
-        return (
-            self._transition_date(self.STATUS_ACCEPTED, self.STATUS_LIVE)
-            or self.proposed_start_date
-        )
+        return self.actual_start_date or self.proposed_start_date
 
     def _compute_end_date(self, duration):
         if self.start_date and duration and 0 <= duration <= self.MAX_DURATION:
             return self.start_date + datetime.timedelta(days=duration)
 
-    @property
-    def end_date(self):
-        return self._compute_end_date(self.proposed_duration)
+    def set_dates(self):
+        """
+        Set the time of the latest change and the actual start, end and
+        enrollment end dates from the change log and the proposed dates,
+        without saving them.
+        """
+        changes = {"launched_on": None, "last_changed_on": None}
+        if self.pk:
+            changes = self.changes.aggregate(
+                launched_on=Min("changed_on", filter=Q(**self.LAUNCH_CHANGE)),
+                last_changed_on=Max("changed_on"),
+            )
 
-    @property
-    def enrollment_end_date(self):
-        return self._compute_end_date(self.proposed_enrollment)
+        launched_on = changes["launched_on"]
+        self.last_changed_on = changes["last_changed_on"]
+        self.actual_start_date = launched_on.date() if launched_on else None
+        self.end_date = self._compute_end_date(self.proposed_duration)
+        self.enrollment_end_date = self._compute_end_date(
+            self.proposed_enrollment
+        )
 
     @property
     def observation_duration(self):
@@ -318,9 +668,27 @@ class Experiment(ExperimentConstants, models.Model):
             self.enrollment_end_date, self.end_date
         )
 
+    @property
+    def _prefetched_variants(self):
+        return getattr(self, "_prefetched_objects_cache", {}).get("variants")
+
     @cached_property
     def control(self):
-        return self.variants.get(is_control=True)
+        # Only query when neither the variants nor the controls were
+        # prefetched
+        variants = self._prefetched_variants
+        if variants is None:
+            variants = getattr(self, "prefetched_controls", None)
+        if variants is None:
+            return self.variants.get(is_control=True)
+
+        for variant in variants:
+            if variant.is_control:
+                return variant
+
+        raise ExperimentVariant.DoesNotExist(
+            "ExperimentVariant matching query does not exist."
+        )
 
     @property
     def grouped_changes(self):
@@ -372,39 +740,21 @@ class Experiment(ExperimentConstants, models.Model):
     def completed_overview(self):
         return self.pk is not None
 
-    @property
-    def completed_population(self):
-        return (
-            self.population_percent > 0
-            and self.firefox_version != ""
-            and self.firefox_channel != ""
-        )
-
     @property
     def completed_variants(self):
-        return self.variants.exists()
+        variants = self._prefetched_variants
+        if variants is not None:
+            return bool(variants)
 
-    @property
-    def completed_objectives(self):
-        return (
-            self.objectives != self.OBJECTIVES_DEFAULT
-            and self.analysis != self.ANALYSIS_DEFAULT
-        )
+        variants_count = getattr(self, "variants_count", None)
+        if variants_count is not None:
+            return variants_count > 0
 
-    @property
-    def _risk_questions(self):
-        return (
-            self.risk_partner_related,
-            self.risk_brand,
-            self.risk_fast_shipped,
-            self.risk_confidential,
-            self.risk_release_population,
-            self.risk_technical,
-        )
+        return self.variants.exists()
 
     @property
-    def completed_risks(self):
-        return None not in self._risk_questions
+    def _risk_questions(self):
+        return tuple(getattr(self, field) for field in self.RISK_FIELDS)
 
     @property
     def completed_testing(self):
@@ -412,20 +762,10 @@ class Experiment(ExperimentConstants, models.Model):
 
     @property
     def _required_reviews(self):
-        return (
-            self.review_science,
-            self.review_engineering,
-            self.review_qa_requested,
-            self.review_intent_to_ship,
-            self.review_bugzilla,
-            self.review_qa,
-            self.review_relman,
+        return tuple(
+            getattr(self, field) for field in self.REQUIRED_REVIEW_FIELDS
         )
 
-    @property
-    def completed_required_reviews(self):
-        return all(self._required_reviews)
-
     @property
     def completed_all_sections(self):
         return (
@@ -435,9 +775,25 @@ class Experiment(ExperimentConstants, models.Model):
             and self.completed_risks
         )
 
-    @property
-    def is_ready_to_launch(self):
-        return self.completed_all_sections and self.completed_required_reviews
+    def set_completion(self):
+        """
+        Set the completion flags of the sections and the readiness to
+        launch from the fields and the variants, without saving them.
+        """
+        self.completed_population = (
+            float(self.population_percent) > 0
+            and self.firefox_version != ""
+            and self.firefox_channel != ""
+        )
+        self.completed_objectives = (
+            self.objectives != self.OBJECTIVES_DEFAULT
+            and self.analysis != self.ANALYSIS_DEFAULT
+        )
+        self.completed_risks = None not in self._risk_questions
+        self.completed_required_reviews = all(self._required_reviews)
+        self.is_ready_to_launch = (
+            self.completed_all_sections and self.completed_required_reviews
+        )
 
     @property
     def population(self):
@@ -467,6 +823,7 @@ class ExperimentVariant(models.Model):
         verbose_name = "Experiment Variant"
         verbose_name_plural = "Experiment Variants"
         unique_together = (("slug", "experiment"),)
+        ordering = ("id",)
 
     def __str__(self):  # pragma: no cover
         return self.name
@@ -553,6 +910,17 @@ class ExperimentChangeLog(models.Model):
         verbose_name = "Experiment Change Log"
         verbose_name_plural = "Experiment Change Logs"
         ordering = ("changed_on",)
+        indexes = [
+            models.Index(
+                fields=[
+                    "experiment",
+                    "old_status",
+                    "new_status",
+                    "changed_on",
+                ],
+                name="changelog_transition_idx",
+            )
+        ]
 
     def __str__(self):  # pragma: no cover
         if self.message:
@@ -601,3 +969,24 @@ class ExperimentComment(ExperimentConstants, models.Model):
         return "{author} ({date}): {text}".format(
             author=self.created_by, date=self.created_on, text=self.text
         )
+
+
+class ExperimentRecipe(models.Model):
+    """
+    The Normandy recipe of a pref study rendered as compact JSON when the
+    experiment is shipped or accepted, so it can be served as is.
+    """
+
+    experiment = models.OneToOneField(
+        Experiment, related_name="recipe", on_delete=models.CASCADE
+    )
+    content = models.TextField()
+    etag = models.CharField(max_length=255)
+    generated_on = models.DateTimeField()
+
+    class Meta:
+        verbose_name = "Experiment Recipe"
+        verbose_name_plural = "Experiment Recipes"
+
+    def __str__(self):  # pragma: no cover
+        return str(self.experiment)
@@ -0,0 +1,143 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+
+from django.db.models import F, Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class ExperimentCursorPagination(BasePagination):
+    """
+    Opt-in keyset pagination ordered by (last_changed_on, id).
+
+    Pagination is only applied when the request contains a cursor or
+    page_size parameter so existing clients keep receiving the full
+    unpaginated list.  The cursor is an opaque token which encodes the
+    (last_changed_on, id) of the last experiment on the previous page, so
+    fetching any page costs the same no matter how deep into the list it is.
+    Experiments without any changes sort last.  The next page is linked
+    from the response body and from the Link header.
+    """
+
+    ordering_field = "last_changed_on"
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = 100
+    max_page_size = 1000
+    invalid_cursor_message = "Invalid cursor"
+
+    def is_requested(self, request):
+        return (
+            self.cursor_query_param in request.query_params
+            or self.page_size_query_param in request.query_params
+        )
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+
+        if page_size <= 0:
+            return self.page_size
+
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, experiment):
+        changed_on = getattr(experiment, self.ordering_field)
+        position = [
+            changed_on.isoformat() if changed_on else None,
+            experiment.id,
+        ]
+        return base64.urlsafe_b64encode(
+            json.dumps(position).encode("ascii")
+        ).decode("ascii")
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+
+        if not encoded:
+            return None
+
+        try:
+            changed_on, experiment_id = json.loads(
+                base64.urlsafe_b64decode(encoded.encode("ascii")).decode(
+                    "ascii"
+                )
+            )
+
+            if changed_on is not None:
+                changed_on = parse_datetime(changed_on)
+                if changed_on is None:
+                    raise ValueError(changed_on)
+
+            return changed_on, int(experiment_id)
+        except (binascii.Error, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def get_position_filter(self, changed_on, experiment_id):
+        field = self.ordering_field
+
+        if changed_on is None:
+            return Q(**{"{}__isnull".format(field): True}) & Q(
+                id__gt=experiment_id
+            )
+
+        return (
+            Q(**{"{}__gt".format(field): changed_on})
+            | (Q(**{field: changed_on}) & Q(id__gt=experiment_id))
+            | Q(**{"{}__isnull".format(field): True})
+        )
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if not self.is_requested(request):
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(
+            F(self.ordering_field).asc(nulls_last=True), "id"
+        )
+
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(*position))
+
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        self.page = results[: self.page_size]
+
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+
+        return replace_query_param(
+            self.base_url,
+            self.cursor_query_param,
+            self.encode_cursor(self.page[-1]),
+        )
+
+    def add_link_header(self, response):
+        next_link = self.get_next_link()
+
+        if next_link:
+            response["Link"] = '<{url}>; rel="next"'.format(url=next_link)
+
+        return response
+
+    def get_paginated_response(self, data):
+        return self.add_link_header(
+            Response(
+                OrderedDict(
+                    [("next", self.get_next_link()), ("results", data)]
+                )
+            )
+        )
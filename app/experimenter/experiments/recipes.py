@@ -0,0 +1,56 @@
+import hashlib
+
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+
+from experimenter.experiments.models import Experiment, ExperimentRecipe
+from experimenter.experiments.serializers import ExperimentRecipeSerializer
+
+
+# Transitions into these statuses generate the recipe of an experiment
+RECIPE_STATUSES = (Experiment.STATUS_SHIP, Experiment.STATUS_ACCEPTED)
+
+# Transitions into these statuses delete the recipe of an experiment, as it
+# is being edited again or won't ship
+NO_RECIPE_STATUSES = (
+    Experiment.STATUS_DRAFT,
+    Experiment.STATUS_REVIEW,
+    Experiment.STATUS_REJECTED,
+)
+
+
+def generate_recipes(experiment_ids):
+    """
+    Render and store the recipe of each pref study in experiment_ids,
+    replacing any recipe generated before.
+    """
+    experiments = Experiment.objects.filter(
+        id__in=experiment_ids, type=Experiment.TYPE_PREF
+    ).prefetch_related("variants")
+
+    renderer = JSONRenderer()
+    generated_on = timezone.now()
+    recipes = []
+
+    for experiment in experiments:
+        content = renderer.render(
+            ExperimentRecipeSerializer(experiment).data
+        ).decode()
+
+        recipes.append(
+            ExperimentRecipe(
+                experiment=experiment,
+                content=content,
+                etag='"{hash}"'.format(
+                    hash=hashlib.sha1(content.encode()).hexdigest()
+                ),
+                generated_on=generated_on,
+            )
+        )
+
+    delete_recipes(experiment_ids)
+    ExperimentRecipe.objects.bulk_create(recipes)
+
+
+def delete_recipes(experiment_ids):
+    ExperimentRecipe.objects.filter(experiment_id__in=experiment_ids).delete()
@@ -0,0 +1,78 @@
+import json
+
+import msgpack
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Render data as MessagePack, a compact binary encoding of the same
+    structure as the JSON representation.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        return msgpack.packb(
+            data, use_bin_type=True, default=JSONEncoder().default
+        )
+
+
+class NDJSONRenderer(JSONRenderer):
+    """
+    Render a list as newline delimited JSON, one item per line.
+
+    Paginated responses are rendered as the items of their results, the
+    next page is linked from the Link header.
+    """
+
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    results_field = "results"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        if isinstance(data, dict) and self.results_field in data:
+            data = data[self.results_field]
+
+        if not isinstance(data, list):
+            data = [data]
+
+        render_json = super().render
+
+        return b"".join(
+            render_json(item, renderer_context=renderer_context) + b"\n"
+            for item in data
+        )
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Render data as a single Server-Sent Event named error.
+
+    Event streams write their events directly, so this only renders the
+    error responses of event stream endpoints.
+    """
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        return (
+            b"event: error\ndata: "
+            + json.dumps(data, cls=JSONEncoder).encode()
+            + b"\n\n"
+        )
@@ -1,5 +1,11 @@
+import json
 import time
+from itertools import groupby
+from operator import itemgetter
+from urllib.parse import urljoin
 
+from django.conf import settings
+from django.urls import reverse
 from rest_framework import serializers
 
 from experimenter.experiments.models import Experiment, ExperimentVariant
@@ -33,6 +39,20 @@ class ExperimentVariantSerializer(serializers.ModelSerializer):
 
 
 class ExperimentSerializer(serializers.ModelSerializer):
+    # Model columns and relations read by fields which are not
+    # backed by a single column of the same name
+    FIELD_COLUMNS = {
+        "experiment_url": ("slug",),
+        "start_date": ("actual_start_date", "proposed_start_date"),
+        "population": (
+            "population_percent",
+            "firefox_channel",
+            "firefox_version",
+        ),
+        "variants": (),
+    }
+    FIELD_PREFETCHES = {"variants": ("variants",)}
+
     start_date = JSTimestampField()
     end_date = JSTimestampField()
     proposed_start_date = JSTimestampField()
@@ -45,6 +65,7 @@ class ExperimentSerializer(serializers.ModelSerializer):
             "type",
             "name",
             "slug",
+            "status",
             "short_description",
             "client_matching",
             "start_date",
@@ -64,3 +85,235 @@ class ExperimentSerializer(serializers.ModelSerializer):
             "proposed_duration",
             "variants",
         )
+
+    def __init__(self, *args, **kwargs):
+        field_names = kwargs.pop("field_names", None)
+        super().__init__(*args, **kwargs)
+
+        if field_names is not None:
+            for field_name in set(self.fields) - set(field_names):
+                self.fields.pop(field_name)
+
+    @classmethod
+    def setup_eager_loading(cls, queryset, field_names):
+        """
+        Restrict the queryset to the columns and prefetches that rendering
+        field_names requires, so unused large text fields and relations
+        are never loaded.
+        """
+        columns = set()
+        prefetches = set()
+
+        for field_name in field_names:
+            columns.update(cls.FIELD_COLUMNS.get(field_name, (field_name,)))
+            prefetches.update(cls.FIELD_PREFETCHES.get(field_name, ()))
+
+        return (
+            queryset.prefetch_related(None)
+            .only(*sorted(columns))
+            .prefetch_related(*sorted(prefetches))
+        )
+
+
+class PrefValueField(serializers.Field):
+    """
+    Serialize a variant value, which is stored as a JSON encoded string,
+    into the pref value it encodes.
+    """
+
+    def to_representation(self, obj):
+        try:
+            return json.loads(obj)
+        except (TypeError, ValueError):
+            return obj
+
+
+class ExperimentRecipeBranchSerializer(serializers.ModelSerializer):
+    value = PrefValueField()
+
+    class Meta:
+        model = ExperimentVariant
+        fields = ("slug", "ratio", "value")
+
+
+class ExperimentRecipeArgumentsSerializer(serializers.ModelSerializer):
+    experimentDocumentUrl = serializers.CharField(source="experiment_url")
+    preferenceName = serializers.CharField(source="pref_key")
+    preferenceType = serializers.CharField(source="pref_type")
+    preferenceBranchType = serializers.CharField(source="pref_branch")
+    branches = ExperimentRecipeBranchSerializer(many=True, source="variants")
+
+    class Meta:
+        model = Experiment
+        fields = (
+            "slug",
+            "experimentDocumentUrl",
+            "preferenceName",
+            "preferenceType",
+            "preferenceBranchType",
+            "branches",
+        )
+
+
+class ExperimentRecipeSerializer(serializers.ModelSerializer):
+    action_name = serializers.SerializerMethodField()
+    arguments = ExperimentRecipeArgumentsSerializer(source="*")
+
+    class Meta:
+        model = Experiment
+        fields = ("action_name", "name", "arguments")
+
+    def get_action_name(self, obj):
+        return "preference-experiment"
+
+
+class ExperimentValuesSerializer(object):
+    """
+    Build the same representation as ExperimentSerializer from .values()
+    rows instead of model instances.
+
+    The experiments are read with one query and their variants with one
+    query.  Plain columns reuse the to_representation of the matching
+    ExperimentSerializer field, while the computed fields are built
+    directly from the rows, which avoids instantiating models and running
+    the serializer field machinery for every experiment.
+    """
+
+    SLUG_PLACEHOLDER = "experiment-slug"
+
+    def __init__(self, queryset, field_names=None):
+        self.queryset = queryset.prefetch_related(None)
+        self.fields = ExperimentSerializer(field_names=field_names).fields
+
+    def get_columns(self):
+        columns = ["id"]
+
+        for field_name in self.fields:
+            for column in ExperimentSerializer.FIELD_COLUMNS.get(
+                field_name, (field_name,)
+            ):
+                if column not in columns:
+                    columns.append(column)
+
+        return columns
+
+    def get_variants(self, experiment_ids):
+        if "variants" not in self.fields:
+            return {}
+
+        variant_fields = self.fields["variants"].child.fields
+        rows = (
+            ExperimentVariant.objects.filter(experiment_id__in=experiment_ids)
+            .order_by("experiment_id", "id")
+            .values("experiment_id", *variant_fields)
+        )
+
+        return {
+            experiment_id: [
+                self.to_representation(variant_fields, row)
+                for row in experiment_rows
+            ]
+            for experiment_id, experiment_rows in groupby(
+                rows, lambda row: row["experiment_id"]
+            )
+        }
+
+    def to_representation(self, fields, row):
+        return {
+            field_name: (
+                None
+                if row[field_name] is None
+                else field.to_representation(row[field_name])
+            )
+            for field_name, field in fields.items()
+        }
+
+    def get_experiment_url_template(self):
+        url = urljoin(
+            "https://{host}".format(host=settings.HOSTNAME),
+            reverse(
+                "experiments-detail", kwargs={"slug": self.SLUG_PLACEHOLDER}
+            ),
+        )
+        return url.rsplit(self.SLUG_PLACEHOLDER, 1)
+
+    def get_value_getters(self, variants):
+        url_prefix, url_suffix = self.get_experiment_url_template()
+
+        def get_start_date(row):
+            return row["actual_start_date"] or row["proposed_start_date"]
+
+        def get_population(row):
+            return "{percent:g}% of {channel} Firefox {version}".format(
+                percent=float(row["population_percent"]),
+                version=row["firefox_version"],
+                channel=row["firefox_channel"],
+            )
+
+        computed_getters = {
+            "experiment_url": lambda row: (
+                url_prefix + row["slug"] + url_suffix
+            ),
+            "start_date": get_start_date,
+            "population": get_population,
+        }
+
+        getters = []
+        for field_name, field in self.fields.items():
+            if field_name == "variants":
+                getters.append(
+                    (field_name, lambda row: variants.get(row["id"], []), None)
+                )
+            else:
+                getters.append(
+                    (
+                        field_name,
+                        computed_getters.get(
+                            field_name, itemgetter(field_name)
+                        ),
+                        field.to_representation,
+                    )
+                )
+
+        return getters
+
+    def iter_representations(self):
+        """
+        Yield the id and representation of each experiment in the order of
+        the queryset.
+        """
+        rows = list(self.queryset.values(*self.get_columns()))
+        experiment_ids = [row["id"] for row in rows]
+
+        getters = self.get_value_getters(self.get_variants(experiment_ids))
+
+        for row in rows:
+            representation = {}
+
+            for field_name, getter, to_representation in getters:
+                value = getter(row)
+
+                if value is not None and to_representation is not None:
+                    value = to_representation(value)
+
+                representation[field_name] = value
+
+            yield row["id"], representation
+
+    @property
+    def data(self):
+        return [
+            representation
+            for experiment_id, representation in self.iter_representations()
+        ]
+
+
+class ExperimentStatusChangeSerializer(serializers.Serializer):
+    slug = serializers.SlugField()
+    message = serializers.CharField(required=False, allow_blank=True)
+
+
+class ExperimentSlugsSerializer(serializers.Serializer):
+    slugs = serializers.ListField(
+        child=serializers.SlugField(), min_length=1, max_length=1000
+    )
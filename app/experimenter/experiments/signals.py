@@ -0,0 +1,117 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from experimenter.experiments.cache import invalidate_serialized_experiment
+from experimenter.experiments.events import publish_experiment_changes
+from experimenter.experiments.models import (
+    Experiment,
+    ExperimentChangeLog,
+    ExperimentComment,
+    ExperimentVariant,
+)
+from experimenter.experiments.recipes import (
+    NO_RECIPE_STATUSES,
+    RECIPE_STATUSES,
+    delete_recipes,
+    generate_recipes,
+)
+from experimenter.experiments.stats import invalidate_experiment_stats
+from experimenter.projects.models import Project
+
+
+@receiver(post_save, sender=Experiment)
+@receiver(post_delete, sender=Experiment)
+def invalidate_experiment(sender, instance, **kwargs):
+    invalidate_serialized_experiment(instance.id)
+
+
+@receiver(post_save, sender=ExperimentVariant)
+@receiver(post_delete, sender=ExperimentVariant)
+@receiver(post_save, sender=ExperimentChangeLog)
+@receiver(post_delete, sender=ExperimentChangeLog)
+def invalidate_experiment_relation(sender, instance, **kwargs):
+    invalidate_serialized_experiment(instance.experiment_id)
+
+
+@receiver(post_save, sender=Experiment)
+@receiver(post_delete, sender=Experiment)
+@receiver(post_save, sender=ExperimentChangeLog)
+@receiver(post_delete, sender=ExperimentChangeLog)
+def invalidate_stats(sender, instance, **kwargs):
+    invalidate_experiment_stats()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_save, sender=Project)
+def invalidate_grouped_stats(sender, instance, created, **kwargs):
+    # The stats group experiments by their owner's email and project's slug,
+    # new owners and projects don't have any experiments yet
+    if not created:
+        invalidate_experiment_stats()
+
+
+@receiver(post_save, sender=ExperimentChangeLog)
+def publish_experiment_change(sender, instance, created, **kwargs):
+    if created:
+        publish_experiment_changes([instance.id])
+
+
+@receiver(post_save, sender=ExperimentChangeLog)
+def generate_experiment_recipe(sender, instance, created, **kwargs):
+    if not created:
+        return
+
+    if instance.new_status in RECIPE_STATUSES:
+        generate_recipes([instance.experiment_id])
+    elif instance.new_status in NO_RECIPE_STATUSES:
+        delete_recipes([instance.experiment_id])
+
+
+@receiver(post_save, sender=Experiment)
+def update_experiment_search_vector(sender, instance, **kwargs):
+    Experiment.objects.filter(id=instance.id).update_search_vectors()
+
+
+@receiver(post_save, sender=ExperimentComment)
+@receiver(post_delete, sender=ExperimentComment)
+def update_comment_search_vector(sender, instance, **kwargs):
+    Experiment.objects.filter(
+        id=instance.experiment_id
+    ).update_search_vectors()
+
+
+@receiver(pre_save, sender=Experiment)
+def set_experiment_dates(sender, instance, **kwargs):
+    instance.set_dates()
+
+
+@receiver(post_save, sender=ExperimentChangeLog)
+@receiver(post_delete, sender=ExperimentChangeLog)
+def update_experiment_dates(sender, instance, **kwargs):
+    Experiment.objects.filter(id=instance.experiment_id).update_dates()
+
+    # Keep the experiment the change was made through up to date
+    if ExperimentChangeLog.experiment.is_cached(instance):
+        instance.experiment.refresh_from_db(fields=Experiment.DATE_FIELDS)
+
+
+@receiver(pre_save, sender=Experiment)
+def set_experiment_completion(sender, instance, **kwargs):
+    instance.set_completion()
+
+
+@receiver(post_save, sender=ExperimentVariant)
+@receiver(post_delete, sender=ExperimentVariant)
+def update_experiment_completion(sender, instance, created=True, **kwargs):
+    # Only adding or removing variants can change the readiness to launch
+    if not created:
+        return
+
+    Experiment.objects.filter(id=instance.experiment_id).update_completion()
+
+    # Keep the experiment the variant was saved through up to date
+    if ExperimentVariant.experiment.is_cached(instance):
+        instance.experiment.refresh_from_db(
+            fields=Experiment.COMPLETION_FIELDS
+        )
@@ -0,0 +1,127 @@
+from collections import Counter, OrderedDict, defaultdict
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Q
+from django.db.models.functions import TruncWeek
+
+from experimenter.experiments.models import Experiment, ExperimentChangeLog
+
+
+EXPERIMENT_STATS_KEY = "experiments:stats"
+EXPERIMENT_STATS_TIMEOUT = 60 * 60 * 24
+
+# The stats key of each grouped experiment column
+EXPERIMENT_STATS_COLUMNS = OrderedDict(
+    [
+        ("status", "status"),
+        ("type", "type"),
+        ("firefox_channel", "firefox_channel"),
+        ("firefox_version", "firefox_version"),
+        ("project", "project__slug"),
+        ("owner", "owner__email"),
+    ]
+)
+
+LAUNCHED_CHANGE = Q(
+    old_status=Experiment.STATUS_ACCEPTED, new_status=Experiment.STATUS_LIVE
+)
+COMPLETED_CHANGE = Q(
+    old_status=Experiment.STATUS_LIVE, new_status=Experiment.STATUS_COMPLETE
+)
+
+
+def get_experiment_counts():
+    """
+    Count the experiments by each of the stats columns from a single GROUP
+    BY over all of the columns, which has at most one row per distinct
+    combination rather than one per experiment.
+    """
+    columns = list(EXPERIMENT_STATS_COLUMNS.values())
+    counts = {name: Counter() for name in EXPERIMENT_STATS_COLUMNS}
+    total = 0
+
+    rows = (
+        Experiment.objects.order_by()
+        .values_list(*columns)
+        .annotate(count=Count("id"))
+    )
+
+    for *values, count in rows:
+        total += count
+
+        for name, value in zip(EXPERIMENT_STATS_COLUMNS, values):
+            counts[name][value] += count
+
+    stats = OrderedDict([("total", total)])
+
+    for name, counter in counts.items():
+        stats[name] = [
+            OrderedDict([(name, value), ("count", count)])
+            for value, count in sorted(
+                counter.items(), key=lambda item: (-item[1], str(item[0]))
+            )
+        ]
+
+    return stats
+
+
+def get_weekly_counts():
+    """
+    Count the experiments launched and completed in each week, starting on
+    Mondays.
+    """
+    weeks = defaultdict(Counter)
+
+    rows = (
+        ExperimentChangeLog.objects.filter(LAUNCHED_CHANGE | COMPLETED_CHANGE)
+        .annotate(week=TruncWeek("changed_on"))
+        .order_by()
+        .values_list("week", "new_status")
+        .annotate(count=Count("experiment", distinct=True))
+    )
+
+    for week, new_status, count in rows:
+        weeks[week.date()][new_status] += count
+
+    return [
+        OrderedDict(
+            [
+                ("week", week.isoformat()),
+                ("launched", weeks[week][Experiment.STATUS_LIVE]),
+                ("completed", weeks[week][Experiment.STATUS_COMPLETE]),
+            ]
+        )
+        for week in sorted(weeks)
+    ]
+
+
+def get_experiment_stats():
+    """
+    Return the experiment counts by status, type, channel, version, project
+    and owner along with the experiments launched and completed per week.
+
+    The stats are cached until an experiment, changelog entry, owner or
+    project changes.
+    """
+    stats = cache.get(EXPERIMENT_STATS_KEY)
+
+    if stats is None:
+        stats = get_experiment_counts()
+        stats["weekly"] = get_weekly_counts()
+        cache.set(EXPERIMENT_STATS_KEY, stats, EXPERIMENT_STATS_TIMEOUT)
+
+    return stats
+
+
+def delete_experiment_stats():
+    cache.delete(EXPERIMENT_STATS_KEY)
+
+
+def invalidate_experiment_stats():
+    """
+    Delete the cached stats once the current transaction commits, so a
+    concurrent request can't cache the stats as they were before the
+    commit.
+    """
+    transaction.on_commit(delete_experiment_stats)
@@ -1,3 +1,4 @@
+import datetime
 import json
 import mock
 
@@ -25,6 +26,49 @@ class MockBugzillaMixin(object):
         self.mock_bugzilla_requests_post.return_value = mock_response
 
 
+class ExperimentImportRowMixin(object):
+
+    def get_import_row(self, name, **kwargs):
+        row = {
+            "type": "pref",
+            "name": name,
+            "short_description": "An imported experiment",
+            "data_science_bugzilla_url": (
+                "https://bugzilla.mozilla.org/show_bug.cgi?id=12345"
+            ),
+            "proposed_start_date": (
+                datetime.date.today() + datetime.timedelta(days=1)
+            ).isoformat(),
+            "proposed_duration": 30,
+            "proposed_enrollment": 10,
+            "population_percent": "10.0",
+            "firefox_version": "57.0",
+            "firefox_channel": "Nightly",
+            "client_matching": "Everyone",
+            "pref_key": "browser.imported.enabled",
+            "pref_type": "boolean",
+            "pref_branch": "default",
+            "variants": [
+                {
+                    "name": "Control",
+                    "description": "Disabled",
+                    "ratio": 50,
+                    "is_control": True,
+                    "value": False,
+                },
+                {
+                    "name": "Treatment",
+                    "description": "Enabled",
+                    "ratio": 50,
+                    "is_control": False,
+                    "value": True,
+                },
+            ],
+        }
+        row.update(kwargs)
+        return row
+
+
 class MockMailMixin(object):
 
     def setUp(self):
@@ -1,17 +1,39 @@
+import datetime
 import json
 
+import mock
+import msgpack
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+from rest_framework.renderers import JSONRenderer
 
-from experimenter.experiments.models import Experiment
+from experimenter.experiments.api_views import (
+    ExperimentChangesView,
+    ExperimentExportView,
+)
+from experimenter.experiments.models import Experiment, ExperimentRecipe
 from experimenter.experiments.serializers import ExperimentSerializer
-from experimenter.experiments.tests.factories import ExperimentFactory
+from experimenter.experiments.tests.factories import (
+    ExperimentChangeLogFactory,
+    ExperimentFactory,
+)
+from experimenter.experiments.tests.mixins import ExperimentImportRowMixin
+from experimenter.openidc.tests.factories import UserFactory
 from experimenter.projects.tests.factories import ProjectFactory
 
 
 class TestExperimentListView(TestCase):
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def test_list_view_serializes_experiments(self):
         experiments = []
 
@@ -25,7 +47,7 @@ class TestExperimentListView(TestCase):
         json_data = json.loads(response.content)
 
         serialized_experiments = ExperimentSerializer(
-            Experiment.objects.all(), many=True
+            Experiment.objects.order_by("id"), many=True
         ).data
 
         self.assertEqual(serialized_experiments, json_data)
@@ -53,7 +75,7 @@ class TestExperimentListView(TestCase):
         json_data = json.loads(response.content)
 
         serialized_experiments = ExperimentSerializer(
-            project.experiments.all(), many=True
+            project.experiments.order_by("id"), many=True
         ).data
 
         self.assertEqual(serialized_experiments, json_data)
@@ -81,15 +103,742 @@ class TestExperimentListView(TestCase):
         json_data = json.loads(response.content)
 
         serialized_experiments = ExperimentSerializer(
-            Experiment.objects.filter(status=Experiment.STATUS_REVIEW),
+            Experiment.objects.filter(
+                status=Experiment.STATUS_REVIEW
+            ).order_by("id"),
             many=True,
         ).data
 
         self.assertEqual(serialized_experiments, json_data)
 
+    def get_filtered_slugs(self, params):
+        response = self.client.get(
+            reverse("experiments-api-list"), dict(params, fields="slug")
+        )
+        self.assertEqual(response.status_code, 200)
+        return sorted(
+            experiment["slug"] for experiment in json.loads(response.content)
+        )
+
+    def test_list_view_filters_by_experiment_fields(self):
+        owner = UserFactory.create()
+        experiment = ExperimentFactory.create_with_variants(
+            type=Experiment.TYPE_ADDON,
+            firefox_channel=Experiment.CHANNEL_BETA,
+            firefox_version="57.0",
+            archived=True,
+            owner=owner,
+        )
+        ExperimentFactory.create_with_variants(
+            type=Experiment.TYPE_PREF,
+            firefox_channel=Experiment.CHANNEL_NIGHTLY,
+            firefox_version="58.0",
+            archived=False,
+        )
+
+        for params in (
+            {"type": Experiment.TYPE_ADDON},
+            {"firefox_channel": Experiment.CHANNEL_BETA},
+            {"firefox_version": "57.0"},
+            {"archived": "true"},
+            {"owner": owner.email},
+            {"type": Experiment.TYPE_ADDON, "archived": "true"},
+        ):
+            self.assertEqual(
+                self.get_filtered_slugs(params), [experiment.slug]
+            )
+
+        self.assertEqual(
+            self.get_filtered_slugs(
+                {"type": Experiment.TYPE_ADDON, "archived": "false"}
+            ),
+            [],
+        )
+
+    def test_list_view_searches_experiments_by_rank(self):
+        related = ExperimentFactory.create_with_variants(
+            related_work="Earlier echidna studies"
+        )
+        named = ExperimentFactory.create_with_variants(name="Echidna Study")
+        ExperimentFactory.create_with_variants()
+
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            {"search": "echidna", "fields": "slug"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            [{"slug": named.slug}, {"slug": related.slug}],
+        )
+
+    def test_list_view_returns_experiments_in_slug_order(self):
+        experiments = [
+            ExperimentFactory.create_with_variants() for i in range(3)
+        ]
+        slugs = [experiments[2].slug, "unknown", experiments[0].slug]
+
+        self.assertEqual(
+            json.loads(
+                self.client.get(
+                    reverse("experiments-api-list"),
+                    {"slug__in": ",".join(slugs), "fields": "slug"},
+                ).content
+            ),
+            [{"slug": experiments[2].slug}, {"slug": experiments[0].slug}],
+        )
+
+    def test_list_view_rejects_invalid_filters(self):
+        response = self.client.get(
+            reverse("experiments-api-list"), {"type": "unknown"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_view_filters_by_proposed_start_date_range(self):
+        experiment1 = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 1, 1)
+        )
+        experiment2 = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 2, 1)
+        )
+
+        self.assertEqual(
+            self.get_filtered_slugs(
+                {"proposed_start_date_after": "2019-01-15"}
+            ),
+            [experiment2.slug],
+        )
+        self.assertEqual(
+            self.get_filtered_slugs(
+                {"proposed_start_date_before": "2019-01-01"}
+            ),
+            [experiment1.slug],
+        )
+
+    def test_list_view_filters_by_computed_start_and_end_dates(self):
+        launched = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 1, 1),
+            proposed_duration=10,
+            proposed_enrollment=5,
+        )
+        ExperimentChangeLogFactory.create(
+            experiment=launched,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=datetime.datetime(2019, 3, 1, 12, 0),
+        )
+        proposed = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 2, 1),
+            proposed_duration=10,
+            proposed_enrollment=None,
+        )
+
+        self.assertEqual(
+            self.get_filtered_slugs(
+                {
+                    "start_date_after": "2019-01-15",
+                    "start_date_before": "2019-02-15",
+                }
+            ),
+            [proposed.slug],
+        )
+        self.assertEqual(
+            self.get_filtered_slugs({"start_date_after": "2019-03-01"}),
+            [launched.slug],
+        )
+        self.assertEqual(
+            self.get_filtered_slugs(
+                {
+                    "start_date_after": "2019-01-01",
+                    "end_date_before": "2019-02-11",
+                }
+            ),
+            [proposed.slug],
+        )
+        self.assertEqual(
+            self.get_filtered_slugs({"end_date_after": "2019-03-11"}),
+            [launched.slug],
+        )
+        self.assertEqual(
+            self.get_filtered_slugs(
+                {
+                    "enrollment_end_date_after": "2019-03-06",
+                    "enrollment_end_date_before": "2019-03-06",
+                }
+            ),
+            [launched.slug],
+        )
+
+    def test_list_view_filters_by_completion(self):
+        ready = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW,
+            **{field: True for field in Experiment.REQUIRED_REVIEW_FIELDS},
+        )
+        unreviewed = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        draft = ExperimentFactory.create(
+            objectives=Experiment.OBJECTIVES_DEFAULT
+        )
+
+        self.assertEqual(
+            self.get_filtered_slugs(
+                {
+                    "status": Experiment.STATUS_REVIEW,
+                    "completed_required_reviews": "false",
+                }
+            ),
+            [unreviewed.slug],
+        )
+        self.assertEqual(
+            self.get_filtered_slugs({"is_ready_to_launch": "true"}),
+            [ready.slug],
+        )
+        self.assertEqual(
+            self.get_filtered_slugs({"completed_objectives": "false"}),
+            [draft.slug],
+        )
+
+    def test_list_view_assembles_response_from_cached_experiments(self):
+        for i in range(3):
+            ExperimentFactory.create_with_status(Experiment.STATUS_LIVE)
+
+        expected_content = JSONRenderer().render(
+            ExperimentSerializer(
+                Experiment.objects.order_by("id"), many=True
+            ).data
+        )
+
+        response = self.client.get(reverse("experiments-api-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/json")
+        self.assertEqual(response.content, expected_content)
+
+        # Once cached only the validators and the ids are queried
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("experiments-api-list"))
+        self.assertEqual(response.content, expected_content)
+
+    def test_list_view_serializes_requested_fields(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        with self.assertNumQueries(3):
+            response = self.client.get(
+                reverse("experiments-api-list"),
+                {"fields": "slug,status,pref_key,variants"},
+            )
+        self.assertEqual(response.status_code, 200)
+
+        json_data = json.loads(response.content)
+
+        serialized_experiments = ExperimentSerializer(
+            [experiment],
+            many=True,
+            field_names=["slug", "status", "pref_key", "variants"],
+        ).data
+
+        self.assertEqual(serialized_experiments, json_data)
+
+    def test_list_view_omits_requested_fields(self):
+        ExperimentFactory.create_with_variants()
+
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            {"fields": "slug,objectives,analysis", "omit": "analysis"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        json_data = json.loads(response.content)
+        self.assertEqual(set(json_data[0].keys()), set(["slug", "objectives"]))
+
+    def test_list_view_rejects_unknown_fields(self):
+        response = self.client.get(
+            reverse("experiments-api-list"), {"fields": "slug,owner"}
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            json.loads(response.content), {"fields": ["Unknown fields: owner"]}
+        )
+
+    def test_list_view_pages_through_experiments_with_cursor(self):
+        now = datetime.datetime.now()
+        unchanged_experiment = ExperimentFactory.create_with_variants()
+
+        changed_experiments = []
+        for i in range(4):
+            experiment = ExperimentFactory.create_with_variants()
+            ExperimentChangeLogFactory.create(
+                experiment=experiment,
+                old_status=None,
+                new_status=Experiment.STATUS_DRAFT,
+                changed_on=(now - datetime.timedelta(days=10 - i)),
+            )
+            changed_experiments.append(experiment)
+
+        pages = []
+        url = reverse("experiments-api-list") + "?page_size=2"
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+
+            json_data = json.loads(response.content)
+            pages.append([e["slug"] for e in json_data["results"]])
+            url = json_data["next"]
+
+            if url:
+                self.assertEqual(
+                    response["Link"], '<{url}>; rel="next"'.format(url=url)
+                )
+            else:
+                self.assertFalse(response.has_header("Link"))
+
+        self.assertEqual(
+            pages,
+            [
+                [changed_experiments[0].slug, changed_experiments[1].slug],
+                [changed_experiments[2].slug, changed_experiments[3].slug],
+                [unchanged_experiment.slug],
+            ],
+        )
+
+    def test_list_view_renders_msgpack(self):
+        for i in range(2):
+            ExperimentFactory.create_with_variants()
+
+        url = reverse("experiments-api-list")
+        json_response = self.client.get(url)
+        msgpack_response = self.client.get(
+            url, HTTP_ACCEPT="application/msgpack"
+        )
+
+        self.assertEqual(msgpack_response.status_code, 200)
+        self.assertEqual(
+            msgpack_response["Content-Type"], "application/msgpack"
+        )
+        self.assertEqual(
+            msgpack.unpackb(msgpack_response.content, raw=False),
+            json.loads(json_response.content),
+        )
+        self.assertIn("Accept", msgpack_response["Vary"])
+        self.assertNotEqual(msgpack_response["ETag"], json_response["ETag"])
+
+    def test_list_view_renders_ndjson_pages(self):
+        experiments = [
+            ExperimentFactory.create_with_variants() for i in range(2)
+        ]
+
+        response = self.client.get(
+            reverse("experiments-api-list") + "?page_size=1&format=ndjson"
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        [line] = response.content.splitlines()
+        self.assertEqual(
+            json.loads(line)["slug"],
+            sorted(experiments, key=lambda e: e.id)[0].slug,
+        )
+        self.assertIn('rel="next"', response["Link"])
+
+    def test_list_view_pages_requested_fields(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            {"page_size": 10, "fields": "slug"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            {"next": None, "results": [{"slug": experiment.slug}]},
+        )
+
+    def test_list_view_returns_404_for_invalid_cursor(self):
+        ExperimentFactory.create_with_variants()
+
+        response = self.client.get(
+            reverse("experiments-api-list"), {"cursor": "invalid"}
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_list_view_returns_not_modified_for_matching_etag(self):
+        experiment = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(experiment=experiment)
+
+        response = self.client.get(reverse("experiments-api-list"))
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse("experiments-api-list"), HTTP_IF_NONE_MATCH=etag
+            )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response["ETag"], etag)
+
+    def test_list_view_etag_changes_when_experiments_change(self):
+        experiment = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(experiment=experiment)
+
+        response = self.client.get(reverse("experiments-api-list"))
+        etag = response["ETag"]
+
+        ExperimentChangeLogFactory.create(experiment=experiment)
+
+        response = self.client.get(
+            reverse("experiments-api-list"), HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+        ExperimentFactory.create_with_variants()
+
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            HTTP_IF_NONE_MATCH=response["ETag"],
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_list_view_is_not_validated_by_modification_time(self):
+        accepted = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        ExperimentFactory.create_with_status(Experiment.STATUS_REVIEW)
+        Experiment.objects.filter(id=accepted.id).update(
+            last_changed_on=datetime.datetime(2019, 1, 2, tzinfo=timezone.utc)
+        )
+        Experiment.objects.exclude(id=accepted.id).update(
+            last_changed_on=datetime.datetime(2019, 1, 1, tzinfo=timezone.utc)
+        )
+
+        params = {"status": Experiment.STATUS_REVIEW}
+        response = self.client.get(reverse("experiments-api-list"), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("Last-Modified"))
+
+        # Leaving the list doesn't move the latest change of the list
+        # forward, so only the ETag can tell the list changed
+        Experiment.objects.filter(id=accepted.id).update(
+            status=Experiment.STATUS_ACCEPTED
+        )
+
+        response = self.client.get(
+            reverse("experiments-api-list"),
+            params,
+            HTTP_IF_MODIFIED_SINCE="Wed, 02 Jan 2019 00:00:00 GMT",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)), 1)
+
+    def test_list_view_omits_validators_for_empty_list(self):
+        response = self.client.get(reverse("experiments-api-list"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.has_header("ETag"))
+        self.assertFalse(response.has_header("Last-Modified"))
+
+
+class TestExperimentBatchView(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_batch_view_returns_posted_experiments_in_order(self):
+        experiments = [
+            ExperimentFactory.create_with_variants() for i in range(3)
+        ]
+        slugs = [experiments[2].slug, experiments[0].slug]
+
+        with self.assertNumQueries(3):
+            response = self.client.post(
+                reverse("experiments-api-batch"),
+                data=json.dumps({"slugs": slugs}),
+                content_type="application/json",
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            ExperimentSerializer(
+                [experiments[2], experiments[0]], many=True
+            ).data,
+        )
+
+    def test_batch_view_selects_fields(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        response = self.client.post(
+            "{url}?fields=slug".format(url=reverse("experiments-api-batch")),
+            data=json.dumps({"slugs": [experiment.slug, "unknown"]}),
+            content_type="application/json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content), [{"slug": experiment.slug}]
+        )
+
+    def test_batch_view_rejects_invalid_slugs(self):
+        for data in ({}, {"slugs": []}, {"slugs": ["not a slug"]}):
+            response = self.client.post(
+                reverse("experiments-api-batch"),
+                data=json.dumps(data),
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, 400)
+
+    def test_batch_view_only_accepts_post(self):
+        response = self.client.get(reverse("experiments-api-batch"))
+        self.assertEqual(response.status_code, 405)
+
+
+class TestExperimentExportView(TestCase):
+
+    def get_lines(self, response):
+        return [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).splitlines()
+        ]
+
+    def test_export_view_streams_one_experiment_per_line(self):
+        for i in range(5):
+            ExperimentFactory.create_with_variants()
+
+        with mock.patch.object(ExperimentExportView, "chunk_size", 2):
+            response = self.client.get(reverse("experiments-api-export"))
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+            # Each chunk of experiments is loaded with a fixed number
+            # of queries regardless of how many experiments there are
+            with self.assertNumQueries(3 * 2 + 1):
+                lines = self.get_lines(response)
+
+        serialized_experiments = ExperimentSerializer(
+            Experiment.objects.order_by("id"), many=True
+        ).data
+
+        self.assertEqual(serialized_experiments, lines)
+
+    def test_export_view_filters_and_selects_fields(self):
+        for i in range(2):
+            ExperimentFactory.create_with_variants()
+
+        experiment = ExperimentFactory.create_with_variants()
+        experiment.status = experiment.STATUS_REVIEW
+        experiment.save()
+
+        response = self.client.get(
+            reverse("experiments-api-export"),
+            {"status": Experiment.STATUS_REVIEW, "fields": "slug,status"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            self.get_lines(response),
+            [{"slug": experiment.slug, "status": experiment.STATUS_REVIEW}],
+        )
+
+    def test_export_view_rejects_unknown_fields(self):
+        response = self.client.get(
+            reverse("experiments-api-export"), {"fields": "unknown"}
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class TestExperimentChangesView(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def create_changed_experiment(self, changed_on, **kwargs):
+        experiment = ExperimentFactory.create_with_variants(**kwargs)
+        ExperimentChangeLogFactory.create(
+            experiment=experiment, changed_on=changed_on
+        )
+        return experiment
+
+    def test_changes_view_returns_experiments_changed_since(self):
+        since = datetime.datetime(2019, 1, 1, tzinfo=datetime.timezone.utc)
+
+        self.create_changed_experiment(since - datetime.timedelta(days=1))
+        self.create_changed_experiment(since)
+        changed_experiment = self.create_changed_experiment(
+            since + datetime.timedelta(days=1)
+        )
+        archived_experiment = self.create_changed_experiment(
+            since + datetime.timedelta(days=2), archived=True
+        )
+        rejected_experiment = self.create_changed_experiment(
+            since + datetime.timedelta(days=3),
+            status=Experiment.STATUS_REJECTED,
+        )
+
+        response = self.client.get(
+            reverse("experiments-api-changes"), {"since": since.isoformat()}
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "watermark": "2019-01-04T00:00:00+00:00",
+                "deleted": [
+                    archived_experiment.slug,
+                    rejected_experiment.slug,
+                ],
+                "experiments": [
+                    ExperimentSerializer(
+                        Experiment.objects.get(id=changed_experiment.id)
+                    ).data
+                ],
+            },
+        )
+
+    def test_changes_view_holds_watermark_back_for_late_commits(self):
+        now = timezone.now()
+        committed = self.create_changed_experiment(
+            now - datetime.timedelta(seconds=10)
+        )
+
+        response = self.client.get(
+            reverse("experiments-api-changes"),
+            {"since": (now - datetime.timedelta(hours=1)).isoformat()},
+        )
+        content = json.loads(response.content)
+        self.assertEqual(
+            [experiment["slug"] for experiment in content["experiments"]],
+            [committed.slug],
+        )
+        watermark = parse_datetime(content["watermark"])
+        self.assertLess(
+            watermark,
+            now
+            - ExperimentChangesView.commit_window
+            + datetime.timedelta(seconds=1),
+        )
+
+        # A change stamped earlier than the returned one commits after the
+        # response, both are returned by the next call
+        late = self.create_changed_experiment(
+            now - datetime.timedelta(seconds=20)
+        )
+
+        response = self.client.get(
+            reverse("experiments-api-changes"),
+            {"since": watermark.isoformat()},
+        )
+        content = json.loads(response.content)
+        self.assertEqual(
+            [experiment["slug"] for experiment in content["experiments"]],
+            [late.slug, committed.slug],
+        )
+
+    def test_changes_view_returns_since_as_watermark_without_changes(self):
+        self.create_changed_experiment(datetime.datetime(2018, 1, 1))
+
+        response = self.client.get(
+            reverse("experiments-api-changes"),
+            {"since": "2019-01-01T00:00:00"},
+        )
+        self.assertEqual(response.status_code, 200)
+
+        self.assertEqual(
+            json.loads(response.content),
+            {
+                "watermark": "2019-01-01T00:00:00+00:00",
+                "deleted": [],
+                "experiments": [],
+            },
+        )
+
+    def test_changes_view_returns_all_experiments_without_since(self):
+        changed_experiment = self.create_changed_experiment(
+            datetime.datetime(2019, 1, 1, tzinfo=datetime.timezone.utc)
+        )
+        unchanged_experiment = ExperimentFactory.create_with_variants()
+
+        response = self.client.get(reverse("experiments-api-changes"))
+        self.assertEqual(response.status_code, 200)
+
+        json_data = json.loads(response.content)
+        self.assertEqual(json_data["watermark"], "2019-01-01T00:00:00+00:00")
+        self.assertEqual(
+            [experiment["slug"] for experiment in json_data["experiments"]],
+            [changed_experiment.slug, unchanged_experiment.slug],
+        )
+
+    def test_changes_view_renders_msgpack(self):
+        experiment = self.create_changed_experiment(
+            datetime.datetime(2019, 1, 1, tzinfo=datetime.timezone.utc)
+        )
+
+        url = reverse("experiments-api-changes")
+        json_response = self.client.get(url)
+        msgpack_response = self.client.get(url, {"format": "msgpack"})
+
+        self.assertEqual(msgpack_response.status_code, 200)
+
+        data = msgpack.unpackb(msgpack_response.content, raw=False)
+        self.assertEqual(data, json.loads(json_response.content))
+        self.assertEqual(data["experiments"][0]["slug"], experiment.slug)
+
+    def test_changes_view_rejects_invalid_since(self):
+        for since in ("yesterday", "2019-13-01T00:00:00"):
+            response = self.client.get(
+                reverse("experiments-api-changes"), {"since": since}
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(
+                json.loads(response.content),
+                {"since": ["Invalid ISO 8601 timestamp"]},
+            )
+
+
+class TestExperimentEventsView(TestCase):
+
+    def test_events_view_is_not_served_under_wsgi(self):
+        response = self.client.get(
+            reverse("experiments-api-events"), HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        self.assertEqual(response.status_code, 501)
+        self.assertIn("text/event-stream", response["Content-Type"])
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertTrue(response.content.startswith(b"event: error\n"))
+
+
+class TestExperimentStatsView(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_stats_view_returns_stats(self):
+        ExperimentFactory.create(status=Experiment.STATUS_DRAFT)
+
+        response = self.client.get(reverse("experiments-api-stats"))
+        self.assertEqual(response.status_code, 200)
+
+        json_data = json.loads(response.content)
+        self.assertEqual(json_data["total"], 1)
+        self.assertEqual(
+            json_data["status"],
+            [{"status": Experiment.STATUS_DRAFT, "count": 1}],
+        )
+        self.assertEqual(json_data["weekly"], [])
+
 
 class TestExperimentDetailView(TestCase):
 
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
     def test_get_experiment_returns_experiment_info(self):
         user_email = "user@example.com"
 
@@ -110,6 +859,152 @@ class TestExperimentDetailView(TestCase):
 
         self.assertEqual(serialized_experiment, json_data)
 
+    def test_get_experiment_returns_not_modified_since_latest_change(self):
+        experiment = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            changed_on=datetime.datetime(2019, 1, 1, 12, 0, 0),
+        )
+        url = reverse(
+            "experiments-api-detail", kwargs={"slug": experiment.slug}
+        )
+
+        headers = {settings.OPENIDC_EMAIL_HEADER: "user@example.com"}
+
+        response = self.client.get(url, **headers)
+        self.assertEqual(
+            response["Last-Modified"], "Tue, 01 Jan 2019 12:00:00 GMT"
+        )
+
+        response = self.client.get(
+            url,
+            HTTP_IF_MODIFIED_SINCE="Tue, 01 Jan 2019 12:00:00 GMT",
+            **headers,
+        )
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(
+            url,
+            HTTP_IF_MODIFIED_SINCE="Mon, 31 Dec 2018 12:00:00 GMT",
+            **headers,
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_experiment_returns_not_modified_for_matching_etag(self):
+        user_email = "user@example.com"
+
+        experiment = ExperimentFactory.create_with_variants()
+        other_experiment = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(experiment=experiment)
+
+        url = reverse(
+            "experiments-api-detail", kwargs={"slug": experiment.slug}
+        )
+
+        response = self.client.get(
+            url, **{settings.OPENIDC_EMAIL_HEADER: user_email}
+        )
+        self.assertEqual(response.status_code, 200)
+        etag = response["ETag"]
+
+        ExperimentChangeLogFactory.create(experiment=other_experiment)
+
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=etag,
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+        self.assertEqual(response.status_code, 304)
+
+        ExperimentChangeLogFactory.create(experiment=experiment)
+
+        response = self.client.get(
+            url,
+            HTTP_IF_NONE_MATCH=etag,
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_get_experiment_returns_requested_fields(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        response = self.client.get(
+            reverse(
+                "experiments-api-detail", kwargs={"slug": experiment.slug}
+            ),
+            {"fields": "slug,status"},
+            **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            {"slug": experiment.slug, "status": experiment.status},
+        )
+
+    def test_get_experiment_renders_msgpack(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        response = self.client.get(
+            reverse(
+                "experiments-api-detail", kwargs={"slug": experiment.slug}
+            ),
+            HTTP_ACCEPT="application/msgpack",
+            **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            msgpack.unpackb(response.content, raw=False),
+            json.loads(
+                JSONRenderer().render(ExperimentSerializer(experiment).data)
+            ),
+        )
+
+    def test_get_unknown_experiment_returns_404(self):
+        response = self.client.get(
+            reverse("experiments-api-detail", kwargs={"slug": "unknown"}),
+            **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class TestExperimentRecipeView(TestCase):
+
+    def test_recipe_view_returns_stored_recipe(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_SHIP
+        )
+        recipe = experiment.recipe
+        url = reverse(
+            "experiments-api-recipe", kwargs={"slug": experiment.slug}
+        )
+
+        with self.assertNumQueries(1):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content.decode(), recipe.content)
+        self.assertEqual(response["ETag"], recipe.etag)
+        self.assertIn("max-age=300", response["Cache-Control"])
+        self.assertIn("public", response["Cache-Control"])
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=recipe.etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_recipe_view_returns_404_without_recipe(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+
+        response = self.client.get(
+            reverse("experiments-api-recipe", kwargs={"slug": experiment.slug})
+        )
+
+        self.assertEqual(response.status_code, 404)
+
 
 class TestExperimentAcceptView(TestCase):
 
@@ -149,6 +1044,40 @@ class TestExperimentAcceptView(TestCase):
 
         self.assertEqual(response.status_code, 404)
 
+    def test_accept_updates_only_status_and_succeeds_once(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        url = reverse(
+            "experiments-api-accept", kwargs={"slug": experiment.slug}
+        )
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch(
+                url, **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"}
+            )
+
+        self.assertEqual(response.status_code, 200)
+
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+        self.assertEqual(len(updates), 2)
+        self.assertIn("SET status = 'Accepted' WHERE", updates[0])
+        # The change log maintains the stored dates with a single UPDATE
+        self.assertIn('SET "last_changed_on" =', updates[1])
+
+        response = self.client.patch(
+            url, **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"}
+        )
+
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(
+            Experiment.objects.get(id=experiment.id).changes.count(), 3
+        )
+
 
 class TestExperimentRejectView(TestCase):
 
@@ -191,3 +1120,154 @@ class TestExperimentRejectView(TestCase):
         )
 
         self.assertEqual(response.status_code, 404)
+
+
+class TestExperimentBulkStatusUpdateViews(TestCase):
+
+    def test_bulk_accept_accepts_experiments_in_review(self):
+        user_email = "user@example.com"
+
+        experiment1 = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        experiment2 = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        draft_experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT
+        )
+
+        with self.assertNumQueries(11):
+            response = self.client.patch(
+                reverse("experiments-api-bulk-accept"),
+                data=json.dumps(
+                    [
+                        {"slug": experiment1.slug, "message": "Looks good"},
+                        {"slug": draft_experiment.slug},
+                        {"slug": experiment2.slug},
+                    ]
+                ),
+                content_type="application/json",
+                **{settings.OPENIDC_EMAIL_HEADER: user_email},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            [
+                {"slug": experiment1.slug, "success": True},
+                {"slug": draft_experiment.slug, "success": False},
+                {"slug": experiment2.slug, "success": True},
+            ],
+        )
+
+        for experiment, message in (
+            (experiment1, "Looks good"),
+            (experiment2, ""),
+        ):
+            experiment = Experiment.objects.get(id=experiment.id)
+            self.assertEqual(experiment.status, Experiment.STATUS_ACCEPTED)
+
+            change = experiment.changes.latest()
+            self.assertEqual(experiment.last_changed_on, change.changed_on)
+            self.assertEqual(change.old_status, Experiment.STATUS_REVIEW)
+            self.assertEqual(change.new_status, Experiment.STATUS_ACCEPTED)
+            self.assertEqual(change.changed_by.email, user_email)
+            self.assertEqual(change.message, message)
+            self.assertTrue(
+                ExperimentRecipe.objects.filter(experiment=experiment).exists()
+            )
+
+        draft_experiment = Experiment.objects.get(id=draft_experiment.id)
+        self.assertEqual(draft_experiment.status, Experiment.STATUS_DRAFT)
+        self.assertEqual(draft_experiment.changes.count(), 1)
+        self.assertFalse(
+            ExperimentRecipe.objects.filter(
+                experiment=draft_experiment
+            ).exists()
+        )
+
+    def test_bulk_reject_rejects_experiments_in_review(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+
+        with mock.patch(
+            "experimenter.experiments.api_views.invalidate_experiment_stats"
+        ) as mock_invalidate:
+            response = self.client.patch(
+                reverse("experiments-api-bulk-reject"),
+                data=json.dumps(
+                    [{"slug": experiment.slug, "message": "Not ready"}]
+                ),
+                content_type="application/json",
+                **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            [{"slug": experiment.slug, "success": True}],
+        )
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(experiment.status, Experiment.STATUS_REJECTED)
+        self.assertEqual(experiment.changes.latest().message, "Not ready")
+        mock_invalidate.assert_called_once_with()
+
+    def test_bulk_accept_rejects_invalid_body(self):
+        response = self.client.patch(
+            reverse("experiments-api-bulk-accept"),
+            data=json.dumps([{"message": "No slug"}]),
+            content_type="application/json",
+            **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+
+class TestExperimentImportView(ExperimentImportRowMixin, TestCase):
+
+    def test_import_view_imports_rows_and_reports_errors(self):
+        user_email = "user@example.com"
+
+        response = self.client.post(
+            reverse("experiments-api-import"),
+            data=json.dumps(
+                [
+                    self.get_import_row("Imported"),
+                    self.get_import_row("Imported"),
+                ]
+            ),
+            content_type="application/json",
+            **{settings.OPENIDC_EMAIL_HEADER: user_email},
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            json.loads(response.content),
+            [
+                {"row": 0, "success": True, "slug": "imported"},
+                {
+                    "row": 1,
+                    "success": False,
+                    "errors": {"name": ["This name is already in use."]},
+                },
+            ],
+        )
+
+        experiment = Experiment.objects.get(slug="imported")
+        self.assertEqual(experiment.variants.count(), 2)
+        self.assertEqual(experiment.changes.get().changed_by.email, user_email)
+
+    def test_import_view_rejects_invalid_body(self):
+        for data in ([], {"name": "Imported"}, ["Imported"]):
+            response = self.client.post(
+                reverse("experiments-api-import"),
+                data=json.dumps(data),
+                content_type="application/json",
+                **{settings.OPENIDC_EMAIL_HEADER: "user@example.com"},
+            )
+            self.assertEqual(response.status_code, 400)
+
+        self.assertFalse(Experiment.objects.exists())
@@ -0,0 +1,146 @@
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TransactionTestCase
+from rest_framework.renderers import JSONRenderer
+
+from experimenter.experiments.cache import (
+    get_serialized_experiment_key,
+    get_serialized_experiments,
+)
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.serializers import ExperimentSerializer
+from experimenter.experiments.tests.factories import (
+    ExperimentChangeLogFactory,
+    ExperimentFactory,
+)
+
+
+class TestSerializedExperimentCache(TransactionTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def get_serialized_experiments(self):
+        experiments = (
+            Experiment.objects.all()
+            .order_by("id")
+            .only("id", "last_changed_on")
+        )
+        return get_serialized_experiments(
+            experiments, Experiment.objects.all()
+        )
+
+    def get_expected_experiments(self):
+        return [
+            JSONRenderer().render(ExperimentSerializer(experiment).data)
+            for experiment in Experiment.objects.all().order_by("id")
+        ]
+
+    def test_key_includes_id_and_last_changed_on(self):
+        experiment = ExperimentFactory.create()
+        self.assertEqual(
+            get_serialized_experiment_key(experiment.id, None),
+            "experiments:serialized:{id}:none".format(id=experiment.id),
+        )
+
+        change = ExperimentChangeLogFactory.create(experiment=experiment)
+        self.assertEqual(
+            get_serialized_experiment_key(experiment.id, change.changed_on),
+            "experiments:serialized:{id}:{version}".format(
+                id=experiment.id, version=change.changed_on.isoformat()
+            ),
+        )
+
+    def test_serializes_and_caches_experiments(self):
+        for i in range(3):
+            ExperimentFactory.create_with_status(Experiment.STATUS_LIVE)
+
+        expected_experiments = self.get_expected_experiments()
+        self.assertEqual(
+            self.get_serialized_experiments(), expected_experiments
+        )
+
+        # Only the ids and latest changes are queried once cached
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                self.get_serialized_experiments(), expected_experiments
+            )
+
+    def test_experiment_save_invalidates_cache(self):
+        experiment = ExperimentFactory.create_with_variants()
+        self.get_serialized_experiments()
+
+        experiment.name = "Changed Name"
+        experiment.save()
+
+        self.assertEqual(
+            self.get_serialized_experiments(), self.get_expected_experiments()
+        )
+
+    def test_cache_is_invalidated_once_the_change_commits(self):
+        experiment = ExperimentFactory.create_with_variants()
+        self.get_serialized_experiments()
+        key = get_serialized_experiment_key(
+            experiment.id,
+            Experiment.objects.get(id=experiment.id).last_changed_on,
+        )
+
+        with transaction.atomic():
+            experiment.name = "Changed Name"
+            experiment.save()
+
+            # A concurrent request caches the experiment as it was before
+            # the commit under the same key
+            cache.set(key, b"stale")
+
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(
+            self.get_serialized_experiments(), self.get_expected_experiments()
+        )
+
+    def test_variant_save_invalidates_cache(self):
+        experiment = ExperimentFactory.create_with_variants()
+        self.get_serialized_experiments()
+
+        variant = experiment.variants.first()
+        variant.name = "Changed Name"
+        variant.save()
+
+        self.assertEqual(
+            self.get_serialized_experiments(), self.get_expected_experiments()
+        )
+
+    def test_change_log_save_invalidates_cache(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_LIVE
+        )
+        self.get_serialized_experiments()
+
+        # Moving the launch date changes start_date without
+        # changing the latest change of the experiment
+        launch = experiment.changes.get(new_status=Experiment.STATUS_LIVE)
+        launch.changed_on = experiment.changes.earliest(
+            "changed_on"
+        ).changed_on
+        launch.save()
+
+        self.assertEqual(
+            self.get_serialized_experiments(), self.get_expected_experiments()
+        )
+
+    def test_deleted_experiments_are_skipped(self):
+        for i in range(2):
+            ExperimentFactory.create_with_variants()
+
+        experiments = list(
+            Experiment.objects.all()
+            .order_by("id")
+            .only("id", "last_changed_on")
+        )
+        experiments[0].delete()
+
+        self.assertEqual(
+            get_serialized_experiments(experiments, Experiment.objects.all()),
+            self.get_expected_experiments(),
+        )
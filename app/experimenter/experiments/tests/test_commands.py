@@ -0,0 +1,140 @@
+import json
+import tempfile
+from io import StringIO
+
+import mock
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from experimenter.experiments.management.commands import benchmark_serializers
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.mixins import ExperimentImportRowMixin
+from experimenter.openidc.tests.factories import UserFactory
+
+
+class TestBenchmarkSerializersCommand(TestCase):
+
+    def test_command_reports_identical_output_and_rolls_back(self):
+        stdout = StringIO()
+
+        call_command("benchmark_serializers", "3", repeat=1, stdout=stdout)
+
+        self.assertIn("3 experiments", stdout.getvalue())
+        self.assertIn("identical bytes", stdout.getvalue())
+        self.assertFalse(Experiment.objects.exists())
+
+    def test_command_stores_dates_and_completion(self):
+        benchmark_serializers.Command().create_experiments(2)
+
+        launched, planned = Experiment.objects.order_by("id")
+        self.assertIsNotNone(launched.actual_start_date)
+        self.assertIsNotNone(launched.last_changed_on)
+        self.assertIsNone(planned.actual_start_date)
+
+        for experiment in (launched, planned):
+            self.assertIsNotNone(experiment.end_date)
+            self.assertTrue(experiment.completed_population)
+            self.assertTrue(experiment.completed_objectives)
+
+    def test_command_fails_when_output_differs(self):
+        with mock.patch(
+            "experimenter.experiments.management.commands."
+            "benchmark_serializers.ExperimentValuesSerializer.data",
+            new_callable=mock.PropertyMock,
+            return_value=[],
+        ):
+            with self.assertRaises(CommandError):
+                call_command(
+                    "benchmark_serializers", "1", repeat=1, stdout=StringIO()
+                )
+
+
+class TestImportExperimentsCommand(ExperimentImportRowMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory.create(email="user@example.com")
+
+    def write_rows(self, rows):
+        import_file = tempfile.NamedTemporaryFile("w", suffix=".json")
+        json.dump(rows, import_file)
+        import_file.flush()
+        self.addCleanup(import_file.close)
+        return import_file.name
+
+    def test_command_imports_experiments(self):
+        path = self.write_rows(
+            [self.get_import_row("First"), self.get_import_row("Second")]
+        )
+        stdout = StringIO()
+
+        call_command(
+            "import_experiments",
+            path,
+            email=self.user.email,
+            batch_size=1,
+            stdout=stdout,
+        )
+
+        self.assertIn("Imported 2 of 2 experiments", stdout.getvalue())
+        self.assertEqual(
+            set(Experiment.objects.values_list("slug", flat=True)),
+            set(["first", "second"]),
+        )
+
+    def test_command_reports_failed_rows(self):
+        path = self.write_rows(
+            [self.get_import_row("First"), self.get_import_row("First")]
+        )
+        stdout = StringIO()
+        stderr = StringIO()
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_experiments",
+                path,
+                email=self.user.email,
+                stdout=stdout,
+                stderr=stderr,
+            )
+
+        self.assertIn("Imported 1 of 2 experiments", stdout.getvalue())
+        self.assertIn("Row 1:", stderr.getvalue())
+        self.assertIn("This name is already in use.", stderr.getvalue())
+        self.assertEqual(Experiment.objects.count(), 1)
+
+    def test_command_reads_stdin(self):
+        with mock.patch(
+            "experimenter.experiments.management.commands."
+            "import_experiments.sys.stdin",
+            StringIO(json.dumps([self.get_import_row("First")])),
+        ):
+            call_command(
+                "import_experiments",
+                "-",
+                email=self.user.email,
+                stdout=StringIO(),
+            )
+
+        self.assertEqual(Experiment.objects.get().slug, "first")
+
+    def test_command_rejects_unknown_user_and_invalid_files(self):
+        path = self.write_rows([self.get_import_row("First")])
+
+        with self.assertRaises(CommandError):
+            call_command(
+                "import_experiments", path, email="unknown@example.com"
+            )
+
+        for invalid_path in (
+            self.write_rows({"name": "First"}),
+            self.write_rows(["First"]),
+            "/nonexistent/experiments.json",
+        ):
+            with self.assertRaises(CommandError):
+                call_command(
+                    "import_experiments", invalid_path, email=self.user.email
+                )
+
+        self.assertFalse(Experiment.objects.exists())
@@ -0,0 +1,286 @@
+import json
+
+import mock
+from asgiref.sync import async_to_sync
+from channels.testing import HttpCommunicator
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase
+
+from experimenter.experiments.api_views import ExperimentEventsView
+from experimenter.experiments.consumers import (
+    ChangeEventHub,
+    ExperimentEventsConsumer,
+)
+from experimenter.experiments.events import (
+    EXPERIMENT_CHANGES_CHANNEL,
+    get_change_event,
+)
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.factories import ExperimentChangeLogFactory
+from experimenter.routing import application
+
+
+class FakeChannel(object):
+
+    def __init__(self, messages):
+        self.messages = list(messages)
+
+    async def wait_message(self):
+        return bool(self.messages)
+
+    async def get(self):
+        return self.messages.pop(0)
+
+
+class FakeConnection(object):
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.close = mock.Mock()
+
+    async def subscribe(self, name):
+        self.subscribed = name
+        return [self.channel]
+
+
+class TestChangeEventHub(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.hub = ChangeEventHub()
+
+    def test_hub_fans_out_events_to_every_queue(self):
+        event = {"id": 1, "new_status": Experiment.STATUS_LIVE}
+        connection = FakeConnection(FakeChannel([json.dumps(event).encode()]))
+
+        async def create_redis(*args, **kwargs):
+            return connection
+
+        async def listen():
+            queues = [self.hub.subscribe(), self.hub.subscribe()]
+            await self.hub.listener
+            return [queue.get_nowait() for queue in queues]
+
+        with mock.patch(
+            "experimenter.experiments.consumers.aioredis.create_redis",
+            create_redis,
+        ):
+            self.assertEqual(async_to_sync(listen)(), [event, event])
+
+        self.assertEqual(connection.subscribed, EXPERIMENT_CHANGES_CHANNEL)
+        connection.close.assert_called_once_with()
+        self.assertIsNone(self.hub.listener)
+
+    def test_hub_logs_connection_errors_and_resubscribes_later(self):
+
+        async def create_redis(*args, **kwargs):
+            raise OSError("Connection refused")
+
+        async def listen():
+            self.hub.subscribe()
+            await self.hub.listener
+
+        with mock.patch(
+            "experimenter.experiments.consumers.aioredis.create_redis",
+            create_redis,
+        ), mock.patch(
+            "experimenter.experiments.consumers.logging"
+        ) as mock_logging:
+            async_to_sync(listen)()
+
+        mock_logging.exception.assert_called_once_with(
+            "Error receiving experiment change events"
+        )
+        self.assertIsNone(self.hub.listener)
+
+    def test_hub_stops_sending_to_unsubscribed_queues(self):
+        queue = object()
+        self.hub.queues.add(queue)
+        self.hub.unsubscribe(queue)
+        self.assertEqual(self.hub.queues, set())
+
+
+class TestExperimentEventsConsumer(TransactionTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.hub = ChangeEventHub()
+        # Don't connect to Redis, the tests publish to the queues directly
+        self.hub.listener = mock.Mock()
+
+        for patcher in (
+            mock.patch.object(ExperimentEventsConsumer, "hub", self.hub),
+            mock.patch.object(ExperimentEventsView, "max_duration", 0.5),
+            mock.patch.object(ExperimentEventsView, "keepalive_interval", 0.1),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def get_stream(self, path, headers=None, published=()):
+
+        async def stream():
+            communicator = HttpCommunicator(
+                application, "GET", path, headers=headers
+            )
+            await communicator.send_input({"type": "http.request"})
+
+            response = await communicator.receive_output()
+            response["body"] = b""
+
+            for queue in self.hub.queues:
+                for event in published:
+                    queue.put_nowait(event)
+
+            while True:
+                message = await communicator.receive_output()
+                response["body"] += message["body"]
+
+                if not message.get("more_body", False):
+                    break
+
+            await communicator.wait()
+            return response
+
+        return async_to_sync(stream)()
+
+    def get_events(self, response):
+        return [
+            json.loads(line.partition(": ")[2])
+            for line in response["body"].decode().splitlines()
+            if line.startswith("data: ")
+        ]
+
+    def test_consumer_streams_published_changes(self):
+        live_change = ExperimentChangeLogFactory.create(
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+        ship_change = ExperimentChangeLogFactory.create(
+            old_status=Experiment.STATUS_REVIEW,
+            new_status=Experiment.STATUS_SHIP,
+        )
+
+        response = self.get_stream(
+            "/api/v1/experiments/events/",
+            published=[
+                get_change_event(live_change),
+                get_change_event(ship_change),
+            ],
+        )
+
+        self.assertEqual(response["status"], 200)
+        self.assertIn(
+            (b"Content-Type", b"text/event-stream"), response["headers"]
+        )
+        self.assertTrue(response["body"].startswith(b"retry: 5000\n\n"))
+        self.assertIn(b": keepalive\n\n", response["body"])
+        self.assertEqual(
+            self.get_events(response),
+            [get_change_event(live_change), get_change_event(ship_change)],
+        )
+        self.assertEqual(self.hub.queues, set())
+
+    def test_consumer_replays_missed_changes_and_filters_statuses(self):
+        seen_change = ExperimentChangeLogFactory.create(
+            new_status=Experiment.STATUS_LIVE
+        )
+        missed_change = ExperimentChangeLogFactory.create(
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+        ExperimentChangeLogFactory.create(
+            old_status=Experiment.STATUS_DRAFT,
+            new_status=Experiment.STATUS_REVIEW,
+        )
+        live_change = ExperimentChangeLogFactory.create(
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+        review_change = ExperimentChangeLogFactory.create(
+            old_status=Experiment.STATUS_DRAFT,
+            new_status=Experiment.STATUS_REVIEW,
+        )
+
+        response = self.get_stream(
+            "/api/v1/experiments/events/?status=Live,Complete",
+            headers=[(b"last-event-id", str(seen_change.id).encode())],
+            published=[
+                get_change_event(missed_change),
+                get_change_event(review_change),
+                get_change_event(live_change),
+            ],
+        )
+
+        self.assertEqual(response["status"], 200)
+        self.assertEqual(
+            self.get_events(response),
+            [get_change_event(missed_change), get_change_event(live_change)],
+        )
+
+    def test_consumer_rejects_invalid_parameters(self):
+        for query in ("last_event_id=abc", "status=Live,Unknown"):
+            response = self.get_stream(
+                "/api/v1/experiments/events/?{query}".format(query=query)
+            )
+
+            self.assertEqual(response["status"], 400)
+            self.assertTrue(response["body"].startswith(b"event: error\n"))
+
+    def test_consumer_sends_cors_headers(self):
+        response = self.get_stream(
+            "/api/v1/experiments/events/",
+            headers=[(b"origin", b"https://example.com")],
+        )
+
+        self.assertEqual(response["status"], 200)
+        self.assertIn(
+            (b"Access-Control-Allow-Origin", b"*"), response["headers"]
+        )
+        self.assertIn((b"Cache-Control", b"no-cache"), response["headers"])
+        self.assertIn((b"X-Accel-Buffering", b"no"), response["headers"])
+
+        response = self.get_stream(
+            "/api/v1/experiments/events/?last_event_id=abc",
+            headers=[(b"origin", b"https://example.com")],
+        )
+
+        self.assertEqual(response["status"], 400)
+        self.assertIn(
+            (b"Access-Control-Allow-Origin", b"*"), response["headers"]
+        )
+
+    def test_consumer_stops_when_the_client_disconnects(self):
+        ExperimentEventsView.max_duration = 60
+
+        async def disconnect():
+            communicator = HttpCommunicator(
+                application, "GET", "/api/v1/experiments/events/"
+            )
+            await communicator.send_input({"type": "http.request"})
+            response = await communicator.receive_output()
+            await communicator.send_input({"type": "http.disconnect"})
+            await communicator.wait()
+            return response
+
+        self.assertEqual(async_to_sync(disconnect)()["status"], 200)
+        self.assertEqual(self.hub.queues, set())
+
+
+class TestRouting(TransactionTestCase):
+
+    def test_other_paths_are_served_by_django(self):
+        cache.clear()
+
+        async def get_response():
+            communicator = HttpCommunicator(
+                application,
+                "GET",
+                "/api/v1/experiments/stats/",
+                headers=[(b"host", b"localhost")],
+            )
+            return await communicator.get_response()
+
+        response = async_to_sync(get_response)()
+
+        self.assertEqual(response["status"], 200)
+        self.assertEqual(json.loads(response["body"])["total"], 0)
@@ -0,0 +1,117 @@
+import json
+
+import mock
+import redis
+from django.test import TestCase, override_settings
+
+from experimenter.experiments.events import (
+    EXPERIMENT_CHANGES_CHANNEL,
+    get_change_event,
+    get_redis,
+    publish_change_events,
+    publish_experiment_changes,
+)
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.factories import (
+    ExperimentChangeLogFactory,
+    ExperimentFactory,
+)
+
+
+class TestGetRedis(TestCase):
+
+    @override_settings(REDIS_HOST="redis", REDIS_PORT="6380", REDIS_DB="2")
+    def test_get_redis_connects_to_configured_redis(self):
+        get_redis.cache_clear()
+        self.addCleanup(get_redis.cache_clear)
+
+        connection_kwargs = get_redis().connection_pool.connection_kwargs
+
+        self.assertEqual(connection_kwargs["host"], "redis")
+        self.assertEqual(connection_kwargs["port"], "6380")
+        self.assertEqual(connection_kwargs["db"], "2")
+
+
+class TestChangeEvents(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        mock_get_redis_patcher = mock.patch(
+            "experimenter.experiments.events.get_redis"
+        )
+        self.mock_get_redis = mock_get_redis_patcher.start()
+        self.addCleanup(mock_get_redis_patcher.stop)
+        self.mock_pipeline = self.mock_get_redis.return_value.pipeline()
+
+    def test_get_change_event_describes_change(self):
+        change = ExperimentChangeLogFactory.create(
+            old_status=Experiment.STATUS_REVIEW,
+            new_status=Experiment.STATUS_SHIP,
+        )
+
+        self.assertEqual(
+            get_change_event(change),
+            {
+                "id": change.id,
+                "slug": change.experiment.slug,
+                "old_status": Experiment.STATUS_REVIEW,
+                "new_status": Experiment.STATUS_SHIP,
+                "changed_on": change.changed_on.isoformat(),
+            },
+        )
+
+    def test_publish_change_events_publishes_each_change(self):
+        experiment = ExperimentFactory.create()
+        changes = [
+            ExperimentChangeLogFactory.create(experiment=experiment)
+            for i in range(2)
+        ]
+
+        publish_change_events([change.id for change in changes])
+
+        self.mock_pipeline.publish.assert_has_calls(
+            [
+                mock.call(
+                    EXPERIMENT_CHANGES_CHANNEL,
+                    json.dumps(get_change_event(change)),
+                )
+                for change in changes
+            ]
+        )
+        self.mock_pipeline.execute.assert_called_once_with()
+
+    def test_publish_change_events_logs_redis_errors(self):
+        change = ExperimentChangeLogFactory.create()
+        self.mock_pipeline.execute.side_effect = redis.ConnectionError()
+
+        with mock.patch(
+            "experimenter.experiments.events.logging"
+        ) as mock_logging:
+            publish_change_events([change.id])
+
+        mock_logging.exception.assert_called_once()
+
+    def test_publish_experiment_changes_publishes_on_commit(self):
+        with mock.patch(
+            "experimenter.experiments.events.transaction.on_commit"
+        ) as mock_on_commit:
+            publish_experiment_changes(iter([1, 2]))
+
+        self.mock_pipeline.publish.assert_not_called()
+
+        with mock.patch(
+            "experimenter.experiments.events.publish_change_events"
+        ) as mock_publish:
+            callback, = mock_on_commit.call_args[0]
+            callback()
+
+        mock_publish.assert_called_once_with([1, 2])
+
+    def test_creating_change_publishes_it(self):
+        with mock.patch(
+            "experimenter.experiments.signals.publish_experiment_changes"
+        ) as mock_publish:
+            change = ExperimentChangeLogFactory.create()
+            change.save()
+
+        mock_publish.assert_called_once_with([change.id])
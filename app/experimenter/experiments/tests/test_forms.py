@@ -1,12 +1,14 @@
 import datetime
 import decimal
 import json
+import re
 
 from django import forms
 from django.core.exceptions import ValidationError
 from django.forms import inlineformset_factory
 from django.test import TestCase
 
+from experimenter.experiments import api_urls, web_urls
 from experimenter.experiments.forms import (
     BugzillaURLField,
     ChangeLogMixin,
@@ -255,6 +257,21 @@ class TestExperimentOverviewForm(MockRequestMixin, TestCase):
         form = ExperimentOverviewForm(request=self.request, data=self.data)
         self.assertFalse(form.is_valid())
 
+    def test_reserved_slug_raises_error(self):
+        self.data["name"] = "Stats"
+
+        form = ExperimentOverviewForm(request=self.request, data=self.data)
+        self.assertFalse(form.is_valid())
+        self.assertIn("name", form.errors)
+
+    def test_collection_url_slugs_are_reserved(self):
+        for patterns in (api_urls.urlpatterns, web_urls.urlpatterns):
+            for pattern in patterns:
+                match = re.match(r"^\^([\w-]+)/\$$", str(pattern.pattern))
+
+                if match:
+                    self.assertIn(match.group(1), Experiment.RESERVED_SLUGS)
+
 
 class TestExperimentVariantsFormSet(TestCase):
 
@@ -0,0 +1,204 @@
+import datetime
+
+import mock
+from django.test import TestCase
+
+from experimenter.experiments.imports import (
+    IMPORT_CHANGELOG_MESSAGE,
+    ExperimentImporter,
+)
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.factories import ExperimentFactory
+from experimenter.experiments.tests.mixins import ExperimentImportRowMixin
+from experimenter.openidc.tests.factories import UserFactory
+
+
+class TestExperimentImporter(ExperimentImportRowMixin, TestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory.create()
+
+    def test_run_imports_valid_rows_in_batches(self):
+        owner = UserFactory.create(email="owner@example.com")
+        rows = [
+            self.get_import_row(
+                "Imported Pref {}".format(i), owner=owner.email
+            )
+            for i in range(3)
+        ]
+        rows.append(
+            self.get_import_row(
+                "Imported Addon",
+                type=Experiment.TYPE_ADDON,
+                variants=[
+                    {"name": "Control", "description": "Off", "ratio": 60},
+                    {"name": "Addon", "description": "On", "ratio": 40},
+                ],
+            )
+        )
+
+        importer = ExperimentImporter(self.user, batch_size=2)
+        with self.assertNumQueries(
+            # One owner lookup, the owner and uniqueness checks of each
+            # row and seven queries to insert each batch of 2 rows
+            1
+            + 3 * 5
+            + 3
+            + 2 * 7
+        ):
+            results = importer.run(rows)
+
+        self.assertEqual(
+            results,
+            [
+                {"row": 0, "success": True, "slug": "imported-pref-0"},
+                {"row": 1, "success": True, "slug": "imported-pref-1"},
+                {"row": 2, "success": True, "slug": "imported-pref-2"},
+                {"row": 3, "success": True, "slug": "imported-addon"},
+            ],
+        )
+
+        experiment = Experiment.objects.get(slug="imported-pref-0")
+        self.assertEqual(experiment.owner, owner)
+        self.assertEqual(experiment.status, Experiment.STATUS_DRAFT)
+        self.assertEqual(experiment.pref_key, "browser.imported.enabled")
+        self.assertEqual(
+            experiment.end_date,
+            experiment.proposed_start_date + datetime.timedelta(days=30),
+        )
+        self.assertEqual(
+            [
+                (
+                    variant.slug,
+                    variant.is_control,
+                    variant.ratio,
+                    variant.value,
+                )
+                for variant in experiment.variants.all()
+            ],
+            [("control", True, 50, "false"), ("treatment", False, 50, "true")],
+        )
+
+        change = experiment.changes.get()
+        self.assertEqual(change.changed_by, self.user)
+        self.assertEqual(change.old_status, None)
+        self.assertEqual(change.new_status, Experiment.STATUS_DRAFT)
+        self.assertEqual(change.message, IMPORT_CHANGELOG_MESSAGE)
+        self.assertEqual(experiment.last_changed_on, change.changed_on)
+        self.assertTrue(experiment.completed_population)
+        self.assertFalse(experiment.is_ready_to_launch)
+
+        addon = Experiment.objects.get(slug="imported-addon")
+        self.assertEqual(
+            [variant.ratio for variant in addon.variants.all()], [60, 40]
+        )
+        self.assertEqual(
+            list(Experiment.objects.search("imported addon")), [addon]
+        )
+
+    def test_run_reports_errors_of_invalid_rows(self):
+        ExperimentFactory.create(name="Existing", slug="existing")
+
+        rows = [
+            self.get_import_row("Valid"),
+            self.get_import_row("Existing"),
+            self.get_import_row("Valid"),
+            self.get_import_row("Unowned", owner="unknown@example.com"),
+            self.get_import_row("No Duration", proposed_duration=None),
+            self.get_import_row(
+                "Uneven",
+                variants=[
+                    {"name": "Control", "description": "Off", "ratio": 50},
+                    {"name": "Treatment", "description": "On", "ratio": 60},
+                ],
+            ),
+            self.get_import_row(
+                "Unnamed",
+                variants=[
+                    {"name": "", "description": "Off", "ratio": 50},
+                    {"name": "Treatment", "description": "On", "ratio": 50},
+                ],
+            ),
+        ]
+
+        results = ExperimentImporter(self.user).run(rows)
+
+        self.assertEqual(
+            [result["success"] for result in results],
+            [True, False, False, False, False, False, False],
+        )
+        self.assertIn("name", results[1]["errors"])
+        self.assertEqual(
+            results[2]["errors"], {"name": ["This name is already in use."]}
+        )
+        self.assertIn("owner", results[3]["errors"])
+        self.assertIn("proposed_duration", results[4]["errors"])
+        self.assertEqual(
+            results[5]["errors"]["variants"][0]["ratio"],
+            ["The size of all branches must add up to 100"],
+        )
+        self.assertIn("name", results[6]["errors"]["variants"][0])
+
+        self.assertEqual(
+            list(
+                Experiment.objects.order_by("slug").values_list(
+                    "slug", flat=True
+                )
+            ),
+            ["existing", "valid"],
+        )
+
+    def test_run_reports_rows_of_batches_which_failed_to_insert(self):
+        rows = [
+            self.get_import_row("Imported Pref {}".format(i)) for i in range(4)
+        ]
+        importer = ExperimentImporter(self.user, batch_size=2)
+        create = importer.create
+
+        def create_concurrently(experiments):
+            # Another request creates one of the experiments of the second
+            # batch after the rows were validated
+            if experiments[0][0].slug == "imported-pref-2":
+                ExperimentFactory.create(
+                    name="Imported Pref 3", slug="imported-pref-3"
+                )
+
+            create(experiments)
+
+        with mock.patch.object(
+            importer, "create", side_effect=create_concurrently
+        ), mock.patch(
+            "experimenter.experiments.imports.logging"
+        ) as mock_logging:
+            results = importer.run(rows)
+
+        self.assertEqual(
+            [result["success"] for result in results],
+            [True, True, False, False],
+        )
+        self.assertEqual(
+            results[2]["errors"], {"__all__": [ExperimentImporter.BATCH_ERROR]}
+        )
+        mock_logging.exception.assert_called_once_with(
+            "Error importing experiments"
+        )
+        self.assertEqual(
+            list(
+                Experiment.objects.order_by("slug").values_list(
+                    "slug", flat=True
+                )
+            ),
+            ["imported-pref-0", "imported-pref-1", "imported-pref-3"],
+        )
+
+    def test_run_reports_missing_variants(self):
+        results = ExperimentImporter(self.user).run(
+            [self.get_import_row("No Variants", variants=[])]
+        )
+
+        self.assertEqual(
+            results[0]["errors"],
+            {"variants": [ExperimentImporter.MISSING_VARIANTS_ERROR]},
+        )
+        self.assertFalse(Experiment.objects.exists())
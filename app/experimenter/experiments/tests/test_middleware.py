@@ -0,0 +1,213 @@
+import gzip
+
+import brotli
+import mock
+from django.db import connection
+from django.http import HttpResponse, StreamingHttpResponse
+from django.template import engines
+from django.template.response import SimpleTemplateResponse
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from experimenter.experiments.middleware import (
+    APICompressionMiddleware,
+    RequestSummaryMiddleware,
+    RequestTimingMiddleware,
+    RequestTimings,
+)
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.tests.factories import ExperimentFactory
+
+
+@override_settings(
+    API_COMPRESSION_PATH="/api/v1/", API_COMPRESSION_MIN_SIZE=100
+)
+class TestAPICompressionMiddleware(TestCase):
+
+    content = b'{"slug":"experiment"}' * 100
+
+    def get_response(
+        self, path="/api/v1/experiments/", response=None, **kwargs
+    ):
+        if response is None:
+            response = HttpResponse(self.content)
+
+        middleware = APICompressionMiddleware(lambda request: response)
+        return middleware(RequestFactory().get(path, **kwargs))
+
+    def test_compresses_with_gzip(self):
+        response = self.get_response(HTTP_ACCEPT_ENCODING="gzip, deflate")
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(
+            response["Content-Length"], str(len(response.content))
+        )
+        self.assertEqual(gzip.decompress(response.content), self.content)
+
+    def test_prefers_brotli(self):
+        response = self.get_response(HTTP_ACCEPT_ENCODING="gzip, br")
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(brotli.decompress(response.content), self.content)
+
+    def test_accepts_any_encoding_for_wildcard(self):
+        response = self.get_response(HTTP_ACCEPT_ENCODING="*")
+
+        self.assertEqual(response["Content-Encoding"], "br")
+
+    def test_skips_encodings_with_zero_quality(self):
+        response = self.get_response(
+            HTTP_ACCEPT_ENCODING="br;q=0, gzip;q=0.5, deflate;q=0.5.1, ;"
+        )
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+
+    def test_weakens_etag(self):
+        response = HttpResponse(self.content)
+        response["ETag"] = '"abc"'
+
+        response = self.get_response(
+            response=response, HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        self.assertEqual(response["ETag"], 'W/"abc"')
+
+    def test_compresses_streaming_responses(self):
+        for encoding, decompress in (
+            ("gzip", gzip.decompress),
+            ("br", brotli.decompress),
+        ):
+            response = self.get_response(
+                response=StreamingHttpResponse([b"a" * 10, b"b" * 10]),
+                HTTP_ACCEPT_ENCODING=encoding,
+            )
+
+            self.assertEqual(response["Content-Encoding"], encoding)
+            self.assertEqual(
+                decompress(b"".join(response.streaming_content)),
+                b"a" * 10 + b"b" * 10,
+            )
+
+    def test_does_not_compress_event_streams(self):
+        response = self.get_response(
+            response=StreamingHttpResponse(
+                [b"data: {}\n\n"],
+                content_type="text/event-stream; charset=utf-8",
+            ),
+            HTTP_ACCEPT_ENCODING="gzip, br",
+        )
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(b"".join(response.streaming_content), b"data: {}\n\n")
+
+    def test_does_not_compress_without_accepted_encoding(self):
+        response = self.get_response(HTTP_ACCEPT_ENCODING="identity")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response["Vary"], "Accept-Encoding")
+        self.assertEqual(response.content, self.content)
+
+    def test_does_not_compress_small_responses(self):
+        response = self.get_response(
+            response=HttpResponse(b"{}"), HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, b"{}")
+
+    def test_does_not_compress_when_compressed_is_larger(self):
+        content = bytes(range(256))
+        response = self.get_response(
+            response=HttpResponse(content), HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, content)
+
+    def test_does_not_compress_outside_api(self):
+        response = self.get_response(
+            path="/experiments/", HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_does_not_compress_encoded_responses(self):
+        response = HttpResponse(self.content)
+        response["Content-Encoding"] = "identity"
+
+        response = self.get_response(
+            response=response, HTTP_ACCEPT_ENCODING="gzip"
+        )
+
+        self.assertEqual(response["Content-Encoding"], "identity")
+        self.assertEqual(response.content, self.content)
+
+
+class TestRequestTimingMiddleware(TestCase):
+
+    def test_counts_queries_of_request(self):
+
+        def get_response(request):
+            Experiment.objects.count()
+            Experiment.objects.exists()
+            return HttpResponse()
+
+        with mock.patch(
+            "experimenter.experiments.middleware.time.monotonic",
+            side_effect=[1.0, 1.25, 2.0, 2.5],
+        ):
+            response = RequestTimingMiddleware(get_response)(
+                RequestFactory().get("/")
+            )
+
+        self.assertEqual(response["X-DB-Queries"], "2")
+        self.assertEqual(
+            response["Server-Timing"],
+            'db;dur=750.0;desc="2 queries", render;dur=0.0',
+        )
+
+    def test_measures_render_time(self):
+        request = RequestFactory().get("/")
+        request.timings = RequestTimings()
+        response = SimpleTemplateResponse(
+            engines["django"].from_string("{{ name }}")
+        )
+
+        with mock.patch(
+            "experimenter.experiments.middleware.time.monotonic",
+            side_effect=[1.0, 1.5],
+        ):
+            RequestTimingMiddleware(None).process_template_response(
+                request, response
+            )
+            response.render()
+
+        self.assertEqual(request.timings.render_time, 0.5)
+
+    def test_reports_timings_of_api_requests(self):
+        ExperimentFactory.create_with_variants()
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse("experiments-api-list"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["X-DB-Queries"], str(len(queries)))
+        self.assertIn("render;dur=", response["Server-Timing"])
+
+    def test_adds_timings_to_request_summary(self):
+        with self.assertLogs("request.summary") as logs:
+            response = self.client.get(reverse("experiments-api-list"))
+
+        record = logs.records[-1]
+        self.assertEqual(record.db_queries, int(response["X-DB-Queries"]))
+        self.assertIsInstance(record.db_time, int)
+        self.assertIsInstance(record.render_time, int)
+
+    def test_request_summary_without_timings(self):
+        extra = RequestSummaryMiddleware()._build_extra_meta(
+            RequestFactory().get("/")
+        )
+
+        self.assertNotIn("db_queries", extra)
@@ -1,6 +1,7 @@
 import datetime
 
 from django.conf import settings
+from django.db import connection
 from django.test import TestCase
 
 from experimenter.openidc.tests.factories import UserFactory
@@ -13,12 +14,13 @@ from experimenter.experiments.tests.factories import (
     ExperimentFactory,
     ExperimentChangeLogFactory,
     ExperimentCommentFactory,
+    ExperimentVariantFactory,
 )
 
 
 class TestExperimentManager(TestCase):
 
-    def test_queryset_annotated_with_latest_change(self):
+    def test_last_changed_on_follows_the_latest_change(self):
         now = datetime.datetime.now()
         experiment1 = ExperimentFactory.create_with_variants()
         experiment2 = ExperimentFactory.create_with_variants()
@@ -38,7 +40,7 @@ class TestExperimentManager(TestCase):
         )
 
         self.assertEqual(
-            list(Experiment.objects.order_by("-latest_change")),
+            list(Experiment.objects.order_by("-last_changed_on")),
             [experiment2, experiment1],
         )
 
@@ -49,10 +51,324 @@ class TestExperimentManager(TestCase):
         )
 
         self.assertEqual(
-            list(Experiment.objects.order_by("-latest_change")),
+            list(Experiment.objects.order_by("-last_changed_on")),
             [experiment1, experiment2],
         )
 
+    def test_objects_loads_only_the_experiment(self):
+        ExperimentFactory.create_with_status(Experiment.STATUS_REVIEW)
+
+        with self.assertNumQueries(1):
+            experiment = Experiment.objects.get()
+
+        self.assertFalse(Experiment.owner.is_cached(experiment))
+
+    def test_for_list_loads_what_the_list_renders(self):
+        for i in range(3):
+            ExperimentFactory.create_with_status(Experiment.STATUS_REVIEW)
+
+        with self.assertNumQueries(1):
+            for experiment in Experiment.objects.for_list().order_by(
+                "-last_changed_on"
+            ):
+                str(experiment.owner)
+                experiment.dates
+
+    def test_with_variants_summary_annotates_count(self):
+        experiment1 = ExperimentFactory.create_with_variants()
+        experiment2 = ExperimentFactory.create()
+
+        self.assertEqual(
+            list(
+                Experiment.objects.with_variants_summary()
+                .order_by("id")
+                .values_list("id", "variants_count")
+            ),
+            [
+                (experiment1.id, experiment1.variants.count()),
+                (experiment2.id, 0),
+            ],
+        )
+
+    def test_with_controls_loads_every_control_in_one_query(self):
+        controls = [
+            ExperimentFactory.create_with_variants().variants.get(
+                is_control=True
+            )
+            for i in range(5)
+        ]
+
+        with self.assertNumQueries(2):
+            experiments = Experiment.objects.with_controls().order_by("id")
+
+            self.assertEqual(
+                [experiment.control for experiment in experiments], controls
+            )
+
+    def test_most_recently_changed_orders_by_latest_change(self):
+        experiment1 = ExperimentFactory.create_with_variants()
+        experiment2 = ExperimentFactory.create_with_variants()
+        experiment3 = ExperimentFactory.create_with_variants()
+        ExperimentChangeLogFactory.create(
+            experiment=experiment2, new_status=Experiment.STATUS_DRAFT
+        )
+        ExperimentChangeLogFactory.create(
+            experiment=experiment1, new_status=Experiment.STATUS_DRAFT
+        )
+
+        controls = [
+            experiment.variants.get(is_control=True)
+            for experiment in (experiment1, experiment2, experiment3)
+        ]
+
+        with self.assertNumQueries(2):
+            experiments = list(Experiment.objects.most_recently_changed())
+
+            self.assertEqual(
+                experiments, [experiment1, experiment2, experiment3]
+            )
+            self.assertEqual(
+                [experiment.control for experiment in experiments], controls
+            )
+
+    def test_for_detail_loads_what_the_detail_page_renders(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        ExperimentCommentFactory.create(experiment=experiment)
+
+        with self.assertNumQueries(6):
+            experiment = Experiment.objects.for_detail().get()
+            str(experiment.owner)
+            str(experiment.project)
+            list(experiment.variants.all())
+            experiment.control
+            experiment.is_ready_to_launch
+            experiment.ordered_changes
+            experiment.comments.sections
+
+    def test_last_changed_on_is_cleared_with_the_last_change(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        change = experiment.changes.latest()
+        self.assertEqual(experiment.last_changed_on, change.changed_on)
+
+        experiment.changes.all().delete()
+        experiment.refresh_from_db()
+        self.assertIsNone(experiment.last_changed_on)
+
+    def test_transition_status_moves_only_experiments_in_old_status(self):
+        experiment1 = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW
+        )
+        experiment2 = ExperimentFactory.create_with_status(
+            Experiment.STATUS_DRAFT
+        )
+
+        transitioned = Experiment.objects.transition_status(
+            [experiment1.slug, experiment2.slug, "unknown"],
+            Experiment.STATUS_REVIEW,
+            Experiment.STATUS_ACCEPTED,
+        )
+
+        self.assertEqual(transitioned, [(experiment1.id, experiment1.slug)])
+        self.assertEqual(
+            Experiment.objects.get(id=experiment1.id).status,
+            Experiment.STATUS_ACCEPTED,
+        )
+        self.assertEqual(
+            Experiment.objects.get(id=experiment2.id).status,
+            Experiment.STATUS_DRAFT,
+        )
+
+        self.assertEqual(
+            Experiment.objects.transition_status(
+                [experiment1.slug],
+                Experiment.STATUS_REVIEW,
+                Experiment.STATUS_ACCEPTED,
+            ),
+            [],
+        )
+
+    def test_update_dates_matches_set_dates(self):
+        launched = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 1, 1),
+            proposed_duration=20,
+            proposed_enrollment=10,
+        )
+        ExperimentChangeLogFactory.create(
+            experiment=launched,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=datetime.datetime(2019, 1, 5, 12, 0),
+        )
+        ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 2, 1),
+            proposed_duration=Experiment.MAX_DURATION + 1,
+            proposed_enrollment=None,
+        )
+        ExperimentFactory.create_with_variants(
+            proposed_start_date=None,
+            proposed_duration=None,
+            proposed_enrollment=None,
+        )
+
+        Experiment.objects.update(
+            actual_start_date=None, end_date=None, enrollment_end_date=None
+        )
+
+        with self.assertNumQueries(1):
+            Experiment.objects.update_dates()
+
+        for experiment in Experiment.objects.all():
+            stored_dates = [
+                getattr(experiment, field) for field in Experiment.DATE_FIELDS
+            ]
+            experiment.set_dates()
+            self.assertEqual(
+                stored_dates,
+                [
+                    getattr(experiment, field)
+                    for field in Experiment.DATE_FIELDS
+                ],
+            )
+
+        launched = Experiment.objects.get(id=launched.id)
+        self.assertEqual(launched.actual_start_date, datetime.date(2019, 1, 5))
+        self.assertEqual(launched.end_date, datetime.date(2019, 1, 25))
+        self.assertEqual(
+            launched.enrollment_end_date, datetime.date(2019, 1, 15)
+        )
+
+    def test_update_completion_matches_set_completion(self):
+        reviews = {field: True for field in Experiment.REQUIRED_REVIEW_FIELDS}
+        ready = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW, **reviews
+        )
+        ExperimentFactory.create_with_status(Experiment.STATUS_REVIEW)
+        ExperimentFactory.create(
+            objectives=None,
+            analysis=Experiment.ANALYSIS_DEFAULT,
+            population_percent="0",
+            firefox_version="",
+            risk_brand=None,
+            **reviews
+        )
+        ExperimentFactory.create(
+            objectives=Experiment.OBJECTIVES_DEFAULT, analysis=None
+        )
+
+        Experiment.objects.update(
+            **{field: False for field in Experiment.COMPLETION_FIELDS}
+        )
+
+        with self.assertNumQueries(1):
+            Experiment.objects.update_completion()
+
+        for experiment in Experiment.objects.all():
+            stored_flags = [
+                getattr(experiment, field)
+                for field in Experiment.COMPLETION_FIELDS
+            ]
+            experiment.set_completion()
+            self.assertEqual(
+                stored_flags,
+                [
+                    getattr(experiment, field)
+                    for field in Experiment.COMPLETION_FIELDS
+                ],
+            )
+
+        self.assertEqual(
+            list(Experiment.objects.filter(is_ready_to_launch=True)), [ready]
+        )
+
+    def test_readiness_follows_added_and_removed_variants(self):
+        experiment = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW,
+            num_variants=0,
+            **{field: True for field in Experiment.REQUIRED_REVIEW_FIELDS}
+        )
+        self.assertFalse(experiment.is_ready_to_launch)
+
+        variant = ExperimentVariantFactory.create(experiment=experiment)
+        self.assertTrue(experiment.is_ready_to_launch)
+
+        ExperimentVariant.objects.get(id=variant.id).delete()
+        self.assertFalse(
+            Experiment.objects.get(id=experiment.id).is_ready_to_launch
+        )
+
+    def test_completion_partial_indexes_exist(self):
+        with connection.cursor() as cursor:
+            indexes = connection.introspection.get_constraints(
+                cursor, Experiment._meta.db_table
+            )
+
+        for name in (
+            "experiment_population_todo_idx",
+            "experiment_objectives_todo_idx",
+            "experiment_risks_todo_idx",
+            "experiment_reviews_todo_idx",
+            "experiment_ready_idx",
+        ):
+            self.assertEqual(indexes[name]["columns"], ["status"])
+
+    def test_in_slug_order_orders_experiments_as_slugs(self):
+        experiment1 = ExperimentFactory.create()
+        experiment2 = ExperimentFactory.create()
+        ExperimentFactory.create()
+
+        self.assertEqual(
+            list(
+                Experiment.objects.in_slug_order(
+                    [experiment2.slug, "unknown", experiment1.slug]
+                )
+            ),
+            [experiment2, experiment1],
+        )
+
+    def test_search_vector_is_updated_on_save(self):
+        experiment = ExperimentFactory.create_with_variants()
+        self.assertFalse(Experiment.objects.search("platypus").exists())
+
+        experiment.analysis = "Count the platypus enrollments"
+        experiment.save()
+
+        self.assertEqual(
+            list(Experiment.objects.search("platypus")), [experiment]
+        )
+
+    def test_search_vector_includes_comments(self):
+        experiment = ExperimentFactory.create_with_variants()
+        comment = ExperimentCommentFactory.create(
+            experiment=experiment, text="What about the wombats?"
+        )
+
+        self.assertEqual(
+            list(Experiment.objects.search("wombat")), [experiment]
+        )
+
+        comment.delete()
+        self.assertFalse(Experiment.objects.search("wombat").exists())
+
+    def test_search_ranks_matches_and_keeps_ordering_for_ties(self):
+        experiment1 = ExperimentFactory.create_with_variants(
+            short_description="A numbat study"
+        )
+        experiment2 = ExperimentFactory.create_with_variants(
+            short_description="Another numbat study"
+        )
+        experiment3 = ExperimentFactory.create_with_variants(
+            name="Numbat Study"
+        )
+
+        self.assertEqual(
+            list(Experiment.objects.order_by("-id").search("numbats")),
+            [experiment3, experiment2, experiment1],
+        )
+
 
 class TestExperimentModel(TestCase):
 
@@ -170,6 +486,64 @@ class TestExperimentModel(TestCase):
             change.experiment.start_date, change.changed_on.date()
         )
 
+    def test_dates_follow_launch_changes(self):
+        experiment = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 1, 1),
+            proposed_duration=20,
+            proposed_enrollment=10,
+        )
+        ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_SHIP,
+            new_status=Experiment.STATUS_ACCEPTED,
+        )
+        self.assertIsNone(experiment.actual_start_date)
+
+        launch = ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=datetime.datetime(2019, 1, 3, 12, 0),
+        )
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(
+            experiment.actual_start_date, datetime.date(2019, 1, 3)
+        )
+        self.assertEqual(experiment.end_date, datetime.date(2019, 1, 23))
+        self.assertEqual(
+            experiment.enrollment_end_date, datetime.date(2019, 1, 13)
+        )
+
+        launch.delete()
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertIsNone(experiment.actual_start_date)
+        self.assertEqual(experiment.end_date, datetime.date(2019, 1, 21))
+
+    def test_dates_follow_proposed_dates_of_stale_instances(self):
+        experiment = ExperimentFactory.create_with_variants(
+            proposed_start_date=datetime.date(2019, 1, 1),
+            proposed_duration=20,
+            proposed_enrollment=10,
+        )
+        stale_experiment = Experiment.objects.get(id=experiment.id)
+        ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+            changed_on=datetime.datetime(2019, 1, 3, 12, 0),
+        )
+
+        stale_experiment.proposed_duration = 30
+        stale_experiment.save()
+
+        experiment = Experiment.objects.get(id=experiment.id)
+        self.assertEqual(
+            experiment.actual_start_date, datetime.date(2019, 1, 3)
+        )
+        self.assertEqual(experiment.end_date, datetime.date(2019, 2, 2))
+
     def test_observation_duration_returns_duration_minus_enrollment(self):
         experiment = ExperimentFactory.create_with_variants(
             proposed_duration=20, proposed_enrollment=10
@@ -291,6 +665,28 @@ class TestExperimentModel(TestCase):
         )
         self.assertEqual(experiment.control, control)
 
+    def test_control_uses_prefetched_variants(self):
+        experiment = ExperimentFactory.create_with_variants()
+        control = experiment.variants.get(is_control=True)
+
+        experiment = Experiment.objects.prefetch_related("variants").get()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(experiment.control, control)
+
+    def test_control_raises_without_querying_when_known_missing(self):
+        ExperimentFactory.create()
+
+        for queryset in (
+            Experiment.objects.prefetch_related("variants"),
+            Experiment.objects.with_controls(),
+        ):
+            experiment = queryset.get()
+
+            with self.assertNumQueries(0):
+                with self.assertRaises(ExperimentVariant.DoesNotExist):
+                    experiment.control
+
     def test_grouped_changes_groups_by_date_then_user(self):
         experiment = ExperimentFactory.create()
 
@@ -556,6 +952,25 @@ class TestExperimentModel(TestCase):
         experiment = ExperimentFactory.create_with_variants()
         self.assertTrue(experiment.completed_variants)
 
+    def test_variants_completion_uses_prefetched_or_annotated_variants(self):
+        ExperimentFactory.create()
+        ExperimentFactory.create_with_variants()
+
+        for queryset in (
+            Experiment.objects.prefetch_related("variants"),
+            Experiment.objects.with_variants_summary(),
+        ):
+            experiments = list(queryset.order_by("id"))
+
+            with self.assertNumQueries(0):
+                self.assertEqual(
+                    [
+                        experiment.completed_variants
+                        for experiment in experiments
+                    ],
+                    [False, True],
+                )
+
     def test_objectives_is_not_complete_with_still_default(self):
         experiment = ExperimentFactory.create(
             objectives=Experiment.OBJECTIVES_DEFAULT,
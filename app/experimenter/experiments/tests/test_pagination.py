@@ -0,0 +1,121 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.exceptions import NotFound
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.pagination import ExperimentCursorPagination
+from experimenter.experiments.tests.factories import (
+    ExperimentChangeLogFactory,
+    ExperimentFactory,
+)
+
+
+class TestExperimentCursorPagination(TestCase):
+
+    def setUp(self):
+        self.pagination = ExperimentCursorPagination()
+
+    def get_request(self, **params):
+        return Request(APIRequestFactory().get("/", params))
+
+    def test_pagination_not_applied_without_cursor_or_page_size(self):
+        ExperimentFactory.create()
+        self.assertIsNone(
+            self.pagination.paginate_queryset(
+                Experiment.objects.all(), self.get_request()
+            )
+        )
+
+    def test_page_size_defaults_when_invalid(self):
+        self.assertEqual(
+            self.pagination.get_page_size(self.get_request(page_size="a")),
+            self.pagination.page_size,
+        )
+        self.assertEqual(
+            self.pagination.get_page_size(self.get_request(page_size="0")),
+            self.pagination.page_size,
+        )
+
+    def test_page_size_limited_to_max_page_size(self):
+        self.assertEqual(
+            self.pagination.get_page_size(self.get_request(page_size="5")), 5
+        )
+        self.assertEqual(
+            self.pagination.get_page_size(
+                self.get_request(page_size="100000")
+            ),
+            self.pagination.max_page_size,
+        )
+
+    def test_cursor_round_trips_position(self):
+        experiment = ExperimentFactory.create()
+        ExperimentChangeLogFactory.create(experiment=experiment)
+        experiment = Experiment.objects.all().get(id=experiment.id)
+
+        cursor = self.pagination.encode_cursor(experiment)
+        self.assertEqual(
+            self.pagination.decode_cursor(self.get_request(cursor=cursor)),
+            (experiment.last_changed_on, experiment.id),
+        )
+
+    def test_cursor_round_trips_position_without_changes(self):
+        experiment = ExperimentFactory.create()
+        experiment = Experiment.objects.all().get(id=experiment.id)
+
+        cursor = self.pagination.encode_cursor(experiment)
+        self.assertEqual(
+            self.pagination.decode_cursor(self.get_request(cursor=cursor)),
+            (None, experiment.id),
+        )
+
+    def test_invalid_cursors_raise_not_found(self):
+        for cursor in ("!!", "bm90IGpzb24=", "WyJub3QgYSBkYXRlIiwgMV0="):
+            with self.assertRaises(NotFound):
+                self.pagination.decode_cursor(self.get_request(cursor=cursor))
+
+    def test_experiments_with_equal_change_times_are_ordered_by_id(self):
+        changed_on = timezone.now() - datetime.timedelta(days=1)
+        experiments = []
+        for i in range(3):
+            experiment = ExperimentFactory.create()
+            ExperimentChangeLogFactory.create(
+                experiment=experiment, changed_on=changed_on
+            )
+            experiments.append(experiment)
+
+        request = self.get_request(page_size="1")
+        page = self.pagination.paginate_queryset(
+            Experiment.objects.all(), request
+        )
+        seen = list(page)
+
+        while self.pagination.has_next:
+            request = self.get_request(
+                cursor=self.pagination.encode_cursor(page[-1])
+            )
+            page = self.pagination.paginate_queryset(
+                Experiment.objects.all(), request
+            )
+            seen.extend(page)
+
+        self.assertEqual(seen, experiments)
+
+    def test_experiments_without_changes_are_paged_by_id(self):
+        experiments = [ExperimentFactory.create() for i in range(2)]
+
+        page = self.pagination.paginate_queryset(
+            Experiment.objects.all(), self.get_request(page_size="1")
+        )
+        self.assertEqual(page, experiments[:1])
+        self.assertTrue(self.pagination.has_next)
+
+        page = self.pagination.paginate_queryset(
+            Experiment.objects.all(),
+            self.get_request(cursor=self.pagination.encode_cursor(page[-1])),
+        )
+        self.assertEqual(page, experiments[1:])
+        self.assertFalse(self.pagination.has_next)
@@ -0,0 +1,105 @@
+import hashlib
+import json
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+
+from experimenter.experiments.models import Experiment, ExperimentRecipe
+from experimenter.experiments.recipes import generate_recipes
+from experimenter.experiments.serializers import ExperimentRecipeSerializer
+from experimenter.experiments.tests.factories import (
+    ExperimentChangeLogFactory,
+    ExperimentFactory,
+)
+
+
+class TestGenerateRecipes(TestCase):
+
+    def test_generates_recipes_of_pref_studies(self):
+        pref_experiment = ExperimentFactory.create_with_variants(
+            type=Experiment.TYPE_PREF
+        )
+        addon_experiment = ExperimentFactory.create_with_variants(
+            type=Experiment.TYPE_ADDON
+        )
+
+        generate_recipes([pref_experiment.id, addon_experiment.id])
+
+        recipe = ExperimentRecipe.objects.get()
+        self.assertEqual(recipe.experiment, pref_experiment)
+        self.assertEqual(
+            recipe.content,
+            JSONRenderer()
+            .render(ExperimentRecipeSerializer(pref_experiment).data)
+            .decode(),
+        )
+        self.assertEqual(
+            recipe.etag,
+            '"{hash}"'.format(
+                hash=hashlib.sha1(recipe.content.encode()).hexdigest()
+            ),
+        )
+
+    def test_replaces_existing_recipe(self):
+        experiment = ExperimentFactory.create_with_variants(
+            type=Experiment.TYPE_PREF
+        )
+        generate_recipes([experiment.id])
+
+        experiment.pref_key = "browser.changed.enabled"
+        experiment.save()
+        generate_recipes([experiment.id])
+
+        recipe = ExperimentRecipe.objects.get()
+        self.assertEqual(
+            json.loads(recipe.content)["arguments"]["preferenceName"],
+            "browser.changed.enabled",
+        )
+
+    def test_shipping_or_accepting_generates_recipe(self):
+        for new_status in (Experiment.STATUS_SHIP, Experiment.STATUS_ACCEPTED):
+            experiment = ExperimentFactory.create_with_variants(
+                type=Experiment.TYPE_PREF
+            )
+            ExperimentChangeLogFactory.create(
+                experiment=experiment, new_status=new_status
+            )
+
+            self.assertTrue(
+                ExperimentRecipe.objects.filter(experiment=experiment).exists()
+            )
+
+    def test_other_transitions_do_not_generate_recipe(self):
+        experiment = ExperimentFactory.create_with_variants(
+            type=Experiment.TYPE_PREF
+        )
+        ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_DRAFT,
+            new_status=Experiment.STATUS_REVIEW,
+        )
+
+        self.assertFalse(ExperimentRecipe.objects.exists())
+
+    def test_returning_to_review_or_rejecting_deletes_recipe(self):
+        for new_status in (
+            Experiment.STATUS_REVIEW,
+            Experiment.STATUS_REJECTED,
+        ):
+            experiment = ExperimentFactory.create_with_variants(
+                type=Experiment.TYPE_PREF
+            )
+            ExperimentChangeLogFactory.create(
+                experiment=experiment,
+                old_status=Experiment.STATUS_REVIEW,
+                new_status=Experiment.STATUS_SHIP,
+            )
+            ExperimentChangeLogFactory.create(
+                experiment=experiment,
+                old_status=Experiment.STATUS_SHIP,
+                new_status=new_status,
+            )
+
+            self.assertFalse(
+                ExperimentRecipe.objects.filter(experiment=experiment).exists()
+            )
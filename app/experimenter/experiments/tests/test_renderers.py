@@ -0,0 +1,77 @@
+import datetime
+import decimal
+import json
+
+import msgpack
+from django.test import TestCase
+
+from experimenter.experiments.renderers import (
+    EventStreamRenderer,
+    MessagePackRenderer,
+    NDJSONRenderer,
+)
+
+
+class TestMessagePackRenderer(TestCase):
+
+    def test_renders_data_as_msgpack(self):
+        data = {
+            "name": "experiment",
+            "ratio": 1,
+            "percent": decimal.Decimal("12.5"),
+            "date": datetime.date(2019, 1, 1),
+            "variants": [{"is_control": True}],
+        }
+
+        self.assertEqual(
+            msgpack.unpackb(MessagePackRenderer().render(data), raw=False),
+            {
+                "name": "experiment",
+                "ratio": 1,
+                "percent": 12.5,
+                "date": "2019-01-01",
+                "variants": [{"is_control": True}],
+            },
+        )
+
+    def test_renders_none_as_empty_content(self):
+        self.assertEqual(MessagePackRenderer().render(None), b"")
+
+
+class TestNDJSONRenderer(TestCase):
+
+    def parse(self, content):
+        return [json.loads(line) for line in content.splitlines()]
+
+    def test_renders_one_item_per_line(self):
+        content = NDJSONRenderer().render([{"slug": "a"}, {"slug": "b"}])
+
+        self.assertTrue(content.endswith(b"\n"))
+        self.assertEqual(self.parse(content), [{"slug": "a"}, {"slug": "b"}])
+
+    def test_renders_results_of_paginated_data(self):
+        content = NDJSONRenderer().render(
+            {"next": "http://testserver/?cursor=a", "results": [{"slug": "a"}]}
+        )
+
+        self.assertEqual(self.parse(content), [{"slug": "a"}])
+
+    def test_renders_single_object_as_one_line(self):
+        content = NDJSONRenderer().render({"slug": "a"})
+
+        self.assertEqual(self.parse(content), [{"slug": "a"}])
+
+    def test_renders_none_as_empty_content(self):
+        self.assertEqual(NDJSONRenderer().render(None), b"")
+
+
+class TestEventStreamRenderer(TestCase):
+
+    def test_renders_data_as_error_event(self):
+        self.assertEqual(
+            EventStreamRenderer().render({"status": ["Unknown statuses: X"]}),
+            b'event: error\ndata: {"status": ["Unknown statuses: X"]}\n\n',
+        )
+
+    def test_renders_none_as_empty_content(self):
+        self.assertEqual(EventStreamRenderer().render(None), b"")
@@ -1,6 +1,7 @@
 import datetime
 
 from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
 
 from experimenter.experiments.models import Experiment
 from experimenter.experiments.tests.factories import (
@@ -9,7 +10,10 @@ from experimenter.experiments.tests.factories import (
 )
 from experimenter.experiments.serializers import (
     JSTimestampField,
+    PrefValueField,
+    ExperimentRecipeSerializer,
     ExperimentSerializer,
+    ExperimentValuesSerializer,
     ExperimentVariantSerializer,
 )
 
@@ -28,6 +32,20 @@ class TestJSTimestampField(TestCase):
         self.assertEqual(field.to_representation(None), None)
 
 
+class TestPrefValueField(TestCase):
+
+    def test_field_decodes_json_value(self):
+        field = PrefValueField()
+        self.assertEqual(field.to_representation('"a-value"'), "a-value")
+        self.assertEqual(field.to_representation("12"), 12)
+        self.assertEqual(field.to_representation("true"), True)
+
+    def test_field_returns_value_which_is_not_json(self):
+        field = PrefValueField()
+        self.assertEqual(field.to_representation("a-value"), "a-value")
+        self.assertEqual(field.to_representation(12), 12)
+
+
 class TestExperimentVariantSerializer(TestCase):
 
     def test_serializer_outputs_expected_schema(self):
@@ -79,6 +97,7 @@ class TestExperimentSerializer(TestCase):
             "proposed_duration": experiment.proposed_duration,
             "short_description": experiment.short_description,
             "slug": experiment.slug,
+            "status": experiment.status,
             "start_date": JSTimestampField().to_representation(
                 experiment.start_date
             ),
@@ -93,3 +112,143 @@ class TestExperimentSerializer(TestCase):
             set(serialized.data.keys()), set(expected_data.keys())
         )
         self.assertEqual(serialized.data, expected_data)
+
+    def test_serializer_outputs_only_requested_fields(self):
+        experiment = ExperimentFactory.create_with_variants()
+        serialized = ExperimentSerializer(
+            experiment, field_names=["slug", "variants"]
+        )
+        self.assertEqual(
+            serialized.data,
+            {
+                "slug": experiment.slug,
+                "variants": [
+                    ExperimentVariantSerializer(variant).data
+                    for variant in experiment.variants.all()
+                ],
+            },
+        )
+
+    def test_setup_eager_loading_defers_unused_columns(self):
+        ExperimentFactory.create_with_variants()
+
+        queryset = ExperimentSerializer.setup_eager_loading(
+            Experiment.objects.all(), ["experiment_url", "population"]
+        )
+
+        with self.assertNumQueries(1):
+            experiment = queryset.get()
+            self.assertEqual(
+                experiment.get_deferred_fields(),
+                set(
+                    field.attname
+                    for field in Experiment._meta.concrete_fields
+                    if field.attname
+                    not in (
+                        "id",
+                        "slug",
+                        "population_percent",
+                        "firefox_channel",
+                        "firefox_version",
+                    )
+                ),
+            )
+            ExperimentSerializer(
+                experiment, field_names=["experiment_url", "population"]
+            ).data
+
+    def test_setup_eager_loading_prefetches_required_relations(self):
+        ExperimentFactory.create_with_status(Experiment.STATUS_LIVE)
+
+        queryset = ExperimentSerializer.setup_eager_loading(
+            Experiment.objects.all(), ExperimentSerializer.Meta.fields
+        )
+
+        with self.assertNumQueries(2):
+            ExperimentSerializer(queryset, many=True).data
+
+
+class TestExperimentValuesSerializer(TestCase):
+
+    def test_serializer_matches_experiment_serializer(self):
+        ExperimentFactory.create_with_status(Experiment.STATUS_LIVE)
+        ExperimentFactory.create_with_status(Experiment.STATUS_DRAFT)
+        experiment = ExperimentFactory.create(
+            proposed_start_date=None,
+            proposed_duration=None,
+            proposed_enrollment=None,
+        )
+        ExperimentVariantFactory.create(experiment=experiment, value=None)
+
+        queryset = Experiment.objects.order_by("id")
+        renderer = JSONRenderer()
+
+        with self.assertNumQueries(2):
+            data = ExperimentValuesSerializer(queryset).data
+
+        self.assertEqual(
+            renderer.render(data),
+            renderer.render(ExperimentSerializer(queryset, many=True).data),
+        )
+
+    def test_serializer_outputs_only_requested_fields(self):
+        ExperimentFactory.create_with_variants()
+        field_names = ["slug", "population"]
+
+        queryset = Experiment.objects.all()
+
+        with self.assertNumQueries(1):
+            data = ExperimentValuesSerializer(queryset, field_names).data
+
+        self.assertEqual(
+            data,
+            ExperimentSerializer(
+                queryset, many=True, field_names=field_names
+            ).data,
+        )
+
+    def test_iter_representations_yields_experiment_ids(self):
+        experiment = ExperimentFactory.create_with_variants()
+
+        [(experiment_id, data)] = ExperimentValuesSerializer(
+            Experiment.objects.all(), ["slug"]
+        ).iter_representations()
+
+        self.assertEqual(experiment_id, experiment.id)
+        self.assertEqual(data, {"slug": experiment.slug})
+
+
+class TestExperimentRecipeSerializer(TestCase):
+
+    def test_serializer_outputs_preference_experiment_recipe(self):
+        experiment = ExperimentFactory.create(
+            type=Experiment.TYPE_PREF,
+            pref_key="browser.test.enabled",
+            pref_type=Experiment.PREF_TYPE_BOOL,
+            pref_branch=Experiment.PREF_BRANCH_DEFAULT,
+        )
+        control = ExperimentVariantFactory.create(
+            experiment=experiment, ratio=2, value="false"
+        )
+        treatment = ExperimentVariantFactory.create(
+            experiment=experiment, ratio=1, value="true"
+        )
+
+        self.assertEqual(
+            ExperimentRecipeSerializer(experiment).data,
+            {
+                "action_name": "preference-experiment",
+                "name": experiment.name,
+                "arguments": {
+                    "slug": experiment.slug,
+                    "experimentDocumentUrl": experiment.experiment_url,
+                    "preferenceName": "browser.test.enabled",
+                    "preferenceType": Experiment.PREF_TYPE_BOOL,
+                    "preferenceBranchType": Experiment.PREF_BRANCH_DEFAULT,
+                    "branches": [
+                        {"slug": control.slug, "ratio": 2, "value": False},
+                        {"slug": treatment.slug, "ratio": 1, "value": True},
+                    ],
+                },
+            },
+        )
@@ -0,0 +1,169 @@
+import datetime
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TransactionTestCase
+from django.utils import timezone
+
+from experimenter.experiments.models import Experiment
+from experimenter.experiments.stats import (
+    EXPERIMENT_STATS_KEY,
+    get_experiment_stats,
+)
+from experimenter.experiments.tests.factories import (
+    ExperimentChangeLogFactory,
+    ExperimentFactory,
+)
+from experimenter.openidc.tests.factories import UserFactory
+from experimenter.projects.tests.factories import ProjectFactory
+
+
+class TestExperimentStats(TransactionTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_stats_count_experiments_by_each_column(self):
+        project = ProjectFactory.create(slug="project")
+        owner = UserFactory.create(email="owner@example.com")
+
+        for i in range(2):
+            ExperimentFactory.create(
+                status=Experiment.STATUS_DRAFT,
+                type=Experiment.TYPE_PREF,
+                firefox_channel=Experiment.CHANNEL_BETA,
+                firefox_version="57.0",
+                project=project,
+                owner=owner,
+            )
+
+        ExperimentFactory.create(
+            status=Experiment.STATUS_REVIEW,
+            type=Experiment.TYPE_ADDON,
+            firefox_channel=Experiment.CHANNEL_BETA,
+            firefox_version="58.0",
+            project=None,
+            owner=owner,
+        )
+
+        with self.assertNumQueries(2):
+            stats = get_experiment_stats()
+
+        self.assertEqual(stats["total"], 3)
+        self.assertEqual(
+            stats["status"],
+            [
+                {"status": Experiment.STATUS_DRAFT, "count": 2},
+                {"status": Experiment.STATUS_REVIEW, "count": 1},
+            ],
+        )
+        self.assertEqual(
+            stats["type"],
+            [
+                {"type": Experiment.TYPE_PREF, "count": 2},
+                {"type": Experiment.TYPE_ADDON, "count": 1},
+            ],
+        )
+        self.assertEqual(
+            stats["firefox_channel"],
+            [{"firefox_channel": Experiment.CHANNEL_BETA, "count": 3}],
+        )
+        self.assertEqual(
+            stats["firefox_version"],
+            [
+                {"firefox_version": "57.0", "count": 2},
+                {"firefox_version": "58.0", "count": 1},
+            ],
+        )
+        self.assertEqual(
+            stats["project"],
+            [
+                {"project": "project", "count": 2},
+                {"project": None, "count": 1},
+            ],
+        )
+        self.assertEqual(
+            stats["owner"], [{"owner": "owner@example.com", "count": 3}]
+        )
+
+    def test_stats_count_launched_and_completed_experiments_per_week(self):
+        monday = timezone.make_aware(datetime.datetime(2019, 1, 7, 12))
+
+        for days, old_status, new_status in (
+            (0, Experiment.STATUS_ACCEPTED, Experiment.STATUS_LIVE),
+            (3, Experiment.STATUS_ACCEPTED, Experiment.STATUS_LIVE),
+            (6, Experiment.STATUS_LIVE, Experiment.STATUS_COMPLETE),
+            (14, Experiment.STATUS_LIVE, Experiment.STATUS_COMPLETE),
+            (14, Experiment.STATUS_DRAFT, Experiment.STATUS_REVIEW),
+        ):
+            ExperimentChangeLogFactory.create(
+                old_status=old_status,
+                new_status=new_status,
+                changed_on=monday + datetime.timedelta(days=days),
+            )
+
+        self.assertEqual(
+            get_experiment_stats()["weekly"],
+            [
+                {"week": "2019-01-07", "launched": 2, "completed": 1},
+                {"week": "2019-01-21", "launched": 0, "completed": 1},
+            ],
+        )
+
+    def test_stats_are_cached_until_experiments_change(self):
+        experiment = ExperimentFactory.create(status=Experiment.STATUS_DRAFT)
+        self.assertEqual(get_experiment_stats()["total"], 1)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(get_experiment_stats()["total"], 1)
+
+        experiment.status = Experiment.STATUS_REVIEW
+        experiment.save()
+
+        self.assertEqual(
+            get_experiment_stats()["status"],
+            [{"status": Experiment.STATUS_REVIEW, "count": 1}],
+        )
+
+        ExperimentChangeLogFactory.create(
+            experiment=experiment,
+            old_status=Experiment.STATUS_ACCEPTED,
+            new_status=Experiment.STATUS_LIVE,
+        )
+
+        self.assertEqual(len(get_experiment_stats()["weekly"]), 1)
+
+    def test_stats_are_cached_until_owners_or_projects_change(self):
+        ExperimentFactory.create()
+        stats = get_experiment_stats()
+
+        for instance in (
+            Experiment.objects.get().owner,
+            Experiment.objects.get().project,
+        ):
+            instance.save()
+            self.assertIsNone(cache.get(EXPERIMENT_STATS_KEY))
+
+            self.assertEqual(get_experiment_stats(), stats)
+
+        UserFactory.create()
+        ProjectFactory.create()
+        self.assertEqual(cache.get(EXPERIMENT_STATS_KEY), stats)
+
+    def test_stats_are_invalidated_once_the_change_commits(self):
+        experiment = ExperimentFactory.create(status=Experiment.STATUS_DRAFT)
+        get_experiment_stats()
+
+        with transaction.atomic():
+            experiment.status = Experiment.STATUS_REVIEW
+            experiment.save()
+
+            # A concurrent request caches the stats as they were before the
+            # commit
+            cache.set(EXPERIMENT_STATS_KEY, {"stale": True})
+
+        self.assertEqual(
+            get_experiment_stats()["status"],
+            [{"status": Experiment.STATUS_REVIEW, "count": 1}],
+        )
@@ -0,0 +1,136 @@
+import mock
+import redis
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase
+from django.urls import resolve, reverse
+from rest_framework.request import Request
+
+from experimenter.experiments.api_views import ExperimentListView
+from experimenter.experiments.throttling import (
+    TOKEN_BUCKET_SCRIPT,
+    ClientTokenBucketThrottle,
+    EndpointTokenBucketThrottle,
+)
+from experimenter.openidc.tests.factories import UserFactory
+
+
+THROTTLE_RATES = {"client": "60/min", "experiments-api-list": "10/s"}
+
+
+@mock.patch.object(ClientTokenBucketThrottle, "THROTTLE_RATES", THROTTLE_RATES)
+@mock.patch.object(
+    EndpointTokenBucketThrottle, "THROTTLE_RATES", THROTTLE_RATES
+)
+class TestTokenBucketThrottle(TestCase):
+
+    def setUp(self):
+        super().setUp()
+        mock_get_redis_patcher = mock.patch(
+            "experimenter.experiments.throttling.get_redis"
+        )
+        self.mock_redis = mock_get_redis_patcher.start().return_value
+        self.addCleanup(mock_get_redis_patcher.stop)
+        self.mock_token_bucket = self.mock_redis.register_script.return_value
+
+    def get_request(self, path=None, user=None, **extra):
+        path = path or reverse("experiments-api-list")
+        extra.setdefault("REMOTE_ADDR", "10.0.0.1")
+        request = RequestFactory().get(path, **extra)
+        request.resolver_match = resolve(path)
+        request = Request(request)
+        request.user = user or AnonymousUser()
+        return request
+
+    def test_allows_request_with_token(self):
+        self.mock_token_bucket.return_value = [1, b"0"]
+        throttle = ClientTokenBucketThrottle()
+
+        with mock.patch.object(throttle, "timer", return_value=100.0):
+            self.assertTrue(throttle.allow_request(self.get_request(), None))
+
+        self.mock_redis.register_script.assert_called_once_with(
+            TOKEN_BUCKET_SCRIPT
+        )
+        self.mock_token_bucket.assert_called_once_with(
+            keys=["throttle:client:10.0.0.1"], args=[60, 1.0, 100.0]
+        )
+
+    def test_denies_request_without_token(self):
+        self.mock_token_bucket.return_value = [0, b"0.25"]
+        throttle = EndpointTokenBucketThrottle()
+
+        self.assertFalse(throttle.allow_request(self.get_request(), None))
+        self.assertEqual(throttle.wait(), 0.25)
+
+        keys = self.mock_token_bucket.call_args[1]["keys"]
+        self.assertEqual(keys, ["throttle:experiments-api-list:10.0.0.1"])
+
+    def test_ignores_forwarded_addresses_sent_by_clients(self):
+        self.mock_token_bucket.return_value = [1, b"0"]
+        throttle = ClientTokenBucketThrottle()
+
+        # The proxy at 172.17.0.2 appends the client's address to whatever
+        # X-Forwarded-For the client sent
+        for forwarded_for in (
+            "10.0.0.1",
+            "6.6.6.6, 10.0.0.1",
+            "7.7.7.7, 8.8.8.8, 10.0.0.1",
+        ):
+            throttle.allow_request(
+                self.get_request(
+                    REMOTE_ADDR="172.17.0.2",
+                    HTTP_X_FORWARDED_FOR=forwarded_for,
+                ),
+                None,
+            )
+
+            keys = self.mock_token_bucket.call_args[1]["keys"]
+            self.assertEqual(keys, ["throttle:client:10.0.0.1"])
+
+    def test_identifies_authenticated_users_by_id(self):
+        self.mock_token_bucket.return_value = [1, b"0"]
+        user = UserFactory.create()
+
+        ClientTokenBucketThrottle().allow_request(
+            self.get_request(user=user), None
+        )
+
+        keys = self.mock_token_bucket.call_args[1]["keys"]
+        self.assertEqual(
+            keys, ["throttle:client:user-{id}".format(id=user.id)]
+        )
+
+    def test_allows_endpoints_without_rate(self):
+        request = self.get_request(path=reverse("experiments-api-export"))
+
+        self.assertTrue(
+            EndpointTokenBucketThrottle().allow_request(request, None)
+        )
+        self.mock_redis.register_script.assert_not_called()
+
+    def test_allows_request_when_redis_fails(self):
+        self.mock_token_bucket.side_effect = redis.ConnectionError()
+
+        with mock.patch(
+            "experimenter.experiments.throttling.logging"
+        ) as mock_logging:
+            self.assertTrue(
+                ClientTokenBucketThrottle().allow_request(
+                    self.get_request(), None
+                )
+            )
+
+        mock_logging.exception.assert_called_once()
+
+    def test_throttled_request_returns_429_with_retry_after(self):
+        self.mock_token_bucket.return_value = [0, b"1.5"]
+
+        with mock.patch.object(
+            ExperimentListView,
+            "throttle_classes",
+            (EndpointTokenBucketThrottle,),
+        ):
+            response = self.client.get(reverse("experiments-api-list"))
+
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(response["Retry-After"], "2")
@@ -132,6 +132,19 @@ class TestExperimentFilterset(TestCase):
             set(Experiment.objects.filter(status=Experiment.STATUS_DRAFT)),
         )
 
+    def test_filters_by_readiness_to_launch(self):
+        ready = ExperimentFactory.create_with_status(
+            Experiment.STATUS_REVIEW,
+            **{field: True for field in Experiment.REQUIRED_REVIEW_FIELDS},
+        )
+        ExperimentFactory.create_with_status(Experiment.STATUS_REVIEW)
+
+        filter = ExperimentFilterset(
+            {"is_ready_to_launch": "true"}, queryset=Experiment.objects.all()
+        )
+
+        self.assertEqual(list(filter.qs), [ready])
+
     def test_filters_by_firefox_version(self):
         include_version = Experiment.VERSION_CHOICES[1][0]
         exclude_version = Experiment.VERSION_CHOICES[2][0]
@@ -174,6 +187,18 @@ class TestExperimentFilterset(TestCase):
             set(Experiment.objects.filter(firefox_channel=include_channel)),
         )
 
+    def test_filters_by_search_ranking_best_matches_first(self):
+        related = ExperimentFactory.create_with_variants(
+            related_work="Earlier quokka studies"
+        )
+        named = ExperimentFactory.create_with_variants(name="Quokka Study")
+        ExperimentFactory.create_with_variants()
+
+        filter = ExperimentFilterset(
+            {"search": "quokka"}, queryset=Experiment.objects.all()
+        )
+        self.assertEqual(list(filter.qs), [named, related])
+
 
 class TestExperimengOrderingForm(TestCase):
 
@@ -203,7 +228,7 @@ class TestExperimentListView(TestCase):
             )
 
         experiments = (
-            Experiment.objects.all()
+            Experiment.objects.for_list()
             .filter(archived=False)
             .order_by(ExperimentOrderingForm.ORDERING_CHOICES[0][0])
         )
@@ -245,7 +270,7 @@ class TestExperimentListView(TestCase):
     def test_list_view_filters_and_orders_experiments(self):
         user_email = "user@example.com"
 
-        ordering = "latest_change"
+        ordering = "last_changed_on"
         filtered_channel = Experiment.CHANNEL_CHOICES[1][0]
         filtered_owner = UserFactory.create()
         filtered_project = ProjectFactory.create()
@@ -266,13 +291,17 @@ class TestExperimentListView(TestCase):
                 random.choice(Experiment.STATUS_CHOICES)[0]
             )
 
-        filtered_ordered_experiments = Experiment.objects.filter(
-            firefox_channel=filtered_channel,
-            firefox_version=filtered_version,
-            owner=filtered_owner,
-            project=filtered_project,
-            status=filtered_status,
-        ).order_by(ordering)
+        filtered_ordered_experiments = (
+            Experiment.objects.for_list()
+            .filter(
+                firefox_channel=filtered_channel,
+                firefox_version=filtered_version,
+                owner=filtered_owner,
+                project=filtered_project,
+                status=filtered_status,
+            )
+            .order_by(ordering)
+        )
 
         response = self.client.get(
             "{url}?{params}".format(
@@ -0,0 +1,113 @@
+import logging
+
+import redis
+from rest_framework.throttling import SimpleRateThrottle
+
+from experimenter.experiments.events import get_redis
+
+
+# Refill the bucket in KEYS[1] for the time passed since it was last used
+# and take a token from it if there is one.  Returns whether a token was
+# taken and otherwise how many seconds it will take until there is one.
+TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+local bucket = redis.call("HMGET", KEYS[1], "tokens", "updated")
+local tokens = tonumber(bucket[1]) or capacity
+local updated = tonumber(bucket[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - updated) * refill_rate)
+
+local allowed = 0
+local wait = 0
+
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / refill_rate
+end
+
+redis.call("HMSET", KEYS[1], "tokens", tostring(tokens), "updated", ARGV[3])
+redis.call("EXPIRE", KEYS[1], math.ceil(capacity / refill_rate) + 1)
+
+return {allowed, tostring(wait)}
+"""
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Throttle requests with a token bucket per client kept in Redis.
+
+    A rate of "60/min" gives each client a bucket of 60 tokens which is
+    refilled at one token per second, so clients can burst up to the full
+    bucket.  The bucket is updated atomically by a Lua script so concurrent
+    requests across workers can't overdraw it.  Requests are allowed if
+    Redis is unavailable.
+    """
+
+    cache_format = "throttle:{scope}:{ident}"
+
+    def __init__(self):
+        self.wait_time = None
+
+    def get_scope(self, request, view):
+        return self.scope
+
+    def get_cache_key(self, request, view):
+        if request.user and request.user.is_authenticated:
+            ident = "user-{id}".format(id=request.user.pk)
+        else:
+            ident = self.get_ident(request)
+
+        return self.cache_format.format(scope=self.scope, ident=ident)
+
+    def allow_request(self, request, view):
+        self.scope = self.get_scope(request, view)
+        self.rate = self.THROTTLE_RATES.get(self.scope)
+
+        if self.rate is None:
+            return True
+
+        self.num_requests, self.duration = self.parse_rate(self.rate)
+
+        try:
+            token_bucket = get_redis().register_script(TOKEN_BUCKET_SCRIPT)
+            allowed, wait = token_bucket(
+                keys=[self.get_cache_key(request, view)],
+                args=[
+                    self.num_requests,
+                    self.num_requests / self.duration,
+                    self.timer(),
+                ],
+            )
+        except redis.RedisError:
+            logging.exception("Error throttling request")
+            return True
+
+        self.wait_time = float(wait)
+
+        return bool(allowed)
+
+    def wait(self):
+        return self.wait_time
+
+
+class ClientTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Limit the rate of all API requests made by each client.
+    """
+
+    scope = "client"
+
+
+class EndpointTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Limit the rate of requests made by each client to each endpoint which
+    has a rate configured under its url name.
+    """
+
+    def get_scope(self, request, view):
+        return request.resolver_match.url_name
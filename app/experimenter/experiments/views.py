@@ -64,6 +64,12 @@ class ExperimentFiltersetForm(forms.ModelForm):
 
 
 class ExperimentFilterset(filters.FilterSet):
+    search = filters.CharFilter(
+        method="filter_search",
+        widget=forms.TextInput(
+            attrs={"class": "form-control", "placeholder": "Search"}
+        ),
+    )
     type = filters.ChoiceFilter(
         empty_label="All Types",
         choices=Experiment.TYPE_CHOICES,
@@ -94,6 +100,16 @@ class ExperimentFilterset(filters.FilterSet):
         queryset=get_user_model().objects.all().order_by("email"),
         widget=forms.Select(attrs={"class": "form-control"}),
     )
+    is_ready_to_launch = filters.BooleanFilter(
+        widget=forms.Select(
+            choices=(
+                ("", "All Readiness"),
+                ("true", "Ready to Launch"),
+                ("false", "Not Ready to Launch"),
+            ),
+            attrs={"class": "form-control"},
+        )
+    )
     archived = filters.BooleanFilter(
         label="Show archived experiments", widget=forms.CheckboxInput()
     )
@@ -103,11 +119,14 @@ class ExperimentFilterset(filters.FilterSet):
         form = ExperimentFiltersetForm
         fields = ExperimentFiltersetForm.Meta.fields
 
+    def filter_search(self, queryset, name, value):
+        return queryset.search(value)
+
 
 class ExperimentOrderingForm(forms.Form):
     ORDERING_CHOICES = (
-        ("-latest_change", "Most Recently Updated"),
-        ("latest_change", "Least Recently Updated"),
+        ("-last_changed_on", "Most Recently Updated"),
+        ("last_changed_on", "Least Recently Updated"),
         ("firefox_version", "Firefox Version Ascending"),
         ("-firefox_version", "Firefox Version Descending"),
         ("firefox_channel", "Firefox Channel Ascending"),
@@ -124,6 +143,7 @@ class ExperimentListView(FilterView):
     context_object_name = "experiments"
     filterset_class = ExperimentFilterset
     model = Experiment
+    queryset = Experiment.objects.for_list()
     template_name = "experiments/list.html"
     paginate_by = 10
 
@@ -189,11 +209,13 @@ class ExperimentOverviewUpdateView(ExperimentFormMixin, UpdateView):
     form_class = ExperimentOverviewForm
     next_view_name = "experiments-variants-update"
     template_name = "experiments/edit_overview.html"
+    queryset = Experiment.objects.with_variants_summary()
 
 
 class ExperimentVariantsUpdateView(ExperimentFormMixin, UpdateView):
     next_view_name = "experiments-objectives-update"
     template_name = "experiments/edit_variants.html"
+    queryset = Experiment.objects.with_variants_summary()
 
     def get_form_class(self):
         if self.object.is_addon_study:
@@ -206,16 +228,19 @@ class ExperimentObjectivesUpdateView(ExperimentFormMixin, UpdateView):
     form_class = ExperimentObjectivesForm
     next_view_name = "experiments-risks-update"
     template_name = "experiments/edit_objectives.html"
+    queryset = Experiment.objects.with_variants_summary()
 
 
 class ExperimentRisksUpdateView(ExperimentFormMixin, UpdateView):
     form_class = ExperimentRisksForm
     next_view_name = "experiments-detail"
     template_name = "experiments/edit_risks.html"
+    queryset = Experiment.objects.with_variants_summary()
 
 
 class ExperimentDetailView(ExperimentFormMixin, ModelFormMixin, DetailView):
     model = Experiment
+    queryset = Experiment.objects.for_detail()
     form_class = ExperimentReviewForm
 
     def get_template_names(self):
@@ -0,0 +1,21 @@
+from channels.http import AsgiHandler
+from channels.routing import ProtocolTypeRouter, URLRouter
+from django.urls import re_path
+
+from experimenter.experiments.consumers import ExperimentEventsConsumer
+
+
+# The event stream is served natively by an async consumer, every other
+# view runs through Django in the ASGI server's thread pool
+application = ProtocolTypeRouter(
+    {
+        "http": URLRouter(
+            [
+                re_path(
+                    r"^api/v1/experiments/events/$", ExperimentEventsConsumer
+                ),
+                re_path(r"", AsgiHandler),
+            ]
+        )
+    }
+)
@@ -44,28 +44,31 @@ INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.staticfiles",
     "django.forms",
+    "channels",
     "corsheaders",
     "raven.contrib.django.raven_compat",
     "rest_framework",
     "djangoformsetjs",
     "jquery",
     "widget_tweaks",
-    "experimenter.experiments",
+    "experimenter.experiments.apps.ExperimentsConfig",
     "experimenter.notifications",
     "experimenter.openidc",
     "experimenter.projects",
 ]
 
 MIDDLEWARE = [
+    "experimenter.experiments.middleware.RequestTimingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "experimenter.experiments.middleware.APICompressionMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
-    "dockerflow.django.middleware.DockerflowMiddleware",
+    "experimenter.experiments.middleware.RequestSummaryMiddleware",
     "experimenter.openidc.middleware.OpenIDCAuthMiddleware",
 ]
 
@@ -91,6 +94,8 @@ FORM_RENDERER = "django.forms.renderers.TemplatesSetting"
 
 WSGI_APPLICATION = "experimenter.wsgi.application"
 
+ASGI_APPLICATION = "experimenter.routing.application"
+
 
 # Database
 # https://docs.djangoproject.com/en/1.9/ref/settings/#databases
@@ -124,7 +129,15 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 OPENIDC_EMAIL_HEADER = config("OPENIDC_HEADER")
-OPENIDC_AUTH_WHITELIST = ("experiments-api-list",)
+OPENIDC_AUTH_WHITELIST = (
+    "experiments-api-list",
+    "experiments-api-batch",
+    "experiments-api-export",
+    "experiments-api-changes",
+    "experiments-api-events",
+    "experiments-api-recipe",
+    "experiments-api-stats",
+)
 
 
 # Internationalization
@@ -197,15 +210,44 @@ RAVEN_CONFIG = {
 
 # Django Rest Framework Configuration
 REST_FRAMEWORK = {
-    "DEFAULT_RENDERER_CLASSES": ("rest_framework.renderers.JSONRenderer",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "rest_framework.renderers.JSONRenderer",
+        "experimenter.experiments.renderers.MessagePackRenderer",
+        "experimenter.experiments.renderers.NDJSONRenderer",
+    ),
     "DEFAULT_FILTER_BACKENDS": (
         "django_filters.rest_framework.DjangoFilterBackend",
     ),
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "experimenter.openidc.middleware.OpenIDCRestFrameworkAuthenticator",
     ),
+    # Anonymous clients are throttled by the address the proxies in front
+    # of the app appended to X-Forwarded-For, addresses sent by the client
+    # itself are ignored
+    "NUM_PROXIES": config("NUM_PROXIES", default=1, cast=int),
+    "DEFAULT_THROTTLE_CLASSES": (
+        "experimenter.experiments.throttling.ClientTokenBucketThrottle",
+        "experimenter.experiments.throttling.EndpointTokenBucketThrottle",
+    ),
+    # Rates are per client, client applies to every request and the
+    # others to the endpoint with that url name
+    "DEFAULT_THROTTLE_RATES": {
+        "client": "1200/min",
+        "experiments-api-list": "60/min",
+        "experiments-api-detail": "600/min",
+        "experiments-api-batch": "120/min",
+        "experiments-api-export": "10/min",
+        "experiments-api-import": "10/min",
+        "experiments-api-changes": "120/min",
+        "experiments-api-events": "12/min",
+        "experiments-api-stats": "60/min",
+    },
 }
 
+# Compression of API responses
+API_COMPRESSION_PATH = "/api/v1/"
+API_COMPRESSION_MIN_SIZE = 1024
+
 # CORS Security Header Config
 CORS_ORIGIN_ALLOW_ALL = True
 
@@ -252,3 +294,14 @@ REDIS_DB = config("REDIS_DB")
 CELERY_BROKER_URL = "redis://{host}:{port}/{db}".format(
     host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB
 )
+
+# Caches
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://{host}:{port}/{db}".format(
+            host=REDIS_HOST, port=REDIS_PORT, db=REDIS_DB
+        ),
+        "KEY_PREFIX": "experimenter",
+    }
+}
@@ -9,3 +9,9 @@ LOGGING = {
     "handlers": {},
     "loggers": {},
 }
+
+CACHES = {
+    "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+}
+
+REST_FRAMEWORK = dict(REST_FRAMEWORK, DEFAULT_THROTTLE_CLASSES=())